@@ -1,10 +1,518 @@
+import asyncio
+import collections
+import threading
 from abc import ABC, abstractmethod
-from typing import Final, Generic, List, TypeVar
-from DynArray import DynArray
+from typing import (
+    Callable,
+    Final,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
 
+# Хранилище элементов очереди с доступом к обоим концам.
+# Методы не проверяют предусловия: это делают очереди, которые
+# ведут статусы
+class DequeStorage(ABC, Generic[T]):
+
+    @abstractmethod
+    def push_back(self, value: T) -> None:
+        pass
+
+    @abstractmethod
+    def push_front(self, value: T) -> None:
+        pass
+
+    # Предусловие: хранилище не пусто
+    @abstractmethod
+    def pop_front(self) -> None:
+        pass
+
+    # Предусловие: хранилище не пусто
+    @abstractmethod
+    def pop_back(self) -> None:
+        pass
+
+    # Добавляет values в конец в исходном порядке
+    @abstractmethod
+    def extend_back(self, values: List[T]) -> None:
+        pass
+
+    # Добавляет values в начало, как последовательные push_front():
+    # последний элемент values оказывается первым
+    @abstractmethod
+    def extend_front(self, values: List[T]) -> None:
+        pass
+
+    # Предусловие: в хранилище не меньше count элементов
+    # Удаляет count первых элементов и возвращает их от первого
+    # к последнему
+    @abstractmethod
+    def pop_front_n(self, count: int) -> List[T]:
+        pass
+
+    # Предусловие: в хранилище не меньше count элементов
+    # Удаляет count последних элементов и возвращает их от последнего
+    # к первому
+    @abstractmethod
+    def pop_back_n(self, count: int) -> List[T]:
+        pass
+
+    # Предусловие: хранилище не пусто
+    @abstractmethod
+    def front(self) -> T:
+        pass
+
+    # Предусловие: хранилище не пусто
+    @abstractmethod
+    def back(self) -> T:
+        pass
+
+    # Предусловие: 0 <= index < длина
+    # Возвращает элемент с номером index, считая от первого
+    @abstractmethod
+    def get(self, index: int) -> T:
+        pass
+
+    # Возвращает все элементы от первого к последнему
+    @abstractmethod
+    def to_list(self) -> List[T]:
+        pass
+
+    # Обходит элементы от первого к последнему, не удаляя их.
+    # Изменение хранилища во время обхода - RuntimeError
+    @abstractmethod
+    def __iter__(self) -> Iterator[T]:
+        pass
+
+    # Обходит элементы от последнего к первому
+    @abstractmethod
+    def __reversed__(self) -> Iterator[T]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+# Кольцевой буфер с емкостью степени двойки.
+# Элементы лежат в ячейках head, head + 1, ... по модулю емкости,
+# поэтому добавление и удаление с обоих концов выполняется за O(1)
+class RingBuffer(DequeStorage[T]):
+
+    MIN_CAPACITY: Final[int] = 16
+
+    def __init__(self) -> None:
+        self._items: List[T | None] = [None] * self.MIN_CAPACITY
+        self._mask: int = self.MIN_CAPACITY - 1
+        self._head: int = 0
+        self._size: int = 0
+        # Счетчик изменений: итератор проверяет, что буфер не менялся
+        self._mutations: int = 0
+
+    def push_back(self, value: T) -> None:
+        if self._size > self._mask:
+            self._resize(2 * len(self._items))
+        self._items[(self._head + self._size) & self._mask] = value
+        self._size += 1
+        self._mutations += 1
+
+    def push_front(self, value: T) -> None:
+        if self._size > self._mask:
+            self._resize(2 * len(self._items))
+        self._head = (self._head - 1) & self._mask
+        self._items[self._head] = value
+        self._size += 1
+        self._mutations += 1
+
+    # Предусловие: буфер не пуст
+    def pop_front(self) -> None:
+        self._items[self._head] = None
+        self._head = (self._head + 1) & self._mask
+        self._size -= 1
+        self._mutations += 1
+        self._shrink()
+
+    # Предусловие: буфер не пуст
+    def pop_back(self) -> None:
+        self._items[(self._head + self._size - 1) & self._mask] = None
+        self._size -= 1
+        self._mutations += 1
+        self._shrink()
+
+    # Добавляет values в конец буфера в исходном порядке
+    def extend_back(self, values: List[T]) -> None:
+        self._reserve(self._size + len(values))
+        self._write(self._size, values)
+        self._size += len(values)
+        self._mutations += 1
+
+    # Добавляет values в начало буфера, как последовательные push_front():
+    # последний элемент values оказывается первым в буфере
+    def extend_front(self, values: List[T]) -> None:
+        self._reserve(self._size + len(values))
+        self._head = (self._head - len(values)) & self._mask
+        self._size += len(values)
+        self._mutations += 1
+        self._write(0, values[::-1])
+
+    # Предусловие: в буфере не меньше count элементов
+    # Удаляет count первых элементов и возвращает их от первого к последнему
+    def pop_front_n(self, count: int) -> List[T]:
+        values = self._read(0, count)
+        self._clear(0, count)
+        self._head = (self._head + count) & self._mask
+        self._size -= count
+        self._mutations += 1
+        self._shrink()
+        return values
+
+    # Предусловие: в буфере не меньше count элементов
+    # Удаляет count последних элементов и возвращает их от последнего
+    # к первому, как последовательные back() и pop_back()
+    def pop_back_n(self, count: int) -> List[T]:
+        start = self._size - count
+        values = self._read(start, count)
+        values.reverse()
+        self._clear(start, count)
+        self._size -= count
+        self._mutations += 1
+        self._shrink()
+        return values
+
+    # Предусловие: буфер не пуст
+    def front(self) -> T:
+        return self._items[self._head]
+
+    # Предусловие: буфер не пуст
+    def back(self) -> T:
+        return self._items[(self._head + self._size - 1) & self._mask]
+
+    def get(self, index: int) -> T:
+        return self._items[(self._head + index) & self._mask]
+
+    def to_list(self) -> List[T]:
+        return self._read(0, self._size)
+
+    def __iter__(self) -> Iterator[T]:
+        mutations = self._mutations
+        for index in range(self._size):
+            if self._mutations != mutations:
+                raise RuntimeError("Deque mutated during iteration")
+            yield self._items[(self._head + index) & self._mask]
+
+    def __reversed__(self) -> Iterator[T]:
+        mutations = self._mutations
+        for index in range(self._size - 1, -1, -1):
+            if self._mutations != mutations:
+                raise RuntimeError("Deque mutated during iteration")
+            yield self._items[(self._head + index) & self._mask]
+
+    def __len__(self) -> int:
+        return self._size
+
+    # Возвращает не более двух отрезков ячеек [start, stop), в которых
+    # лежат count элементов, начиная с элемента с номером index
+    def _spans(self, index: int, count: int) -> List[tuple]:
+        start = (self._head + index) & self._mask
+        first = min(count, len(self._items) - start)
+        if first == count:
+            return [(start, start + count)]
+        return [(start, start + first), (0, count - first)]
+
+    def _read(self, index: int, count: int) -> List[T]:
+        values: List[T] = []
+        for start, stop in self._spans(index, count):
+            values.extend(self._items[start:stop])
+        return values
+
+    def _write(self, index: int, values: List[T]) -> None:
+        offset = 0
+        for start, stop in self._spans(index, len(values)):
+            self._items[start:stop] = values[offset : offset + stop - start]
+            offset += stop - start
+
+    def _clear(self, index: int, count: int) -> None:
+        for start, stop in self._spans(index, count):
+            self._items[start:stop] = [None] * (stop - start)
+
+    # Увеличивает емкость, пока в буфер не поместится size элементов
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._items)
+        while capacity < size:
+            capacity *= 2
+        if capacity != len(self._items):
+            self._resize(capacity)
+
+    # Емкость уменьшается вдвое, пока буфер заполнен меньше чем на четверть
+    def _shrink(self) -> None:
+        capacity = len(self._items)
+        while capacity > self.MIN_CAPACITY and self._size < capacity // 4:
+            capacity //= 2
+        if capacity != len(self._items):
+            self._resize(capacity)
+
+    # Переносит элементы в новый список, начиная с ячейки 0
+    def _resize(self, new_capacity: int) -> None:
+        items = self._read(0, self._size)
+        items.extend([None] * (new_capacity - self._size))
+        self._items = items
+        self._mask = new_capacity - 1
+        self._head = 0
+
+
+class _Block:
+
+    __slots__ = ("items", "prev", "next")
+
+    def __init__(self, size: int) -> None:
+        self.items: list = [None] * size
+        self.prev: Optional[_Block] = None
+        self.next: Optional[_Block] = None
+
+
+# Двусвязный список блоков фиксированного размера, как в collections.deque.
+# Рост добавляет новый блок и не копирует элементы, поэтому у добавления
+# нет всплесков задержки при перевыделении; блок освобождается, как только
+# из него уходит последний элемент. Заняты ячейки от head первого блока
+# до tail (не включая) последнего.
+class BlockBuffer(DequeStorage[T]):
+
+    BLOCK_SIZE: Final[int] = 64
+
+    def __init__(self) -> None:
+        self._first: _Block = _Block(self.BLOCK_SIZE)
+        self._last: _Block = self._first
+        self._head: int = self.BLOCK_SIZE // 2
+        self._tail: int = self._head
+        self._size: int = 0
+        self._mutations: int = 0
+        # Блок последнего обращения get() и его номер от первого блока
+        self._finger: _Block = self._first
+        self._finger_number: int = 0
+        self._finger_mutations: int = -1
+
+    def push_back(self, value: T) -> None:
+        if self._tail == self.BLOCK_SIZE:
+            self._append_block()
+        self._last.items[self._tail] = value
+        self._tail += 1
+        self._size += 1
+        self._mutations += 1
+
+    def push_front(self, value: T) -> None:
+        if self._head == 0:
+            self._prepend_block()
+        self._head -= 1
+        self._first.items[self._head] = value
+        self._size += 1
+        self._mutations += 1
+
+    # Предусловие: буфер не пуст
+    def pop_front(self) -> None:
+        self._first.items[self._head] = None
+        self._head += 1
+        self._size -= 1
+        self._mutations += 1
+        self._release()
+
+    # Предусловие: буфер не пуст
+    def pop_back(self) -> None:
+        self._tail -= 1
+        self._last.items[self._tail] = None
+        self._size -= 1
+        self._mutations += 1
+        self._release()
+
+    def extend_back(self, values: List[T]) -> None:
+        offset = 0
+        while offset < len(values):
+            if self._tail == self.BLOCK_SIZE:
+                self._append_block()
+            count = min(self.BLOCK_SIZE - self._tail, len(values) - offset)
+            self._last.items[self._tail : self._tail + count] = values[
+                offset : offset + count
+            ]
+            self._tail += count
+            offset += count
+        self._size += len(values)
+        self._mutations += 1
+
+    def extend_front(self, values: List[T]) -> None:
+        # Блоки заполняются справа налево, последний элемент values
+        # становится первым
+        values = values[::-1]
+        remaining = len(values)
+        while remaining > 0:
+            if self._head == 0:
+                self._prepend_block()
+            count = min(self._head, remaining)
+            self._first.items[self._head - count : self._head] = values[
+                remaining - count : remaining
+            ]
+            self._head -= count
+            remaining -= count
+        self._size += len(values)
+        self._mutations += 1
+
+    # Предусловие: в буфере не меньше count элементов
+    def pop_front_n(self, count: int) -> List[T]:
+        values: List[T] = []
+        while count > 0:
+            stop = self._tail if self._first is self._last else self.BLOCK_SIZE
+            taken = min(count, stop - self._head)
+            items = self._first.items
+            values.extend(items[self._head : self._head + taken])
+            items[self._head : self._head + taken] = [None] * taken
+            self._head += taken
+            self._size -= taken
+            self._mutations += 1
+            count -= taken
+            self._release()
+        return values
+
+    # Предусловие: в буфере не меньше count элементов
+    def pop_back_n(self, count: int) -> List[T]:
+        values: List[T] = []
+        while count > 0:
+            start = self._head if self._first is self._last else 0
+            taken = min(count, self._tail - start)
+            items = self._last.items
+            chunk = items[self._tail - taken : self._tail]
+            chunk.reverse()
+            values.extend(chunk)
+            items[self._tail - taken : self._tail] = [None] * taken
+            self._tail -= taken
+            self._size -= taken
+            self._mutations += 1
+            count -= taken
+            self._release()
+        return values
+
+    # Предусловие: буфер не пуст
+    def front(self) -> T:
+        return self._first.items[self._head]
+
+    # Предусловие: буфер не пуст
+    def back(self) -> T:
+        return self._last.items[self._tail - 1]
+
+    def to_list(self) -> List[T]:
+        values: List[T] = []
+        block: Optional[_Block] = self._first
+        start = self._head
+        while block is not None:
+            stop = self._tail if block is self._last else self.BLOCK_SIZE
+            values.extend(block.items[start:stop])
+            block = block.next
+            start = 0
+        return values
+
+    # Идет по блокам от ближайшей известной точки: от концов или от
+    # блока прошлого обращения, если буфер с тех пор не менялся.
+    # Последовательный доступ по номерам - O(1), произвольный -
+    # O(n / BLOCK_SIZE)
+    def get(self, index: int) -> T:
+        position = self._head + index
+        number = position // self.BLOCK_SIZE
+        last = (self._head + self._size - 1) // self.BLOCK_SIZE
+        start, block = 0, self._first
+        if last - number < number:
+            start, block = last, self._last
+        if self._finger_mutations == self._mutations and abs(
+            self._finger_number - number
+        ) < abs(start - number):
+            start, block = self._finger_number, self._finger
+        while start < number:
+            block = block.next
+            start += 1
+        while start > number:
+            block = block.prev
+            start -= 1
+        self._finger = block
+        self._finger_number = number
+        self._finger_mutations = self._mutations
+        return block.items[position - number * self.BLOCK_SIZE]
+
+    def __iter__(self) -> Iterator[T]:
+        mutations = self._mutations
+        block = self._first
+        index = self._head
+        for _ in range(self._size):
+            if self._mutations != mutations:
+                raise RuntimeError("Deque mutated during iteration")
+            if index == self.BLOCK_SIZE:
+                block = block.next
+                index = 0
+            yield block.items[index]
+            index += 1
+
+    def __reversed__(self) -> Iterator[T]:
+        mutations = self._mutations
+        block = self._last
+        index = self._tail
+        for _ in range(self._size):
+            if self._mutations != mutations:
+                raise RuntimeError("Deque mutated during iteration")
+            if index == 0:
+                block = block.prev
+                index = self.BLOCK_SIZE
+            index -= 1
+            yield block.items[index]
+
+    # Возвращает число блоков в списке
+    def get_block_count(self) -> int:
+        count = 0
+        block: Optional[_Block] = self._first
+        while block is not None:
+            count += 1
+            block = block.next
+        return count
+
+    def __len__(self) -> int:
+        return self._size
+
+    # Вспомогательный код
+    def _append_block(self) -> None:
+        block = _Block(self.BLOCK_SIZE)
+        block.prev = self._last
+        self._last.next = block
+        self._last = block
+        self._tail = 0
+
+    def _prepend_block(self) -> None:
+        block = _Block(self.BLOCK_SIZE)
+        block.next = self._first
+        self._first.prev = block
+        self._first = block
+        self._head = self.BLOCK_SIZE
+
+    # Отцепляет опустевшие крайние блоки. Пустой буфер сводится к одному
+    # блоку с позицией в середине, чтобы рост в любую сторону не требовал
+    # нового блока сразу
+    def _release(self) -> None:
+        if self._size == 0:
+            self._last = self._first
+            self._first.next = None
+            self._head = self._tail = self.BLOCK_SIZE // 2
+            return
+        if self._head == self.BLOCK_SIZE:
+            self._first = self._first.next
+            self._first.prev = None
+            self._head = 0
+        if self._tail == 0:
+            self._last = self._last.prev
+            self._last.next = None
+            self._tail = self.BLOCK_SIZE
+
+
 class ParentQueue(Generic[T]):
 
     GET_HEAD_NIL: Final[int] = 0  # get_head() не выполнялась
@@ -17,37 +525,84 @@ class ParentQueue(Generic[T]):
         2  # remove_head() ошибка выполнения над пустым списком
     )
 
-    # Постусловие: создана пустая очередь
-    def __init__(self) -> None:
-        self._array = DynArray()
+    PEEK_AT_NIL: Final[int] = 0  # peek_at() не выполнялась
+    PEEK_AT_OK: Final[int] = 1  # peek_at() завершилась успешно
+    PEEK_AT_ERR_INDEX: Final[int] = 2  # peek_at() индекс вне очереди
+
+    REMOVE_HEAD_N_NIL: Final[int] = 0  # remove_head_n() не выполнялась
+    REMOVE_HEAD_N_OK: Final[int] = 1  # remove_head_n() завершилась успешно
+    REMOVE_HEAD_N_ERR_COUNT: Final[int] = (
+        2  # remove_head_n() в очереди меньше n элементов или n < 0
+    )
+
+    # Постусловие: создана пустая очередь, элементы которой хранит
+    # storage: RingBuffer или BlockBuffer для очередей на миллионы
+    # элементов без копирования при росте
+    def __init__(self, storage: Type[DequeStorage] = RingBuffer) -> None:
+        self._buffer: DequeStorage[T] = storage()
         self._get_head_status: int = self.GET_HEAD_NIL
         self._remove_head_status: int = self.REMOVE_HEAD_NIL
+        self._remove_head_n_status: int = self.REMOVE_HEAD_N_NIL
+        self._peek_at_status: int = self.PEEK_AT_NIL
 
     # Команды
     # Постусловие: добавляет элемент со значением value в хвост очереди
-    def add_tail(self, value) -> None:
-        self._array.append(value)
+    def add_tail(self, value: T) -> None:
+        self._buffer.push_back(value)
+
+    # Постусловие: в хвост очереди в исходном порядке добавлены
+    # все элементы values
+    def add_tail_many(self, values: Iterable[T]) -> None:
+        self._buffer.extend_back(list(values))
 
     # Предусловие: очередь не пуста
     # Постусловие: из очереди удален головной элемент
     def remove_head(self) -> None:
-        if len(self._array) == 0:
+        if len(self._buffer) == 0:
             self._remove_head_status = self.REMOVE_HEAD_EMPTY
             raise IndexError("Index is out of bounds")
         self._remove_head_status = self.REMOVE_HEAD_OK
-        self._array.remove(0)
+        self._buffer.pop_front()
+
+    # Предусловие: в очереди не меньше n элементов
+    # Постусловие: из очереди удалены n головных элементов
+    # Возвращает удаленные элементы от головы к хвосту
+    def remove_head_n(self, n: int) -> List[T]:
+        if n < 0 or n > len(self._buffer):
+            self._remove_head_n_status = self.REMOVE_HEAD_N_ERR_COUNT
+            raise IndexError("Not enough elements in queue")
+        self._remove_head_n_status = self.REMOVE_HEAD_N_OK
+        return self._buffer.pop_front_n(n)
 
     # Запросы
     # Предусловие: очередь не пуста
     def get_head(self) -> T:  # Возвращает значение в голове
-        if len(self._array) == 0:
+        if len(self._buffer) == 0:
             self._get_head_status = self.GET_HEAD_EMPTY
             raise IndexError("Index is out of bounds")
         self._get_head_status = self.GET_HEAD_OK
-        return self._array[0]
+        return self._buffer.front()
+
+    # Предусловие: 0 <= i < size()
+    # Возвращает i-й элемент, считая от головы, не изменяя очередь
+    def peek_at(self, i: int) -> T:
+        if not 0 <= i < len(self._buffer):
+            self._peek_at_status = self.PEEK_AT_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self._peek_at_status = self.PEEK_AT_OK
+        return self._buffer.get(i)
+
+    # Обходит элементы от головы к хвосту, не изменяя очередь.
+    # Изменение очереди во время обхода - RuntimeError
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._buffer)
+
+    # Обходит элементы от хвоста к голове
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._buffer)
 
     def size(self) -> int:  # Возвращает размер очереди
-        return len(self._array)
+        return len(self._buffer)
 
     # Запросы статусов
     # Возвращает значение REMOVE_HEAD_*
@@ -58,6 +613,14 @@ class ParentQueue(Generic[T]):
     def get_get_head_status(self) -> int:
         return self._get_head_status
 
+    # Возвращает значение REMOVE_HEAD_N_*
+    def get_remove_head_n_status(self) -> int:
+        return self._remove_head_n_status
+
+    # Возвращает значение PEEK_AT_*
+    def get_peek_at_status(self) -> int:
+        return self._peek_at_status
+
 
 class Deque(ParentQueue, Generic[T]):
 
@@ -69,33 +632,54 @@ class Deque(ParentQueue, Generic[T]):
     GET_TAIL_NIL: Final[int] = 0  # get_tail() не выполнялась
     GET_TAIL_OK: Final[int] = 1  # get_tail() завершилась успешно
     GET_TAIL_EMPTY: Final[int] = 2  # get_tail() ошибка выполнения над пустым списком
+    REMOVE_TAIL_N_NIL: Final[int] = 0  # remove_tail_n() не выполнялась
+    REMOVE_TAIL_N_OK: Final[int] = 1  # remove_tail_n() завершилась успешно
+    REMOVE_TAIL_N_ERR_COUNT: Final[int] = (
+        2  # remove_tail_n() в очереди меньше n элементов или n < 0
+    )
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, storage: Type[DequeStorage] = RingBuffer) -> None:
+        super().__init__(storage)
         self._remove_tail_status: int = self.REMOVE_TAIL_NIL
         self._get_tail_status: int = self.GET_TAIL_NIL
+        self._remove_tail_n_status: int = self.REMOVE_TAIL_N_NIL
 
     # Команды
     def add_head(self, value: T) -> None:
-        self._array.insert(0, value)
+        self._buffer.push_front(value)
+
+    # Постусловие: элементы values добавлены в голову очереди, как
+    # последовательными add_head(): последний элемент values - голова
+    def add_head_many(self, values: Iterable[T]) -> None:
+        self._buffer.extend_front(list(values))
 
     # Предусловие: очередь не пуста
     # Постусловие: из очереди удален хвостовой элемент
     def remove_tail(self) -> None:
-        if len(self._array) == 0:
+        if len(self._buffer) == 0:
             self._remove_tail_status = self.REMOVE_TAIL_EMPTY
             raise IndexError("Index is out of bounds")
-        self._array.remove(len(self._array) - 1)
+        self._buffer.pop_back()
         self._remove_tail_status = self.REMOVE_TAIL_OK
 
+    # Предусловие: в очереди не меньше n элементов
+    # Постусловие: из очереди удалены n хвостовых элементов
+    # Возвращает удаленные элементы от хвоста к голове
+    def remove_tail_n(self, n: int) -> List[T]:
+        if n < 0 or n > len(self._buffer):
+            self._remove_tail_n_status = self.REMOVE_TAIL_N_ERR_COUNT
+            raise IndexError("Not enough elements in queue")
+        self._remove_tail_n_status = self.REMOVE_TAIL_N_OK
+        return self._buffer.pop_back_n(n)
+
     # Запросы
     # Предусловие: очередь не пуста
     def get_tail(self) -> T:  # Возвращает занчение в хвосте
-        if len(self._array) == 0:
+        if len(self._buffer) == 0:
             self._get_tail_status = self.GET_TAIL_EMPTY
             raise IndexError("Index is out of bounds")
         self._get_tail_status = self.GET_TAIL_OK
-        return self._array[len(self._array) - 1]
+        return self._buffer.back()
 
     # Запросы статусов
     # Возвращает значение REMOVE_TAIL_*
@@ -105,3 +689,612 @@ class Deque(ParentQueue, Generic[T]):
     # Возвращает значение GET_TAIL_*
     def get_get_tail_status(self) -> int:
         return self._get_tail_status
+
+    # Возвращает значение REMOVE_TAIL_N_*
+    def get_remove_tail_n_status(self) -> int:
+        return self._remove_tail_n_status
+
+
+# Двусторонняя очередь скользящего окна с агрегатами за O(1).
+# Каждому элементу присваивается порядковый номер: add_tail() выдает
+# номера по возрастанию, add_head() - по убыванию, поэтому номера
+# элементов окна идут подряд от _first до _last - 1. Вспомогательные
+# монотонные очереди хранят пары (номер, значение) кандидатов в минимум
+# и максимум: значение меньше (больше) всех более новых элементов.
+# Новый элемент в хвосте вытесняет кандидатов с конца, уход головы
+# снимает кандидатов с начала - амортизированно O(1). Удаление из хвоста
+# возвращает кандидатов, вытесненных удаленным элементом, поэтому
+# remove_tail() перестраивает вспомогательные очереди за O(n).
+class WindowDeque(Deque, Generic[T]):
+
+    WINDOW_MIN_NIL: Final[int] = 0  # window_min() не выполнялась
+    WINDOW_MIN_OK: Final[int] = 1  # window_min() завершилась успешно
+    WINDOW_MIN_EMPTY: Final[int] = 2  # window_min() окно пусто
+    WINDOW_MAX_NIL: Final[int] = 0  # window_max() не выполнялась
+    WINDOW_MAX_OK: Final[int] = 1  # window_max() завершилась успешно
+    WINDOW_MAX_EMPTY: Final[int] = 2  # window_max() окно пусто
+    WINDOW_MEAN_NIL: Final[int] = 0  # window_mean() не выполнялась
+    WINDOW_MEAN_OK: Final[int] = 1  # window_mean() завершилась успешно
+    WINDOW_MEAN_EMPTY: Final[int] = 2  # window_mean() окно пусто
+
+    def __init__(self, storage: Type[DequeStorage] = RingBuffer) -> None:
+        super().__init__(storage)
+        self._first: int = 0
+        self._last: int = 0
+        self._minimums: collections.deque = collections.deque()
+        self._maximums: collections.deque = collections.deque()
+        self._sum = 0
+        self._window_min_status: int = self.WINDOW_MIN_NIL
+        self._window_max_status: int = self.WINDOW_MAX_NIL
+        self._window_mean_status: int = self.WINDOW_MEAN_NIL
+
+    # Команды
+    def add_tail(self, value: T) -> None:
+        super().add_tail(value)
+        self._push_back(value)
+
+    def add_tail_many(self, values: Iterable[T]) -> None:
+        items = list(values)
+        super().add_tail_many(items)
+        for value in items:
+            self._push_back(value)
+
+    def add_head(self, value: T) -> None:
+        super().add_head(value)
+        self._push_front(value)
+
+    def add_head_many(self, values: Iterable[T]) -> None:
+        items = list(values)
+        super().add_head_many(items)
+        for value in items:
+            self._push_front(value)
+
+    def remove_head(self) -> None:
+        if self.size() > 0:
+            self._sum -= self._buffer.front()
+        super().remove_head()
+        self._first += 1
+        self._drop_front()
+
+    def remove_head_n(self, n: int) -> List[T]:
+        values = super().remove_head_n(n)
+        self._sum -= sum(values)
+        self._first += n
+        self._drop_front()
+        return values
+
+    def remove_tail(self) -> None:
+        super().remove_tail()
+        self._rebuild()
+
+    def remove_tail_n(self, n: int) -> List[T]:
+        values = super().remove_tail_n(n)
+        self._rebuild()
+        return values
+
+    # Запросы
+    # Предусловие: окно не пусто
+    def window_min(self) -> T:  # Возвращает минимум окна
+        if self.size() == 0:
+            self._window_min_status = self.WINDOW_MIN_EMPTY
+            raise IndexError("Window is empty")
+        self._window_min_status = self.WINDOW_MIN_OK
+        return self._minimums[0][1]
+
+    # Предусловие: окно не пусто
+    def window_max(self) -> T:  # Возвращает максимум окна
+        if self.size() == 0:
+            self._window_max_status = self.WINDOW_MAX_EMPTY
+            raise IndexError("Window is empty")
+        self._window_max_status = self.WINDOW_MAX_OK
+        return self._maximums[0][1]
+
+    def window_sum(self):  # Возвращает сумму окна, для пустого - 0
+        return self._sum
+
+    # Предусловие: окно не пусто
+    def window_mean(self) -> float:  # Возвращает среднее окна
+        if self.size() == 0:
+            self._window_mean_status = self.WINDOW_MEAN_EMPTY
+            raise IndexError("Window is empty")
+        self._window_mean_status = self.WINDOW_MEAN_OK
+        return self._sum / self.size()
+
+    # Запросы статусов
+    # Возвращает значение WINDOW_MIN_*
+    def get_window_min_status(self) -> int:
+        return self._window_min_status
+
+    # Возвращает значение WINDOW_MAX_*
+    def get_window_max_status(self) -> int:
+        return self._window_max_status
+
+    # Возвращает значение WINDOW_MEAN_*
+    def get_window_mean_status(self) -> int:
+        return self._window_mean_status
+
+    # Вспомогательный код
+    def _push_back(self, value: T) -> None:
+        self._sum += value
+        while self._minimums and self._minimums[-1][1] >= value:
+            self._minimums.pop()
+        self._minimums.append((self._last, value))
+        while self._maximums and self._maximums[-1][1] <= value:
+            self._maximums.pop()
+        self._maximums.append((self._last, value))
+        self._last += 1
+
+    # Новый головной элемент старше всех: он кандидат, только если
+    # строго лучше текущего экстремума окна
+    def _push_front(self, value: T) -> None:
+        self._sum += value
+        self._first -= 1
+        if not self._minimums or value < self._minimums[0][1]:
+            self._minimums.appendleft((self._first, value))
+        if not self._maximums or value > self._maximums[0][1]:
+            self._maximums.appendleft((self._first, value))
+
+    # Снимает кандидатов, ушедших из окна через голову
+    def _drop_front(self) -> None:
+        while self._minimums and self._minimums[0][0] < self._first:
+            self._minimums.popleft()
+        while self._maximums and self._maximums[0][0] < self._first:
+            self._maximums.popleft()
+
+    # Заново заполняет вспомогательные очереди и сумму по текущему окну
+    def _rebuild(self) -> None:
+        self._minimums.clear()
+        self._maximums.clear()
+        self._last = self._first
+        self._sum = 0
+        for value in self._buffer.to_list():
+            self._push_back(value)
+
+
+# Потокобезопасная двусторонняя очередь для схем производитель/потребитель.
+# Голова и хвост кольцевого буфера делят общие размер и емкость, поэтому
+# все операции выполняются под одной блокировкой; ожидание пустой или
+# заполненной очереди идет на условиях not_empty/not_full без опроса.
+# timeout=0 - не ждать, None - ждать без ограничения, иначе ждать не
+# дольше timeout секунд. Статусы отражают последний вызов из любого потока.
+class ConcurrentDeque(Deque, Generic[T]):
+
+    ADD_HEAD_NIL: Final[int] = 0  # add_head() не выполнялась
+    ADD_HEAD_OK: Final[int] = 1  # add_head() завершилась успешно
+    ADD_HEAD_ERR_FULL: Final[int] = 2  # add_head() очередь заполнена
+    ADD_TAIL_NIL: Final[int] = 0  # add_tail() не выполнялась
+    ADD_TAIL_OK: Final[int] = 1  # add_tail() завершилась успешно
+    ADD_TAIL_ERR_FULL: Final[int] = 2  # add_tail() очередь заполнена
+    POP_HEAD_NIL: Final[int] = 0  # pop_head() не выполнялась
+    POP_HEAD_OK: Final[int] = 1  # pop_head() завершилась успешно
+    POP_HEAD_EMPTY: Final[int] = 2  # pop_head() очередь пуста
+    POP_TAIL_NIL: Final[int] = 0  # pop_tail() не выполнялась
+    POP_TAIL_OK: Final[int] = 1  # pop_tail() завершилась успешно
+    POP_TAIL_EMPTY: Final[int] = 2  # pop_tail() очередь пуста
+
+    # Предусловие: max_size >= 0
+    # Постусловие: создана пустая очередь, вмещающая не более max_size
+    # элементов; max_size = 0 - без ограничения
+    def __init__(
+        self, max_size: int = 0, storage: Type[DequeStorage] = RingBuffer
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must be non-negative")
+        super().__init__(storage)
+        self._max_size: int = max_size
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # Число потоков, ждущих на not_empty/not_full, и среди них
+        # ждущих без удаления элемента и ждущих места под пакет
+        self._item_waiters: int = 0
+        self._space_waiters: int = 0
+        self._peek_waiters: int = 0
+        self._batch_waiters: int = 0
+        self._add_head_status: int = self.ADD_HEAD_NIL
+        self._add_tail_status: int = self.ADD_TAIL_NIL
+        self._pop_head_status: int = self.POP_HEAD_NIL
+        self._pop_tail_status: int = self.POP_TAIL_NIL
+
+    # Команды
+    # Предусловие: в очереди есть место (ждет его не дольше timeout)
+    # Постусловие: добавляет элемент со значением value в голову очереди
+    def add_head(self, value: T, timeout: Optional[float] = 0) -> None:
+        with self._not_full:
+            if not self._wait_space(1, timeout):
+                self._add_head_status = self.ADD_HEAD_ERR_FULL
+                return
+            super().add_head(value)
+            self._add_head_status = self.ADD_HEAD_OK
+            self._signal_items(1)
+
+    # Предусловие: в очереди есть место (ждет его не дольше timeout)
+    # Постусловие: добавляет элемент со значением value в хвост очереди
+    def add_tail(self, value: T, timeout: Optional[float] = 0) -> None:
+        with self._not_full:
+            if not self._wait_space(1, timeout):
+                self._add_tail_status = self.ADD_TAIL_ERR_FULL
+                return
+            super().add_tail(value)
+            self._add_tail_status = self.ADD_TAIL_OK
+            self._signal_items(1)
+
+    # Предусловие: в очереди есть место под все values (ждет его не
+    # дольше timeout); статус ADD_HEAD_*
+    # Постусловие: values добавлены в голову целиком либо не добавлены
+    def add_head_many(
+        self, values: Iterable[T], timeout: Optional[float] = 0
+    ) -> None:
+        items = list(values)
+        with self._not_full:
+            if not self._wait_space(len(items), timeout):
+                self._add_head_status = self.ADD_HEAD_ERR_FULL
+                return
+            super().add_head_many(items)
+            self._add_head_status = self.ADD_HEAD_OK
+            self._signal_items(len(items))
+
+    # Предусловие: в очереди есть место под все values (ждет его не
+    # дольше timeout); статус ADD_TAIL_*
+    # Постусловие: values добавлены в хвост целиком либо не добавлены
+    def add_tail_many(
+        self, values: Iterable[T], timeout: Optional[float] = 0
+    ) -> None:
+        items = list(values)
+        with self._not_full:
+            if not self._wait_space(len(items), timeout):
+                self._add_tail_status = self.ADD_TAIL_ERR_FULL
+                return
+            super().add_tail_many(items)
+            self._add_tail_status = self.ADD_TAIL_OK
+            self._signal_items(len(items))
+
+    # Предусловие: очередь не пуста (ждет элемент не дольше timeout)
+    # Постусловие: из очереди удален головной элемент
+    def remove_head(self, timeout: Optional[float] = 0) -> None:
+        with self._not_empty:
+            self._wait_items(timeout)
+            super().remove_head()
+            self._signal_space(1)
+
+    # Предусловие: очередь не пуста (ждет элемент не дольше timeout)
+    # Постусловие: из очереди удален хвостовой элемент
+    def remove_tail(self, timeout: Optional[float] = 0) -> None:
+        with self._not_empty:
+            self._wait_items(timeout)
+            super().remove_tail()
+            self._signal_space(1)
+
+    # Предусловие: в очереди не меньше n элементов
+    # Постусловие: из очереди удалены n головных элементов
+    # Возвращает удаленные элементы от головы к хвосту
+    def remove_head_n(self, n: int) -> List[T]:
+        with self._lock:
+            values = super().remove_head_n(n)
+            self._signal_space(n)
+            return values
+
+    # Предусловие: в очереди не меньше n элементов
+    # Постусловие: из очереди удалены n хвостовых элементов
+    # Возвращает удаленные элементы от хвоста к голове
+    def remove_tail_n(self, n: int) -> List[T]:
+        with self._lock:
+            values = super().remove_tail_n(n)
+            self._signal_space(n)
+            return values
+
+    # Предусловие: очередь не пуста (ждет элемент не дольше timeout)
+    # Постусловие: из очереди удален головной элемент
+    # Возвращает удаленное значение; в отличие от пары get_head() и
+    # remove_head() другой поток не может вклиниться между ними
+    def pop_head(self, timeout: Optional[float] = 0) -> T:
+        with self._not_empty:
+            if not self._wait_items(timeout):
+                self._pop_head_status = self.POP_HEAD_EMPTY
+                raise IndexError("Index is out of bounds")
+            value = self._buffer.front()
+            self._buffer.pop_front()
+            self._pop_head_status = self.POP_HEAD_OK
+            self._signal_space(1)
+            return value
+
+    # Предусловие: очередь не пуста (ждет элемент не дольше timeout)
+    # Постусловие: из очереди удален хвостовой элемент
+    # Возвращает удаленное значение
+    def pop_tail(self, timeout: Optional[float] = 0) -> T:
+        with self._not_empty:
+            if not self._wait_items(timeout):
+                self._pop_tail_status = self.POP_TAIL_EMPTY
+                raise IndexError("Index is out of bounds")
+            value = self._buffer.back()
+            self._buffer.pop_back()
+            self._pop_tail_status = self.POP_TAIL_OK
+            self._signal_space(1)
+            return value
+
+    # Запросы
+    # Предусловие: очередь не пуста (ждет элемент не дольше timeout)
+    def get_head(self, timeout: Optional[float] = 0) -> T:
+        with self._not_empty:
+            self._wait_items(timeout, peek=True)
+            return super().get_head()
+
+    # Предусловие: очередь не пуста (ждет элемент не дольше timeout)
+    def get_tail(self, timeout: Optional[float] = 0) -> T:
+        with self._not_empty:
+            self._wait_items(timeout, peek=True)
+            return super().get_tail()
+
+    # Предусловие: 0 <= i < size()
+    # Возвращает i-й элемент, считая от головы
+    def peek_at(self, i: int) -> T:
+        with self._lock:
+            return super().peek_at(i)
+
+    # Обходит снимок очереди, сделанный под блокировкой: другие потоки
+    # могут менять очередь во время обхода
+    def __iter__(self) -> Iterator[T]:
+        with self._lock:
+            return iter(self._buffer.to_list())
+
+    def __reversed__(self) -> Iterator[T]:
+        with self._lock:
+            values = self._buffer.to_list()
+        values.reverse()
+        return iter(values)
+
+    # Возвращает максимальный размер очереди, 0 - без ограничения
+    def get_max_size(self) -> int:
+        return self._max_size
+
+    # Запросы статусов
+    # Возвращает значение ADD_HEAD_*
+    def get_add_head_status(self) -> int:
+        return self._add_head_status
+
+    # Возвращает значение ADD_TAIL_*
+    def get_add_tail_status(self) -> int:
+        return self._add_tail_status
+
+    # Возвращает значение POP_HEAD_*
+    def get_pop_head_status(self) -> int:
+        return self._pop_head_status
+
+    # Возвращает значение POP_TAIL_*
+    def get_pop_tail_status(self) -> int:
+        return self._pop_tail_status
+
+    # Вспомогательный код
+    # Методы ниже вызываются под блокировкой.
+    # notify() будит произвольного ждущего. Если среди ждущих есть те, кто
+    # проснувшись не заберет элемент (get_*) или место (пакет, которому
+    # его не хватило), уведомление может достаться им и потеряться для
+    # остальных, поэтому в этом случае будятся все
+
+    # Ждет, пока очередь станет непустой; peek - ждущий не удаляет элемент
+    def _wait_items(
+        self, timeout: Optional[float], peek: bool = False
+    ) -> bool:
+        if len(self._buffer) > 0:
+            return True
+        self._item_waiters += 1
+        self._peek_waiters += peek
+        try:
+            return self._not_empty.wait_for(self.size, timeout)
+        finally:
+            self._item_waiters -= 1
+            self._peek_waiters -= peek
+
+    # Ждет, пока в очереди освободится место под count элементов.
+    # Пакет больше max_size не поместится никогда
+    def _wait_space(self, count: int, timeout: Optional[float]) -> bool:
+        if self._max_size == 0:
+            return True
+        if self._max_size - len(self._buffer) >= count:
+            return True
+        if count > self._max_size:
+            return False
+        self._space_waiters += 1
+        self._batch_waiters += count > 1
+        try:
+            return self._not_full.wait_for(
+                lambda: self._max_size - len(self._buffer) >= count, timeout
+            )
+        finally:
+            self._space_waiters -= 1
+            self._batch_waiters -= count > 1
+
+    # Сообщает ждущим о count новых элементах
+    def _signal_items(self, count: int) -> None:
+        if self._item_waiters == 0:
+            return
+        if self._peek_waiters:
+            self._not_empty.notify_all()
+        else:
+            self._not_empty.notify(count)
+
+    # Сообщает ждущим о count освободившихся местах
+    def _signal_space(self, count: int) -> None:
+        if self._space_waiters == 0:
+            return
+        if self._batch_waiters:
+            self._not_full.notify_all()
+        else:
+            self._not_full.notify(count)
+
+
+# Двусторонняя очередь для asyncio. Корутины, которым нужен элемент или
+# свободное место, ждут на своих future и будятся сразу при изменении
+# очереди, без опроса size(). Статусы те же, что у Deque; ожидающий
+# вызов завершается только при наличии элемента, поэтому статусы *_EMPTY
+# не возникают. Ограничить время ожидания - asyncio.wait_for(); отмена
+# ожидающего вызова не меняет очередь.
+class AsyncDeque(Generic[T]):
+
+    GET_HEAD_NIL: Final[int] = Deque.GET_HEAD_NIL
+    GET_HEAD_OK: Final[int] = Deque.GET_HEAD_OK
+    GET_HEAD_EMPTY: Final[int] = Deque.GET_HEAD_EMPTY
+    REMOVE_HEAD_NIL: Final[int] = Deque.REMOVE_HEAD_NIL
+    REMOVE_HEAD_OK: Final[int] = Deque.REMOVE_HEAD_OK
+    REMOVE_HEAD_EMPTY: Final[int] = Deque.REMOVE_HEAD_EMPTY
+    GET_TAIL_NIL: Final[int] = Deque.GET_TAIL_NIL
+    GET_TAIL_OK: Final[int] = Deque.GET_TAIL_OK
+    GET_TAIL_EMPTY: Final[int] = Deque.GET_TAIL_EMPTY
+    REMOVE_TAIL_NIL: Final[int] = Deque.REMOVE_TAIL_NIL
+    REMOVE_TAIL_OK: Final[int] = Deque.REMOVE_TAIL_OK
+    REMOVE_TAIL_EMPTY: Final[int] = Deque.REMOVE_TAIL_EMPTY
+    PEEK_AT_NIL: Final[int] = Deque.PEEK_AT_NIL
+    PEEK_AT_OK: Final[int] = Deque.PEEK_AT_OK
+    PEEK_AT_ERR_INDEX: Final[int] = Deque.PEEK_AT_ERR_INDEX
+
+    # Предусловие: max_size >= 0
+    # Постусловие: создана пустая очередь, вмещающая не более max_size
+    # элементов; max_size = 0 - без ограничения
+    def __init__(
+        self, max_size: int = 0, storage: Type[DequeStorage] = RingBuffer
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("max_size must be non-negative")
+        self._deque: Deque[T] = Deque(storage)
+        self._max_size: int = max_size
+        self._getters: collections.deque = collections.deque()
+        self._putters: collections.deque = collections.deque()
+
+    # Команды
+    # Постусловие: добавляет элемент со значением value в голову очереди,
+    # дождавшись свободного места
+    async def add_head(self, value: T) -> None:
+        await self._wait(self._putters, self._full)
+        self._deque.add_head(value)
+        self._wakeup(self._getters)
+
+    # Постусловие: добавляет элемент со значением value в хвост очереди,
+    # дождавшись свободного места
+    async def add_tail(self, value: T) -> None:
+        await self._wait(self._putters, self._full)
+        self._deque.add_tail(value)
+        self._wakeup(self._getters)
+
+    # Постусловие: из очереди удален головной элемент, если очередь
+    # пуста - после появления элемента
+    async def remove_head(self) -> None:
+        await self._wait(self._getters, self._empty)
+        self._deque.remove_head()
+        self._wakeup(self._putters)
+
+    # Постусловие: из очереди удален хвостовой элемент, если очередь
+    # пуста - после появления элемента
+    async def remove_tail(self) -> None:
+        await self._wait(self._getters, self._empty)
+        self._deque.remove_tail()
+        self._wakeup(self._putters)
+
+    # Постусловие: из очереди удален головной элемент
+    # Возвращает удаленное значение; между get_head() и remove_head()
+    # другая корутина может забрать элемент, здесь - нет
+    async def pop_head(self) -> T:
+        await self._wait(self._getters, self._empty)
+        value = self._deque.get_head()
+        self._deque.remove_head()
+        self._wakeup(self._putters)
+        return value
+
+    # Постусловие: из очереди удален хвостовой элемент
+    # Возвращает удаленное значение
+    async def pop_tail(self) -> T:
+        await self._wait(self._getters, self._empty)
+        value = self._deque.get_tail()
+        self._deque.remove_tail()
+        self._wakeup(self._putters)
+        return value
+
+    # Запросы
+    # Возвращает значение в голове, если очередь пуста - дождавшись его
+    async def get_head(self) -> T:
+        await self._wait(self._getters, self._empty)
+        # Элемент остался в очереди, его может забрать следующий ждущий
+        self._wakeup(self._getters)
+        return self._deque.get_head()
+
+    # Возвращает значение в хвосте, если очередь пуста - дождавшись его
+    async def get_tail(self) -> T:
+        await self._wait(self._getters, self._empty)
+        self._wakeup(self._getters)
+        return self._deque.get_tail()
+
+    # Предусловие: 0 <= i < size()
+    # Возвращает i-й элемент, считая от головы, не дожидаясь
+    def peek_at(self, i: int) -> T:
+        return self._deque.peek_at(i)
+
+    # Обходит элементы от головы к хвосту; ожидание внутри обхода,
+    # за время которого очередь изменилась, - RuntimeError
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._deque)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._deque)
+
+    def size(self) -> int:  # Возвращает размер очереди
+        return self._deque.size()
+
+    # Возвращает максимальный размер очереди, 0 - без ограничения
+    def get_max_size(self) -> int:
+        return self._max_size
+
+    # Запросы статусов
+    # Возвращает значение GET_HEAD_*
+    def get_get_head_status(self) -> int:
+        return self._deque.get_get_head_status()
+
+    # Возвращает значение REMOVE_HEAD_*
+    def get_remove_head_status(self) -> int:
+        return self._deque.get_remove_head_status()
+
+    # Возвращает значение GET_TAIL_*
+    def get_get_tail_status(self) -> int:
+        return self._deque.get_get_tail_status()
+
+    # Возвращает значение REMOVE_TAIL_*
+    def get_remove_tail_status(self) -> int:
+        return self._deque.get_remove_tail_status()
+
+    # Возвращает значение PEEK_AT_*
+    def get_peek_at_status(self) -> int:
+        return self._deque.get_peek_at_status()
+
+    # Вспомогательный код
+    def _empty(self) -> bool:
+        return self._deque.size() == 0
+
+    def _full(self) -> bool:
+        return 0 < self._max_size <= self._deque.size()
+
+    # Ждет, пока blocked() не станет ложным, в очереди waiters
+    async def _wait(
+        self, waiters: collections.deque, blocked: Callable[[], bool]
+    ) -> None:
+        while blocked():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # Разбуженный, но отмененный ждущий передает пробуждение
+                # следующему, иначе оно потеряется
+                if not blocked():
+                    self._wakeup(waiters)
+                raise
+
+    # Будит первого еще ждущего из waiters
+    def _wakeup(self, waiters: collections.deque) -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
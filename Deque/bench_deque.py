@@ -0,0 +1,340 @@
+"""Замеры производительности Deque.
+
+Запуск: python bench_deque.py [имя_замера ...]
+Без аргументов выполняются все замеры.
+"""
+
+import asyncio
+import collections
+import sys
+import threading
+import time
+from typing import Callable, Dict
+
+from Deque import (
+    AsyncDeque,
+    BlockBuffer,
+    ConcurrentDeque,
+    Deque,
+    RingBuffer,
+    WindowDeque,
+)
+
+
+def _timeit(func: Callable[[], None], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_ends() -> None:
+    print("Операции с концами при глубине очереди N, мкс на операцию")
+    print(
+        f"{'depth':>10} {'add_head':>10} {'remove_head':>12}"
+        f" {'add_tail':>10} {'remove_tail':>12}"
+    )
+    ops = 1_000
+    for depth in (1_000, 10_000, 100_000):
+        deque = Deque()
+        for i in range(depth):
+            deque.add_tail(i)
+
+        def add_head() -> None:
+            for i in range(ops):
+                deque.add_head(i)
+
+        def remove_head() -> None:
+            for _ in range(ops):
+                deque.remove_head()
+
+        def add_tail() -> None:
+            for i in range(ops):
+                deque.add_tail(i)
+
+        def remove_tail() -> None:
+            for _ in range(ops):
+                deque.remove_tail()
+
+        row = [f"{depth:>10}"]
+        for func, width in (
+            (add_head, 10),
+            (remove_head, 12),
+            (add_tail, 10),
+            (remove_tail, 12),
+        ):
+            row.append(f"{_timeit(func, repeat=1) / ops * 1e6:>{width}.2f}")
+        print(" ".join(row))
+
+
+def bench_batch() -> None:
+    print("Пакетные операции против поэлементных, мс на пакет")
+    print(
+        f"{'batch':>10} {'add_tail x n':>13} {'add_tail_many':>14}"
+        f" {'remove_head x n':>16} {'remove_head_n':>14}"
+    )
+    for batch in (100, 10_000, 1_000_000):
+        values = list(range(batch))
+        deque = Deque()
+
+        def add_single() -> None:
+            for value in values:
+                deque.add_tail(value)
+
+        def remove_single() -> None:
+            for _ in range(batch):
+                deque.get_head()
+                deque.remove_head()
+
+        def add_many() -> None:
+            deque.add_tail_many(values)
+
+        def remove_many() -> None:
+            deque.remove_head_n(batch)
+
+        times = []
+        for add, remove in (
+            (add_single, remove_single),
+            (add_many, remove_many),
+        ):
+            add_time = _timeit(add, repeat=1)
+            times.append((add_time, _timeit(remove, repeat=1)))
+        print(
+            f"{batch:>10} {times[0][0] * 1e3:>13.3f}"
+            f" {times[1][0] * 1e3:>14.3f} {times[0][1] * 1e3:>16.3f}"
+            f" {times[1][1] * 1e3:>14.3f}"
+        )
+
+
+# Эталон: collections.deque с ограничением емкости на threading.Condition
+class ConditionDeque:
+
+    def __init__(self, max_size: int) -> None:
+        self._items: collections.deque = collections.deque()
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def add_tail(self, value, timeout=None) -> None:
+        with self._not_full:
+            while len(self._items) >= self._max_size:
+                self._not_full.wait(timeout)
+            self._items.append(value)
+            self._not_empty.notify()
+
+    def pop_head(self, timeout=None):
+        with self._not_empty:
+            while not self._items:
+                self._not_empty.wait(timeout)
+            value = self._items.popleft()
+            self._not_full.notify()
+            return value
+
+
+def _pipeline(deque, pairs: int, items: int) -> None:
+    def produce() -> None:
+        for i in range(items):
+            deque.add_tail(i, timeout=None)
+
+    def consume() -> None:
+        for _ in range(items):
+            deque.pop_head(timeout=None)
+
+    threads = [threading.Thread(target=produce) for _ in range(pairs)]
+    threads += [threading.Thread(target=consume) for _ in range(pairs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def bench_concurrent() -> None:
+    print(
+        "Производители/потребители через ограниченную очередь,"
+        " тыс. элементов/с"
+    )
+    print(
+        f"{'pairs':>6} {'max_size':>9} {'deque+Condition':>16}"
+        f" {'ConcurrentDeque':>16}"
+    )
+    items = 50_000
+    for pairs in (1, 4):
+        for max_size in (16, 1024):
+            row = [f"{pairs:>6}", f"{max_size:>9}"]
+            for factory in (ConditionDeque, ConcurrentDeque):
+                elapsed = _timeit(
+                    lambda: _pipeline(factory(max_size), pairs, items),
+                    repeat=1,
+                )
+                row.append(f"{pairs * items / elapsed / 1e3:>16.0f}")
+            print(" ".join(row))
+
+
+# Прежняя схема: потребитель опрашивает size() и уступает цикл событий
+class PollingDeque(Deque):
+
+    async def add_tail(self, value) -> None:
+        super().add_tail(value)
+
+    async def pop_head(self):
+        while self.size() == 0:
+            await asyncio.sleep(0)
+        value = self.get_head()
+        self.remove_head()
+        return value
+
+
+async def _async_pipeline(deque, items: int, interval: float) -> float:
+    latencies = []
+
+    async def produce() -> None:
+        for _ in range(items):
+            await asyncio.sleep(interval)
+            await deque.add_tail(time.perf_counter())
+
+    async def consume() -> None:
+        for _ in range(items):
+            sent = await deque.pop_head()
+            latencies.append(time.perf_counter() - sent)
+
+    await asyncio.gather(produce(), consume())
+    return sum(latencies) / len(latencies)
+
+
+def bench_async() -> None:
+    print("asyncio: редкие элементы (раз в 1 мс) и ожидающий потребитель")
+    print(f"{'deque':>12} {'wall ms':>8} {'CPU ms':>8} {'latency us':>11}")
+    items = 500
+    for name, factory in (
+        ("polling", PollingDeque),
+        ("AsyncDeque", AsyncDeque),
+    ):
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        latency = asyncio.run(_async_pipeline(factory(), items, 0.001))
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+        print(
+            f"{name:>12} {wall * 1e3:>8.1f} {cpu * 1e3:>8.1f}"
+            f" {latency * 1e6:>11.1f}"
+        )
+
+
+def bench_window() -> None:
+    print("Скользящее окно: min/max/sum на каждом шаге, мкс на шаг")
+    print(f"{'window':>10} {'full scan':>10} {'WindowDeque':>12}")
+    steps = 2_000
+    for width in (10, 100, 1_000, 10_000):
+        row = [f"{width:>10}"]
+        # Полный обход окна на каждом шаге, как до WindowDeque
+        window: collections.deque = collections.deque(range(width))
+
+        def scan() -> None:
+            for i in range(steps):
+                window.append(i * 7919 % 1000)
+                window.popleft()
+                min(window), max(window), sum(window)
+
+        aggregated = WindowDeque()
+        aggregated.add_tail_many(range(width))
+
+        def incremental() -> None:
+            for i in range(steps):
+                aggregated.add_tail(i * 7919 % 1000)
+                aggregated.remove_head()
+                aggregated.window_min()
+                aggregated.window_max()
+                aggregated.window_sum()
+
+        row.append(f"{_timeit(scan, repeat=1) / steps * 1e6:>10.2f}")
+        row.append(f"{_timeit(incremental, repeat=1) / steps * 1e6:>12.2f}")
+        print(" ".join(row))
+
+
+def bench_storage() -> None:
+    print(
+        "Хранилища: рост до N элементов и проход головы, мс;"
+        " худшая задержка add_tail, мс"
+    )
+    print(
+        f"{'size':>10} {'storage':>12} {'fill':>8} {'drain':>8}"
+        f" {'worst add':>10}"
+    )
+    for size in (100_000, 1_000_000, 4_000_000):
+        for storage in (RingBuffer, BlockBuffer):
+            deque = Deque(storage=storage)
+            worst = 0.0
+
+            def fill() -> None:
+                nonlocal worst
+                clock = time.perf_counter
+                for i in range(size):
+                    start = clock()
+                    deque.add_tail(i)
+                    worst = max(worst, clock() - start)
+
+            def drain() -> None:
+                for _ in range(size):
+                    deque.remove_head()
+
+            fill_time = _timeit(fill, repeat=1)
+            drain_time = _timeit(drain, repeat=1)
+            print(
+                f"{size:>10} {storage.__name__:>12}"
+                f" {fill_time * 1e3:>8.0f} {drain_time * 1e3:>8.0f}"
+                f" {worst * 1e3:>10.2f}"
+            )
+
+
+def bench_iterate() -> None:
+    print("Снимок содержимого очереди, мс")
+    print(
+        f"{'size':>10} {'storage':>12} {'drain+refill':>13} {'iter':>8}"
+        f" {'reversed':>9} {'peek_at':>8}"
+    )
+    for size in (10_000, 100_000, 1_000_000):
+        for storage in (RingBuffer, BlockBuffer):
+            deque = Deque(storage=storage)
+            deque.add_tail_many(range(size))
+
+            # Прежний способ: снять все элементы с головы и вернуть в хвост
+            def drain() -> None:
+                snapshot = []
+                for _ in range(size):
+                    value = deque.get_head()
+                    deque.remove_head()
+                    snapshot.append(value)
+                    deque.add_tail(value)
+
+            def by_peek_at() -> None:
+                for i in range(size):
+                    deque.peek_at(i)
+
+            print(
+                f"{size:>10} {storage.__name__:>12}"
+                f" {_timeit(drain, repeat=1) * 1e3:>13.1f}"
+                f" {_timeit(lambda: list(deque)) * 1e3:>8.1f}"
+                f" {_timeit(lambda: list(reversed(deque))) * 1e3:>9.1f}"
+                f" {_timeit(by_peek_at, repeat=1) * 1e3:>8.1f}"
+            )
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "ends": bench_ends,
+    "batch": bench_batch,
+    "concurrent": bench_concurrent,
+    "async": bench_async,
+    "window": bench_window,
+    "storage": bench_storage,
+    "iterate": bench_iterate,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+        print()
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+
+from Deque import AsyncDeque
+
+
+class TestAsyncDeque(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.deque = AsyncDeque(max_size=2)
+
+    async def test_statuses(self):
+        self.assertEqual(
+            self.deque.get_get_head_status(), AsyncDeque.GET_HEAD_NIL
+        )
+        self.assertEqual(
+            self.deque.get_remove_tail_status(), AsyncDeque.REMOVE_TAIL_NIL
+        )
+        await self.deque.add_tail(1)
+        await self.deque.add_head(0)
+        self.assertEqual(await self.deque.get_head(), 0)
+        self.assertEqual(await self.deque.get_tail(), 1)
+        self.assertEqual(
+            self.deque.get_get_head_status(), AsyncDeque.GET_HEAD_OK
+        )
+        self.assertEqual(
+            self.deque.get_get_tail_status(), AsyncDeque.GET_TAIL_OK
+        )
+        await self.deque.remove_tail()
+        await self.deque.remove_head()
+        self.assertEqual(
+            self.deque.get_remove_head_status(), AsyncDeque.REMOVE_HEAD_OK
+        )
+        self.assertEqual(self.deque.size(), 0)
+        self.assertEqual(self.deque.get_max_size(), 2)
+
+    async def test_iteration_and_peek_at(self):
+        await self.deque.add_tail(1)
+        await self.deque.add_tail(2)
+        self.assertEqual(list(self.deque), [1, 2])
+        self.assertEqual(list(reversed(self.deque)), [2, 1])
+        self.assertEqual(self.deque.peek_at(1), 2)
+        self.assertEqual(
+            self.deque.get_peek_at_status(), AsyncDeque.PEEK_AT_OK
+        )
+
+    async def test_consumer_wakes_on_add(self):
+        consumer = asyncio.create_task(self.deque.pop_head())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())
+        await self.deque.add_tail("x")
+        self.assertEqual(await asyncio.wait_for(consumer, 1), "x")
+        self.assertEqual(self.deque.size(), 0)
+
+    async def test_peekers_and_consumer_share_item(self):
+        peeker = asyncio.create_task(self.deque.get_tail())
+        consumer = asyncio.create_task(self.deque.pop_tail())
+        await asyncio.sleep(0)
+        await self.deque.add_head(7)
+        self.assertEqual(await asyncio.wait_for(peeker, 1), 7)
+        self.assertEqual(await asyncio.wait_for(consumer, 1), 7)
+
+    async def test_max_size_blocks_producer(self):
+        await self.deque.add_tail(1)
+        await self.deque.add_tail(2)
+        producer = asyncio.create_task(self.deque.add_tail(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(self.deque.size(), 2)
+
+        await self.deque.remove_head()
+        await asyncio.wait_for(producer, 1)
+        self.assertEqual(await self.deque.pop_head(), 2)
+        self.assertEqual(await self.deque.pop_head(), 3)
+
+    async def test_cancelled_waiter_passes_wakeup(self):
+        first = asyncio.create_task(self.deque.pop_head())
+        second = asyncio.create_task(self.deque.pop_head())
+        await asyncio.sleep(0)
+        # Элемент достается первому ждущему, но он отменен до запуска
+        await self.deque.add_tail(1)
+        first.cancel()
+        self.assertEqual(await asyncio.wait_for(second, 1), 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+    async def test_timeout_leaves_deque_unchanged(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(self.deque.remove_head(), 0.01)
+        await self.deque.add_tail(1)
+        self.assertEqual(self.deque.size(), 1)
+        self.assertEqual(await self.deque.pop_head(), 1)
+
+    async def test_producers_consumers(self):
+        received = []
+
+        async def produce(base):
+            for i in range(200):
+                await self.deque.add_tail(base + i)
+
+        async def consume():
+            for _ in range(200):
+                received.append(await self.deque.pop_head())
+
+        await asyncio.gather(
+            *(produce(i * 200) for i in range(3)),
+            *(consume() for _ in range(3)),
+        )
+        self.assertEqual(sorted(received), list(range(600)))
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            AsyncDeque(max_size=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+from collections import deque
+
+import test_deque
+from Deque import BlockBuffer, Deque, WindowDeque
+
+
+# Все сценарии Deque на блочном хранилище
+class TestBlockDeque(test_deque.TestDeque):
+
+    def setUp(self):
+        self.deque = Deque(storage=BlockBuffer)
+
+
+class TestBlockBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.buffer = BlockBuffer()
+
+    def test_growth_keeps_blocks(self):
+        size = BlockBuffer.BLOCK_SIZE
+        self.buffer.push_back(0)
+        first = self.buffer._first
+        for i in range(1, 10 * size):
+            self.buffer.push_back(i)
+        # Рост не переносит элементы: первый блок тот же
+        self.assertIs(self.buffer._first, first)
+        self.assertEqual(self.buffer.to_list(), list(range(10 * size)))
+        self.assertEqual(self.buffer.get_block_count(), 11)
+
+    def test_blocks_released_as_head_advances(self):
+        size = BlockBuffer.BLOCK_SIZE
+        self.buffer.extend_back(list(range(10 * size)))
+        blocks = self.buffer.get_block_count()
+        for _ in range(3 * size):
+            self.buffer.pop_front()
+        self.assertEqual(self.buffer.get_block_count(), blocks - 3)
+        self.assertEqual(self.buffer.pop_front_n(4 * size)[0], 3 * size)
+        self.assertEqual(self.buffer.get_block_count(), blocks - 7)
+        self.buffer.pop_back_n(len(self.buffer))
+        self.assertEqual(self.buffer.get_block_count(), 1)
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_random_against_deque(self):
+        random.seed(18)
+        expected = deque()
+        for i in range(20000):
+            operation = random.random()
+            count = random.randrange(0, 150)
+            if operation < 0.25:
+                self.buffer.push_back(i)
+                expected.append(i)
+            elif operation < 0.5:
+                self.buffer.push_front(i)
+                expected.appendleft(i)
+            elif operation < 0.6:
+                values = list(range(i, i + count))
+                self.buffer.extend_back(values)
+                expected.extend(values)
+            elif operation < 0.7:
+                values = list(range(i, i + count))
+                self.buffer.extend_front(values)
+                expected.extendleft(values)
+            elif operation < 0.8 and expected:
+                self.buffer.pop_front()
+                expected.popleft()
+            elif operation < 0.9 and expected:
+                self.buffer.pop_back()
+                expected.pop()
+            elif operation < 0.95:
+                count = min(count, len(expected))
+                removed = [expected.popleft() for _ in range(count)]
+                self.assertEqual(self.buffer.pop_front_n(count), removed)
+            else:
+                count = min(count, len(expected))
+                removed = [expected.pop() for _ in range(count)]
+                self.assertEqual(self.buffer.pop_back_n(count), removed)
+            self.assertEqual(len(self.buffer), len(expected))
+            if expected:
+                self.assertEqual(self.buffer.front(), expected[0])
+                self.assertEqual(self.buffer.back(), expected[-1])
+        self.assertEqual(self.buffer.to_list(), list(expected))
+
+    def test_window_deque_on_blocks(self):
+        window = WindowDeque(storage=BlockBuffer)
+        window.add_tail_many(range(200))
+        window.remove_tail_n(50)
+        window.remove_head_n(100)
+        self.assertEqual(window.window_min(), 100)
+        self.assertEqual(window.window_max(), 149)
+
+    def tearDown(self):
+        self.buffer = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import threading
+import time
+import unittest
+
+from Deque import ConcurrentDeque
+
+
+class TestConcurrentDeque(unittest.TestCase):
+
+    def setUp(self):
+        self.deque = ConcurrentDeque(max_size=4)
+
+    def test_non_blocking_like_deque(self):
+        with self.assertRaises(IndexError):
+            self.deque.get_head()
+        self.assertEqual(
+            self.deque.get_get_head_status(), ConcurrentDeque.GET_HEAD_EMPTY
+        )
+        with self.assertRaises(IndexError):
+            self.deque.remove_tail()
+        with self.assertRaises(IndexError):
+            self.deque.pop_head()
+        self.assertEqual(
+            self.deque.get_pop_head_status(), ConcurrentDeque.POP_HEAD_EMPTY
+        )
+
+        self.deque.add_tail(1)
+        self.deque.add_head(0)
+        self.assertEqual(
+            self.deque.get_add_tail_status(), ConcurrentDeque.ADD_TAIL_OK
+        )
+        self.assertEqual(
+            self.deque.get_add_head_status(), ConcurrentDeque.ADD_HEAD_OK
+        )
+        self.assertEqual(self.deque.get_head(), 0)
+        self.assertEqual(self.deque.get_tail(), 1)
+        self.assertEqual(self.deque.pop_tail(), 1)
+        self.assertEqual(self.deque.pop_head(), 0)
+        self.assertEqual(self.deque.size(), 0)
+
+    def test_bounded_capacity(self):
+        self.assertEqual(self.deque.get_max_size(), 4)
+        self.deque.add_tail_many([1, 2, 3])
+        self.deque.add_head(0)
+        self.deque.add_tail(4)
+        self.assertEqual(
+            self.deque.get_add_tail_status(), ConcurrentDeque.ADD_TAIL_ERR_FULL
+        )
+        self.deque.add_head(-1, timeout=0.01)
+        self.assertEqual(
+            self.deque.get_add_head_status(), ConcurrentDeque.ADD_HEAD_ERR_FULL
+        )
+        self.assertEqual(self.deque.size(), 4)
+
+        # Пакет добавляется целиком или не добавляется
+        self.assertEqual(self.deque.remove_head_n(2), [0, 1])
+        self.deque.add_tail_many([4, 5, 6])
+        self.assertEqual(
+            self.deque.get_add_tail_status(), ConcurrentDeque.ADD_TAIL_ERR_FULL
+        )
+        self.assertEqual(self.deque.size(), 2)
+        self.deque.add_head_many([1, 0])
+        self.assertEqual(self.deque.remove_tail_n(4), [3, 2, 1, 0])
+
+        self.deque.add_tail_many(range(5), timeout=None)
+        self.assertEqual(
+            self.deque.get_add_tail_status(), ConcurrentDeque.ADD_TAIL_ERR_FULL
+        )
+        with self.assertRaises(ValueError):
+            ConcurrentDeque(max_size=-1)
+
+    def test_snapshot_iteration(self):
+        self.deque.add_tail_many([1, 2, 3])
+        iterator = iter(self.deque)
+        backwards = reversed(self.deque)
+        self.deque.remove_head()
+        # Обход идет по снимку и не ломается от изменений
+        self.assertEqual(list(iterator), [1, 2, 3])
+        self.assertEqual(list(backwards), [3, 2, 1])
+        self.assertEqual(self.deque.peek_at(1), 3)
+
+    def test_get_timeout_expires(self):
+        start = time.monotonic()
+        with self.assertRaises(IndexError):
+            self.deque.pop_head(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+
+    def test_blocking_get_wakes_on_add(self):
+        results = []
+
+        def consumer():
+            results.append(self.deque.get_tail(timeout=5))
+            results.append(self.deque.pop_head(timeout=5))
+
+        thread = threading.Thread(target=consumer)
+        thread.start()
+        time.sleep(0.05)
+        self.deque.add_tail("x")
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, ["x", "x"])
+
+    def test_backpressure(self):
+        self.deque.add_tail_many(range(4))
+        added = threading.Event()
+
+        def producer():
+            self.deque.add_tail(4, timeout=5)
+            added.set()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        self.assertFalse(added.wait(0.05))
+        self.deque.remove_head()
+        self.assertTrue(added.wait(5))
+        thread.join(5)
+        self.assertEqual(self.deque.remove_head_n(4), [1, 2, 3, 4])
+
+    def test_producers_consumers(self):
+        producers, consumers, per_producer = 3, 3, 2000
+        received = [[] for _ in range(consumers)]
+
+        def produce(base):
+            for i in range(per_producer):
+                if i % 2:
+                    self.deque.add_tail(base + i, timeout=None)
+                else:
+                    self.deque.add_head(base + i, timeout=None)
+
+        def consume(index):
+            while True:
+                value = self.deque.pop_head(timeout=None)
+                if value is None:
+                    return
+                received[index].append(value)
+
+        threads = [
+            threading.Thread(target=consume, args=(i,))
+            for i in range(consumers)
+        ]
+        threads += [
+            threading.Thread(target=produce, args=(i * per_producer,))
+            for i in range(producers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads[consumers:]:
+            thread.join(10)
+        for _ in range(consumers):
+            self.deque.add_tail(None, timeout=None)
+        for thread in threads[:consumers]:
+            thread.join(10)
+
+        values = sorted(v for chunk in received for v in chunk)
+        self.assertEqual(values, list(range(producers * per_producer)))
+        self.assertEqual(self.deque.size(), 0)
+
+    def tearDown(self):
+        self.deque = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,7 @@
+import random
 import unittest
+from collections import deque
+
 from Deque import Deque
 
 
@@ -148,6 +151,126 @@ class TestDeque(unittest.TestCase):
         self.deque.remove_tail()
         self.assertEqual(self.deque.size(), 0)
 
+    def test_wraparound_and_resize(self):
+        random.seed(13)
+        expected = deque()
+        for i in range(5000):
+            operation = random.random()
+            if operation < 0.3:
+                self.deque.add_head(i)
+                expected.appendleft(i)
+            elif operation < 0.6:
+                self.deque.add_tail(i)
+                expected.append(i)
+            elif operation < 0.8 and expected:
+                self.deque.remove_head()
+                expected.popleft()
+            elif expected:
+                self.deque.remove_tail()
+                expected.pop()
+            self.assertEqual(self.deque.size(), len(expected))
+            if expected:
+                self.assertEqual(self.deque.get_head(), expected[0])
+                self.assertEqual(self.deque.get_tail(), expected[-1])
+
+        while expected:
+            self.assertEqual(self.deque.get_head(), expected.popleft())
+            self.deque.remove_head()
+        self.assertEqual(self.deque.size(), 0)
+
+    def test_bulk_operations(self):
+        random.seed(14)
+        expected = deque()
+        counter = 0
+        for _ in range(500):
+            operation = random.random()
+            count = random.randrange(0, 40)
+            values = list(range(counter, counter + count))
+            counter += count
+            if operation < 0.3:
+                self.deque.add_head_many(values)
+                expected.extendleft(values)
+            elif operation < 0.6:
+                self.deque.add_tail_many(values)
+                expected.extend(values)
+            elif operation < 0.8:
+                count = min(count, len(expected))
+                removed = [expected.popleft() for _ in range(count)]
+                self.assertEqual(self.deque.remove_head_n(count), removed)
+            else:
+                count = min(count, len(expected))
+                removed = [expected.pop() for _ in range(count)]
+                self.assertEqual(self.deque.remove_tail_n(count), removed)
+            self.assertEqual(self.deque.size(), len(expected))
+            if expected:
+                self.assertEqual(self.deque.get_head(), expected[0])
+                self.assertEqual(self.deque.get_tail(), expected[-1])
+        self.assertEqual(
+            self.deque.remove_tail_n(len(expected)), list(reversed(expected))
+        )
+        self.assertEqual(
+            self.deque.get_remove_tail_n_status(), Deque.REMOVE_TAIL_N_OK
+        )
+
+    def test_remove_tail_n_errors(self):
+        self.assertEqual(
+            self.deque.get_remove_tail_n_status(), Deque.REMOVE_TAIL_N_NIL
+        )
+        self.deque.add_head_many("abc")
+        self.assertEqual(self.deque.get_head(), "c")
+        with self.assertRaises(IndexError):
+            self.deque.remove_tail_n(4)
+        self.assertEqual(
+            self.deque.get_remove_tail_n_status(), Deque.REMOVE_TAIL_N_ERR_COUNT
+        )
+        self.assertEqual(self.deque.size(), 3)
+
+    def test_iteration_and_peek_at(self):
+        self.assertEqual(list(self.deque), [])
+        self.assertEqual(self.deque.get_peek_at_status(), Deque.PEEK_AT_NIL)
+        with self.assertRaises(IndexError):
+            self.deque.peek_at(0)
+        self.assertEqual(
+            self.deque.get_peek_at_status(), Deque.PEEK_AT_ERR_INDEX
+        )
+
+        expected = deque()
+        for i in range(300):
+            if i % 3:
+                self.deque.add_tail(i)
+                expected.append(i)
+            else:
+                self.deque.add_head(i)
+                expected.appendleft(i)
+        for _ in range(100):
+            self.deque.remove_head()
+            expected.popleft()
+
+        self.assertEqual(list(self.deque), list(expected))
+        self.assertEqual(list(reversed(self.deque)), list(reversed(expected)))
+        for i in range(len(expected)):
+            self.assertEqual(self.deque.peek_at(i), expected[i])
+        self.assertEqual(self.deque.get_peek_at_status(), Deque.PEEK_AT_OK)
+        with self.assertRaises(IndexError):
+            self.deque.peek_at(len(expected))
+        with self.assertRaises(IndexError):
+            self.deque.peek_at(-1)
+        # Обход не изменяет очередь
+        self.assertEqual(self.deque.size(), len(expected))
+
+    def test_mutation_during_iteration(self):
+        self.deque.add_tail_many(range(5))
+        iterator = iter(self.deque)
+        next(iterator)
+        self.deque.add_tail(5)
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+        iterator = reversed(self.deque)
+        next(iterator)
+        self.deque.remove_head()
+        with self.assertRaises(RuntimeError):
+            next(iterator)
+
     def tearDown(self):
         self.deque = None
 
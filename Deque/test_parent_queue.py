@@ -41,6 +41,35 @@ class QueueTests(unittest.TestCase):
         self.assertEqual(self.q.get_head(), 7)
         self.assertEqual(self.q.get_get_head_status(), ParentQueue.GET_HEAD_OK)
 
+    def test_add_tail_many_remove_head_n(self):
+        self.assertEqual(
+            self.q.get_remove_head_n_status(), ParentQueue.REMOVE_HEAD_N_NIL
+        )
+        self.q.add_tail_many(range(40))
+        self.assertEqual(self.q.size(), 40)
+        self.assertEqual(self.q.get_head(), 0)
+
+        self.assertEqual(self.q.remove_head_n(30), list(range(30)))
+        self.assertEqual(
+            self.q.get_remove_head_n_status(), ParentQueue.REMOVE_HEAD_N_OK
+        )
+        # Запись с переходом через конец буфера
+        self.q.add_tail_many(range(40, 60))
+        self.assertEqual(self.q.remove_head_n(0), [])
+        self.assertEqual(self.q.remove_head_n(30), list(range(30, 60)))
+        self.assertEqual(self.q.size(), 0)
+
+        self.q.add_tail_many([1, 2])
+        with self.assertRaises(IndexError):
+            self.q.remove_head_n(3)
+        with self.assertRaises(IndexError):
+            self.q.remove_head_n(-1)
+        self.assertEqual(
+            self.q.get_remove_head_n_status(),
+            ParentQueue.REMOVE_HEAD_N_ERR_COUNT,
+        )
+        self.assertEqual(self.q.size(), 2)
+
     def tearDown(self):
         self.q = None
 
@@ -0,0 +1,108 @@
+import random
+import unittest
+from collections import deque
+
+from Deque import WindowDeque
+
+
+class TestWindowDeque(unittest.TestCase):
+
+    def setUp(self):
+        self.window = WindowDeque()
+
+    def assertWindow(self, expected):
+        self.assertEqual(self.window.size(), len(expected))
+        self.assertEqual(self.window.window_sum(), sum(expected))
+        if not expected:
+            return
+        self.assertEqual(self.window.window_min(), min(expected))
+        self.assertEqual(self.window.window_max(), max(expected))
+        self.assertAlmostEqual(
+            self.window.window_mean(), sum(expected) / len(expected)
+        )
+
+    def test_empty_window(self):
+        self.assertEqual(
+            self.window.get_window_min_status(), WindowDeque.WINDOW_MIN_NIL
+        )
+        self.assertEqual(self.window.window_sum(), 0)
+        with self.assertRaises(IndexError):
+            self.window.window_min()
+        with self.assertRaises(IndexError):
+            self.window.window_max()
+        with self.assertRaises(IndexError):
+            self.window.window_mean()
+        self.assertEqual(
+            self.window.get_window_min_status(), WindowDeque.WINDOW_MIN_EMPTY
+        )
+        self.assertEqual(
+            self.window.get_window_max_status(), WindowDeque.WINDOW_MAX_EMPTY
+        )
+        self.assertEqual(
+            self.window.get_window_mean_status(),
+            WindowDeque.WINDOW_MEAN_EMPTY,
+        )
+        with self.assertRaises(IndexError):
+            self.window.remove_head()
+        self.assertWindow([])
+
+    def test_sliding_window(self):
+        values = [5, 1, 4, 1, 3, 9, 2, 6, 5, 3]
+        for i, value in enumerate(values):
+            self.window.add_tail(value)
+            if self.window.size() > 3:
+                self.window.remove_head()
+            self.assertWindow(values[max(0, i - 2) : i + 1])
+        self.assertEqual(
+            self.window.get_window_min_status(), WindowDeque.WINDOW_MIN_OK
+        )
+        self.assertEqual(
+            self.window.get_window_max_status(), WindowDeque.WINDOW_MAX_OK
+        )
+        self.assertEqual(
+            self.window.get_window_mean_status(), WindowDeque.WINDOW_MEAN_OK
+        )
+
+    def test_random_operations(self):
+        random.seed(17)
+        expected = deque()
+        for _ in range(3000):
+            operation = random.random()
+            value = random.randrange(-50, 50)
+            if operation < 0.3:
+                self.window.add_tail(value)
+                expected.append(value)
+            elif operation < 0.45:
+                self.window.add_head(value)
+                expected.appendleft(value)
+            elif operation < 0.5:
+                values = [random.randrange(-50, 50) for _ in range(5)]
+                self.window.add_tail_many(values)
+                expected.extend(values)
+            elif operation < 0.55:
+                self.window.add_head_many([value, value + 1])
+                expected.extendleft([value, value + 1])
+            elif operation < 0.8 and expected:
+                self.window.remove_head()
+                expected.popleft()
+            elif operation < 0.9 and expected:
+                self.window.remove_tail()
+                expected.pop()
+            elif operation < 0.95:
+                count = min(3, len(expected))
+                self.window.remove_head_n(count)
+                for _ in range(count):
+                    expected.popleft()
+            else:
+                count = min(2, len(expected))
+                self.window.remove_tail_n(count)
+                for _ in range(count):
+                    expected.pop()
+            self.assertWindow(list(expected))
+
+    def tearDown(self):
+        self.window = None
+
+
+if __name__ == "__main__":
+    unittest.main()
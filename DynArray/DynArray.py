@@ -1,9 +1,113 @@
-import ctypes
+import array
+import bisect
+import functools
+import io
+import itertools
+import mmap
+import operator
+import os
+import pickle
+import struct
+import sys
 from abc import ABC, abstractmethod
-from typing import Final, Generic, List, TypeVar
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Final,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar("T")
 
+GOLDEN_RATIO: Final[float] = (1 + 5**0.5) / 2
+
+
+# Политика изменения емкости динамического массива
+class GrowthPolicy(ABC):
+
+    # Предусловие: required > capacity
+    # Возвращает новую емкость, вмещающую не менее required элементов
+    @abstractmethod
+    def grow(self, capacity: int, required: int) -> int:
+        pass
+
+    # Возвращает новую емкость после удаления элемента,
+    # capacity если сжатие не требуется. Результат не меньше min_capacity
+    @abstractmethod
+    def shrink(self, capacity: int, length: int, min_capacity: int) -> int:
+        pass
+
+
+# Рост в factor раз. Сжатие в shrink_factor раз, когда заполнено меньше
+# shrink_threshold емкости. Если shrink_threshold * shrink_factor < 1,
+# после сжатия остается запас до следующего роста (гистерезис), и
+# чередование append/remove на границе емкости не вызывает перевыделений
+class GeometricGrowth(GrowthPolicy):
+
+    def __init__(
+        self,
+        factor: float = 2.0,
+        shrink_threshold: float = 0.5,
+        shrink_factor: float = 1.5,
+    ) -> None:
+        if factor <= 1:
+            raise ValueError("factor must be more than 1")
+        if not 0 <= shrink_threshold < 1:
+            raise ValueError("shrink_threshold must be in [0, 1)")
+        if shrink_factor <= 1:
+            raise ValueError("shrink_factor must be more than 1")
+        self._factor: float = factor
+        self._shrink_threshold: float = shrink_threshold
+        self._shrink_factor: float = shrink_factor
+
+    def grow(self, capacity: int, required: int) -> int:
+        return max(int(capacity * self._factor), required)
+
+    def shrink(self, capacity: int, length: int, min_capacity: int) -> int:
+        if length >= self._shrink_threshold * capacity:
+            return capacity
+        return max(int(capacity / self._shrink_factor), min_capacity)
+
+
+# Рост и сжатие в золотое сечение, сжатие при заполнении меньше 1/φ²
+class GoldenRatioGrowth(GeometricGrowth):
+
+    def __init__(self) -> None:
+        super().__init__(
+            factor=GOLDEN_RATIO,
+            shrink_threshold=1 / GOLDEN_RATIO**2,
+            shrink_factor=GOLDEN_RATIO,
+        )
+
+
+# Рост на целое число шагов step. Сжатие на step, когда свободно больше
+# двух шагов, поэтому между ростом и сжатием всегда остается шаг запаса
+class AdditiveGrowth(GrowthPolicy):
+
+    def __init__(self, step: int = 16) -> None:
+        if step <= 0:
+            raise ValueError("step must be more than 0")
+        self._step: int = step
+
+    def grow(self, capacity: int, required: int) -> int:
+        steps = -(-(required - capacity) // self._step)
+        return capacity + steps * self._step
+
+    def shrink(self, capacity: int, length: int, min_capacity: int) -> int:
+        if capacity - length <= 2 * self._step:
+            return capacity
+        return max(capacity - self._step, min_capacity)
+
 
 class DynArrayATD(Generic[T]):
 
@@ -44,6 +148,12 @@ class DynArrayATD(Generic[T]):
     def append(self, value: T) -> None:
         pass
 
+    # Постусловие: в конец массива в исходном порядке добавлены все
+    # элементы values
+    @abstractmethod
+    def extend(self, values: Iterable[T]) -> None:
+        pass
+
     # Предусловие: указанная позиция не превышает длинну массива
     # Постусловие: элемент из данной позиции удален и все жлементы
     # после данной позиции смещены влево
@@ -65,8 +175,19 @@ class DynArrayATD(Generic[T]):
 
     # Запросы
     # Предусловие: указанная позиция не превышает длинну массива
+    # Для среза возвращает новый массив из элементов среза
     @abstractmethod
-    def __getitem__(self, index: int) -> T:
+    def __getitem__(self, index: Union[int, slice]) -> T:
+        pass
+
+    # Возвращает итератор по элементам от начала к концу
+    @abstractmethod
+    def __iter__(self) -> Iterator[T]:
+        pass
+
+    # Возвращает итератор по элементам от конца к началу
+    @abstractmethod
+    def __reversed__(self) -> Iterator[T]:
         pass
 
     @abstractmethod
@@ -102,7 +223,26 @@ class DynArrayATD(Generic[T]):
 class DynArray(DynArrayATD, Generic[T]):
 
     # Конструктор
-    def __init__(self, min_capacity: int = 16):
+    # dtype - код типа модуля array ('q', 'd', ...). Если задан, элементы
+    # хранятся неупакованными в array.array, иначе как ссылки на объекты.
+    # policy - политика изменения емкости, по умолчанию рост в 2 раза
+    def __init__(
+        self,
+        min_capacity: int = 16,
+        dtype: Optional[str] = None,
+        policy: Optional[GrowthPolicy] = None,
+    ):
+        if dtype is not None and dtype not in array.typecodes:
+            raise ValueError(f"Unknown dtype: {dtype!r}")
+        self._dtype: Optional[str] = dtype
+        self._policy: GrowthPolicy = (
+            policy if policy is not None else GeometricGrowth()
+        )
+        self._resize_count: int = 0
+        self._copied_count: int = 0
+        # Меняется при каждой замене хранилища, делает представления
+        # DynArrayView недействительными
+        self._generation: int = 0
         self.MIN_CAPACITY: int = min_capacity
         self.length: int = 0
         self.capacity: int = self.MIN_CAPACITY
@@ -113,6 +253,62 @@ class DynArray(DynArrayATD, Generic[T]):
         self._insert_status: int = self.INSERT_NIL
         self._getitem_status: int = self.GETITEM_NIL
 
+    # Конструктор
+    # Постусловие: создан массив из элементов values
+    @classmethod
+    def from_iterable(
+        cls,
+        values: Iterable[T],
+        min_capacity: int = 16,
+        dtype: Optional[str] = None,
+        policy: Optional[GrowthPolicy] = None,
+    ) -> "DynArray[T]":
+        result = cls(min_capacity, dtype, policy)
+        result.extend(values)
+        return result
+
+    # Конструктор
+    # Предусловие: data получены через to_bytes()
+    # Постусловие: создан массив, сохраненный в data
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, policy: Optional[GrowthPolicy] = None
+    ) -> "DynArray[T]":
+        return cls.load(io.BytesIO(data), policy)
+
+    # Конструктор
+    # Предусловие: с текущей позиции file записан массив через dump()
+    # Постусловие: создан массив, прочитанный из file
+    @classmethod
+    def load(
+        cls, file: BinaryIO, policy: Optional[GrowthPolicy] = None
+    ) -> "DynArray[T]":
+        header = _read_exact(file, _DUMP_HEADER.size)
+        magic, version, typecode, big_endian, min_capacity, length = (
+            _DUMP_HEADER.unpack(header)
+        )
+        if magic != _DUMP_MAGIC or version not in _DUMP_VERSIONS:
+            raise ValueError("Data is not a serialized DynArray")
+        dtype = typecode.decode() if typecode != b"\0" else None
+        result = cls(min_capacity, dtype, policy)
+        if dtype is not None:
+            values = _zeros(dtype, length)
+            if file.readinto(values) != length * values.itemsize:
+                raise ValueError("Serialized DynArray is truncated")
+            if big_endian != (sys.byteorder == "big"):
+                values.byteswap()
+        else:
+            data = _read_exact(file, _read_size(file))
+            buffers = [
+                _read_exact(file, _read_size(file))
+                for _ in range(_read_size(file))
+            ]
+            values = pickle.loads(data, buffers=buffers)
+            if not isinstance(values, list) or len(values) < length:
+                raise ValueError("Serialized DynArray is truncated")
+        result._adopt(values, length)
+        return result
+
     # Команды
     def __setitem__(self, index: int, value: T) -> None:
         if index < 0 or index >= self.length:
@@ -123,19 +319,54 @@ class DynArray(DynArrayATD, Generic[T]):
 
     def append(self, value: T) -> None:
         if self.length == self.capacity:
-            self._resize(2 * self.capacity)
+            self._grow(self.length + 1)
         self.array[self.length] = value
         self.length += 1
 
+    def extend(self, values: Iterable[T]) -> None:
+        if isinstance(values, (list, tuple, array.array)):
+            # Последовательность уже в памяти: хранилище расширяется один раз
+            # и заполняется одним срезом
+            items = self._materialize(values)
+            new_length = self.length + len(items)
+            if new_length > self.capacity:
+                self._grow(new_length)
+            self.array[self.length : new_length] = items
+            self.length = new_length
+            return
+        # Итератор не копируется целиком: емкость резервируется по
+        # length_hint, элементы переносятся в хранилище частями
+        # не больше _EXTEND_CHUNK, при неверной подсказке хранилище растет
+        required = self.length + operator.length_hint(values)
+        if required > self.capacity:
+            self._grow(required)
+        iterator = iter(values)
+        while True:
+            if self.length == self.capacity:
+                value = next(iterator, _END)
+                if value is _END:
+                    return
+                self._grow(self.length + 1)
+                self.array[self.length] = value
+                self.length += 1
+            count = min(self.capacity - self.length, _EXTEND_CHUNK)
+            chunk = self._materialize(itertools.islice(iterator, count))
+            new_length = self.length + len(chunk)
+            self.array[self.length : new_length] = chunk
+            self.length = new_length
+            if len(chunk) < count:
+                return
+
     def remove(self, index: int) -> None:
         if index < 0 or index >= self.length:
             self._remove_status = self.REMOVE_ERR_INDEX
             raise IndexError("Index is out of bounds")
-        for j in range(index, self.length - 1):
-            self.array[j] = self.array[j + 1]
+        self._shift_left(index)
         self.length -= 1
-        if self.length < 0.5 * self.capacity:
-            new_capacity = max(int(self.capacity / 1.5), self.MIN_CAPACITY)
+        new_capacity = self._policy.shrink(
+            self.capacity, self.length, self.MIN_CAPACITY
+        )
+        if new_capacity != self.capacity:
             self._resize(new_capacity)
         self._remove_status = self.REMOVE_OK
 
@@ -143,6 +374,7 @@ class DynArray(DynArrayATD, Generic[T]):
         self.length = 0
         self.capacity = self.MIN_CAPACITY
         self.array = self._make_array(self.capacity)
+        self._generation += 1
 
         self._setitem_status = self.SETITEM_NIL
         self._remove_status = self.REMOVE_NIL
@@ -154,27 +386,153 @@ class DynArray(DynArrayATD, Generic[T]):
             self._insert_status = self.INSERT_ERR_INDEX
             raise IndexError("Index is out of bounds")
         if self.length == self.capacity:
-            self._resize(2 * self.capacity)
-        for j in range(self.length, index, -1):
-            self.array[j] = self.array[j - 1]
+            self._grow(self.length + 1)
+        self._shift_right(index)
         self.array[index] = value
         self.length += 1
         self._insert_status = self.INSERT_OK
 
+    # Постусловие: емкость массива не меньше capacity
+    def reserve(self, capacity: int) -> None:
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+    # Постусловие: емкость массива равна max(длина, минимальная емкость)
+    def shrink_to_fit(self) -> None:
+        new_capacity = max(self.length, self.MIN_CAPACITY)
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+
     # Запросы
-    def __getitem__(self, index: int) -> T:
+    def __getitem__(self, index: Union[int, slice]) -> T:
+        if isinstance(index, slice):
+            self._getitem_status = self.GETITEM_OK
+            return self._get_slice(index)
         if index < 0 or index >= self.length:
             self._getitem_status = self.GETITEM_ERR_INDEX
             raise IndexError("Index is out of bounds")
         self._getitem_status = self.GETITEM_OK
         return self.array[index]
 
+    # Итераторы обходят хранилище на уровне C, без проверок границ
+    # и записи статусов. Изменение массива во время обхода не допускается
+    def __iter__(self) -> Iterator[T]:
+        return itertools.islice(self.array, self.length)
+
+    # Обратный обход начинается с последнего элемента, а не с конца
+    # хранилища, и не зависит от числа свободных ячеек
+    def __reversed__(self) -> Iterator[T]:
+        return map(self.array.__getitem__, range(self.length - 1, -1, -1))
+
     def __len__(self):
         return self.length
 
+    # Возвращает массив в компактном двоичном виде
+    def to_bytes(self) -> bytes:
+        stream = io.BytesIO()
+        self.dump(stream)
+        return stream.getvalue()
+
+    # Записывает массив в двоичный файл file: заголовок _DUMP_HEADER, затем
+    # для типизированного массива - элементы одним блоком, для массива
+    # объектов - pickle протокола 5 всего хранилища вместе со свободными
+    # ячейками (None занимает в pickle один байт, а срез элементов стоил бы
+    # копии списка) и его внешние буферы (PickleBuffer), каждый с префиксом
+    # длины
+    def dump(self, file: BinaryIO) -> None:
+        file.write(
+            _DUMP_HEADER.pack(
+                _DUMP_MAGIC,
+                _DUMP_VERSION,
+                self._dtype.encode() if self._dtype is not None else b"\0",
+                sys.byteorder == "big",
+                self.MIN_CAPACITY,
+                self.length,
+            )
+        )
+        if self._dtype is not None:
+            with self.buffer() as data:
+                file.write(data)
+            return
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(
+            self.array, protocol=5, buffer_callback=buffers.append
+        )
+        file.write(_SIZE.pack(len(data)))
+        file.write(data)
+        file.write(_SIZE.pack(len(buffers)))
+        for buffer in buffers:
+            with buffer.raw() as raw:
+                file.write(_SIZE.pack(raw.nbytes))
+                file.write(raw)
+
+    # Возвращает представление элементов range(start, stop, step) без
+    # копирования. Границы нормализуются как у среза
+    def view(
+        self, start: int = 0, stop: Optional[int] = None, step: int = 1
+    ) -> "DynArrayView[T]":
+        return DynArrayView(self, start, stop, step)
+
+    # Возвращает новый массив из результатов fn для каждого элемента.
+    # Массив делится на части, которые обрабатываются в пуле процессов
+    # executor (по умолчанию создается ProcessPoolExecutor на workers
+    # процессов). Типизированный массив передается процессам одной копией
+    # в разделяемой памяти, массив объектов - сериализацией частей.
+    # fn должна сериализоваться pickle, результат имеет тип dtype
+    def parallel_map(
+        self,
+        fn: Callable[[T], Any],
+        workers: Optional[int] = None,
+        dtype: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> "DynArray":
+        result = DynArray(self.MIN_CAPACITY, dtype, self._policy)
+        result.reserve(self.length)
+        for part in self._run_chunks(_map_chunk, fn, workers, executor):
+            result.extend(part)
+        return result
+
+    # Предусловие: массив не пуст
+    # Возвращает свертку элементов ассоциативной функцией fn. Части
+    # массива сворачиваются в пуле процессов, как в parallel_map(),
+    # затем частичные результаты сворачиваются по порядку
+    def parallel_reduce(
+        self,
+        fn: Callable[[Any, T], Any],
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> Any:
+        if self.length == 0:
+            raise ValueError("Array is empty")
+        return functools.reduce(
+            fn, self._run_chunks(_reduce_chunk, fn, workers, executor)
+        )
+
     def get_min_capacity(self) -> int:
         return self.MIN_CAPACITY
 
+    # Возвращает количество перевыделений хранилища за время жизни массива
+    def get_resize_count(self) -> int:
+        return self._resize_count
+
+    # Возвращает суммарное количество элементов,
+    # скопированных при перевыделениях хранилища
+    def get_copied_count(self) -> int:
+        return self._copied_count
+
+    # Возвращает код типа элементов или None для массива объектов
+    def get_dtype(self) -> Optional[str]:
+        return self._dtype
+
+    # Предусловие: массив типизирован (задан dtype)
+    # Возвращает memoryview на занятую часть хранилища без копирования,
+    # например для numpy.frombuffer(). После _resize() представление
+    # ссылается на старое хранилище и больше не отражает изменения массива
+    def buffer(self) -> memoryview:
+        if self._dtype is None:
+            raise TypeError("Buffer is available only for typed arrays")
+        return memoryview(self.array)[: self.length]
+
     # Запросы статусов
     def get_setitem_status(self) -> int:
         return self._setitem_status
@@ -189,12 +547,941 @@ class DynArray(DynArrayATD, Generic[T]):
         return self._getitem_status
 
     # Вспомогательный код
-    def _make_array(self, new_capacity):
-        return (new_capacity * ctypes.py_object)()
+    # Хранилище фиксированной длины capacity, свободные ячейки заняты None.
+    # list, в отличие от ctypes.py_object, сдвигает ссылки одним memmove
+    # и сам ведет учет ссылок, без словаря keep-alive на каждую ячейку.
+    # Типизированное хранилище - array.array, заполненный нулями
+    def _make_array(self, new_capacity: int) -> List[T]:
+        if self._dtype is not None:
+            return _zeros(self._dtype, new_capacity)
+        return [None] * new_capacity
+
+    # Делает values хранилищем массива из length элементов без копирования.
+    # Если хранилище меньше минимальной емкости, свободные ячейки
+    # дописываются в конец
+    def _adopt(self, values, length: int) -> None:
+        if len(values) < self.MIN_CAPACITY:
+            values.extend(self._make_array(self.MIN_CAPACITY - len(values)))
+        self.array = values
+        self.length = length
+        self.capacity = len(values)
+        self._generation += 1
+
+    def _materialize(self, values: Iterable[T]):
+        if self._dtype is not None:
+            if (
+                isinstance(values, array.array)
+                and values.typecode == self._dtype
+            ):
+                return values
+            return array.array(self._dtype, values)
+        if isinstance(values, (list, tuple)):
+            return values
+        return list(values)
+
+    # Новый массив с теми же параметрами, заполненный одним срезом
+    # хранилища по позициям среза, нормализованным по длине массива.
+    # Срез любого наследника - обычный DynArray: срез SortedDynArray
+    # с отрицательным шагом не упорядочен, а MmapDynArray требует файла
+    def _get_slice(self, index: slice) -> "DynArray[T]":
+        return DynArray.from_iterable(
+            _copy_range(self.array, range(*index.indices(self.length))),
+            self.MIN_CAPACITY,
+            self._dtype,
+            self._policy,
+        )
+
+    # Выполняет task(fn, часть) для частей массива в пуле процессов
+    # и возвращает результаты в порядке частей
+    def _run_chunks(
+        self,
+        task: Callable[[Callable, Any], Any],
+        fn: Callable,
+        workers: Optional[int],
+        executor: Optional[Executor],
+    ) -> List[Any]:
+        # Процессы пула, созданные после запуска resource_tracker, используют
+        # общий с родителем трекер и не считают блок разделяемой памяти,
+        # подключенный в _shared_chunk(), своей утечкой
+        resource_tracker.ensure_running()
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        shm = None
+        try:
+            parts = 4 * (workers or os.cpu_count() or 1)
+            chunk_size = max(-(-self.length // parts), 1)
+            bounds = [
+                (start, min(start + chunk_size, self.length))
+                for start in range(0, self.length, chunk_size)
+            ]
+            if self._dtype is not None:
+                with self.buffer() as source, source.cast("B") as data:
+                    shm = shared_memory.SharedMemory(
+                        create=True, size=max(data.nbytes, 1)
+                    )
+                    shm.buf[: data.nbytes] = data
+                futures = [
+                    executor.submit(
+                        _shared_chunk, task, fn, shm.name, self._dtype, *bound
+                    )
+                    for bound in bounds
+                ]
+            else:
+                items = self._items()
+                futures = [
+                    executor.submit(task, fn, items[start:stop])
+                    for start, stop in bounds
+                ]
+            return [future.result() for future in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+    # Возвращает копию элементов массива одним срезом хранилища
+    def _items(self):
+        return self.array[: self.length]
+
+    def _grow(self, required: int) -> None:
+        self._resize(self._policy.grow(self.capacity, required))
+
+    def _resize(self, new_capacity: int) -> None:
+        new_array = self._make_array(new_capacity)
+        new_array[: self.length] = self.array[: self.length]
+        self.array = new_array
+        self.capacity = new_capacity
+        self._generation += 1
+        self._resize_count += 1
+        self._copied_count += self.length
+
+    # Освобождает позицию index, сдвигая элементы [index, length) на одну
+    # ячейку вправо. Предусловие: length < capacity, поэтому последняя
+    # ячейка свободна и переносится на место index одним memmove
+    def _shift_right(self, index: int) -> None:
+        if self._dtype is not None:
+            self._move(index + 1, index, self.length - index)
+            return
+        self.array.pop()
+        self.array.insert(index, None)
+
+    # Удаляет ячейку index, сдвигая хвост массива на одну ячейку влево,
+    # освободившаяся последняя ячейка заполняется None
+    def _shift_left(self, index: int) -> None:
+        if self._dtype is not None:
+            self._move(index, index + 1, self.length - index - 1)
+            return
+        del self.array[index]
+        self.array.append(None)
+
+    # Копирует count элементов с позиции src на позицию dst одним срезом.
+    # Для array.array это memcpy без изменения размера хранилища, поэтому
+    # сдвиг работает и при экспортированном buffer()
+    def _move(self, dst: int, src: int, count: int) -> None:
+        if count <= 0:
+            return
+        self.array[dst : dst + count] = self.array[src : src + count]
+
+
+# Формат dump(): сигнатура, версия, код типа (b"\0" для объектов),
+# признак big-endian, минимальная емкость, длина
+_DUMP_MAGIC: Final[bytes] = b"DYNA"
+# Версия 2 сохраняет хранилище массива объектов вместе со свободными
+# ячейками, версия 1 - только элементы; обе читаются одинаково
+_DUMP_VERSION: Final[int] = 2
+_DUMP_VERSIONS: Final[Tuple[int, ...]] = (1, 2)
+_DUMP_HEADER: Final[struct.Struct] = struct.Struct("<4sBc?xQQ")
+_SIZE: Final[struct.Struct] = struct.Struct("<Q")
+
+# Наибольшая часть итератора, копируемая в хранилище одним срезом
+_EXTEND_CHUNK: Final[int] = 4096
+# Признак исчерпанного итератора
+_END: Final[object] = object()
+
+
+# Возвращает array.array из size нулевых элементов типа dtype
+def _zeros(dtype: str, size: int) -> array.array:
+    return array.array(dtype, bytes(array.array(dtype).itemsize)) * size
+
+
+# Копирует ячейки store с позиций positions + offset одним срезом.
+# positions - нормализованный срез, например range(*index.indices(n));
+# границы среза хранилища берутся от первой и последней позиции, чтобы
+# при отрицательном шаге срез не уходил в свободные ячейки в конце
+def _copy_range(store, positions: range, offset: int = 0):
+    if not positions:
+        return store[0:0]
+    step = positions.step
+    start = positions[0] + offset
+    stop = positions[-1] + offset + (1 if step > 0 else -1)
+    return store[start : stop if stop >= 0 else None : step]
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Serialized DynArray is truncated")
+    return data
+
+
+def _read_size(file: BinaryIO) -> int:
+    return _SIZE.unpack(_read_exact(file, _SIZE.size))[0]
+
+
+# Задачи для процессов пула parallel_map() и parallel_reduce()
+def _map_chunk(fn: Callable, items: Iterable) -> List[Any]:
+    return list(map(fn, items))
+
+
+def _reduce_chunk(fn: Callable, items: Iterable) -> Any:
+    return functools.reduce(fn, items)
+
+
+# Выполняет task над элементами [start, stop) типизированного массива
+# из разделяемой памяти name
+def _shared_chunk(
+    task: Callable, fn: Callable, name: str, dtype: str, start: int, stop: int
+) -> Any:
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast(dtype) as values, values[start:stop] as part:
+            return task(fn, part)
+    finally:
+        shm.close()
+
+
+class DynArrayViewATD(ABC, Generic[T]):
+
+    GETITEM_NIL: Final[int] = 0  # __getitem__ не выполнялся
+    GETITEM_OK: Final[int] = 1  # __getitem__ завершился успешно
+    GETITEM_ERR_INDEX: Final[int] = 2  # __getitem__ индекс вне представления
+    GETITEM_ERR_INVALID: Final[int] = 3  # __getitem__ представление устарело
+
+    SETITEM_NIL: Final[int] = 0  # __setitem__ не выполнялся
+    SETITEM_OK: Final[int] = 1  # __setitem__ завершился успешно
+    SETITEM_ERR_INDEX: Final[int] = 2  # __setitem__ индекс вне представления
+    SETITEM_ERR_INVALID: Final[int] = 3  # __setitem__ представление устарело
+
+    # Конструктор
+    # Постусловие: создано представление элементов массива parent
+    # с позициями range(start, stop, step)
+    def __init__(
+        self,
+        parent: DynArray[T],
+        start: int,
+        stop: Optional[int],
+        step: int,
+    ) -> None:
+        pass
+
+    # Команды
+    # Предусловие: представление действительно, указанная позиция не
+    # превышает длину представления
+    # Постусловие: элемент массива в данной позиции представления
+    # заменен на новый
+    @abstractmethod
+    def __setitem__(self, index: int, value: T) -> None:
+        pass
+
+    # Запросы
+    # Предусловие: представление действительно, указанная позиция не
+    # превышает длину представления
+    @abstractmethod
+    def __getitem__(self, index: int) -> T:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    # Предусловие: представление действительно
+    # Возвращает итератор по элементам представления
+    @abstractmethod
+    def __iter__(self) -> Iterator[T]:
+        pass
+
+    # Возвращает True, если хранилище массива не заменялось
+    # и все позиции представления находятся в пределах массива
+    @abstractmethod
+    def is_valid(self) -> bool:
+        pass
+
+    # Запросы статусов
+    # Возвращает значение GETITEM_*
+    @abstractmethod
+    def get_getitem_status(self) -> int:
+        pass
+
+    # Возвращает значение SETITEM_*
+    @abstractmethod
+    def get_setitem_status(self) -> int:
+        pass
+
+
+class DynArrayView(DynArrayViewATD, Generic[T]):
+
+    # Конструктор
+    def __init__(
+        self,
+        parent: DynArray[T],
+        start: int = 0,
+        stop: Optional[int] = None,
+        step: int = 1,
+    ) -> None:
+        self._parent: DynArray[T] = parent
+        self._array = parent.array
+        self._generation: int = parent._generation
+        self._range: range = range(
+            *slice(start, stop, step).indices(len(parent))
+        )
+        # Позиции массива, которые должны существовать для действительности
+        self._bound: int = (
+            max(self._range[0], self._range[-1]) + 1 if self._range else 0
+        )
+
+        self._getitem_status: int = self.GETITEM_NIL
+        self._setitem_status: int = self.SETITEM_NIL
+
+    # Команды
+    def __setitem__(self, index: int, value: T) -> None:
+        if not self.is_valid():
+            self._setitem_status = self.SETITEM_ERR_INVALID
+            raise ValueError("View is invalidated by parent resize")
+        if index < 0 or index >= len(self._range):
+            self._setitem_status = self.SETITEM_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self._array[self._range[index]] = value
+        self._setitem_status = self.SETITEM_OK
+
+    # Запросы
+    def __getitem__(self, index: int) -> T:
+        if not self.is_valid():
+            self._getitem_status = self.GETITEM_ERR_INVALID
+            raise ValueError("View is invalidated by parent resize")
+        if index < 0 or index >= len(self._range):
+            self._getitem_status = self.GETITEM_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self._getitem_status = self.GETITEM_OK
+        return self._array[self._range[index]]
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __iter__(self) -> Iterator[T]:
+        if not self.is_valid():
+            raise ValueError("View is invalidated by parent resize")
+        if self._range.step > 0:
+            return itertools.islice(
+                self._array,
+                self._range.start,
+                self._range.stop,
+                self._range.step,
+            )
+        return map(self._array.__getitem__, self._range)
+
+    def is_valid(self) -> bool:
+        return (
+            self._parent._generation == self._generation
+            and len(self._parent) >= self._bound
+        )
+
+    # Запросы статусов
+    def get_getitem_status(self) -> int:
+        return self._getitem_status
+
+    def get_setitem_status(self) -> int:
+        return self._setitem_status
+
+
+# Динамический массив с буфером-промежутком (gap buffer).
+# Свободные ячейки хранятся не в конце, а промежутком [gap_start, gap_end)
+# в месте последней правки. Серия insert()/remove() рядом с одной позицией
+# сдвигает только элементы между старой и новой позицией промежутка
+class GapDynArray(DynArray, Generic[T]):
+
+    # Конструктор
+    def __init__(
+        self,
+        min_capacity: int = 16,
+        dtype: Optional[str] = None,
+        policy: Optional[GrowthPolicy] = None,
+    ):
+        super().__init__(min_capacity, dtype, policy)
+        self._gap_start: int = 0
+        self._gap_end: int = self.capacity
+
+    # Команды
+    def __setitem__(self, index: int, value: T) -> None:
+        if index < 0 or index >= self.length:
+            self._setitem_status = self.SETITEM_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self.array[self._physical(index)] = value
+        self._setitem_status = self.SETITEM_OK
+
+    def append(self, value: T) -> None:
+        self._put(self.length, value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        self._move_gap(self.length)
+        super().extend(values)
+        self._gap_start = self.length
+        self._gap_end = self.capacity
+
+    def remove(self, index: int) -> None:
+        if index < 0 or index >= self.length:
+            self._remove_status = self.REMOVE_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self._move_gap(index)
+        if self._dtype is None:
+            self.array[self._gap_end] = None
+        self._gap_end += 1
+        self.length -= 1
+        new_capacity = self._policy.shrink(
+            self.capacity, self.length, self.MIN_CAPACITY
+        )
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+        self._remove_status = self.REMOVE_OK
+
+    def clear(self) -> None:
+        super().clear()
+        self._gap_start = 0
+        self._gap_end = self.capacity
+
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.length:
+            self._insert_status = self.INSERT_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self._put(index, value)
+        self._insert_status = self.INSERT_OK
+
+    # Запросы
+    def __getitem__(self, index: Union[int, slice]) -> T:
+        if isinstance(index, slice):
+            self._getitem_status = self.GETITEM_OK
+            return self._get_slice(index)
+        if index < 0 or index >= self.length:
+            self._getitem_status = self.GETITEM_ERR_INDEX
+            raise IndexError("Index is out of bounds")
+        self._getitem_status = self.GETITEM_OK
+        return self.array[self._physical(index)]
+
+    def __iter__(self) -> Iterator[T]:
+        return itertools.chain(
+            itertools.islice(self.array, self._gap_start),
+            itertools.islice(self.array, self._gap_end, self.capacity),
+        )
+
+    def __reversed__(self) -> Iterator[T]:
+        return itertools.chain(
+            itertools.islice(
+                reversed(self.array), self.capacity - self._gap_end
+            ),
+            map(self.array.__getitem__, range(self._gap_start - 1, -1, -1)),
+        )
+
+    # Перед созданием представления промежуток переносится в конец, чтобы
+    # элементы шли подряд. Следующая правка делает представление
+    # недействительным
+    def view(
+        self, start: int = 0, stop: Optional[int] = None, step: int = 1
+    ) -> "DynArrayView[T]":
+        self._move_gap(self.length)
+        return super().view(start, stop, step)
+
+    # Перед получением буфера промежуток переносится в конец
+    def buffer(self) -> memoryview:
+        self._move_gap(self.length)
+        return super().buffer()
+
+    # Перед записью промежуток переносится в конец, чтобы элементы
+    # хранилища шли подряд
+    def dump(self, file: BinaryIO) -> None:
+        self._move_gap(self.length)
+        super().dump(file)
+
+    # Вспомогательный код
+    def _physical(self, index: int) -> int:
+        if index < self._gap_start:
+            return index
+        return index + self._gap_end - self._gap_start
+
+    def _put(self, index: int, value: T) -> None:
+        if self._gap_start == self._gap_end:
+            self._grow(self.length + 1)
+        self._move_gap(index)
+        self.array[self._gap_start] = value
+        self._gap_start += 1
+        self.length += 1
+
+    def _adopt(self, values, length: int) -> None:
+        super()._adopt(values, length)
+        self._gap_start = self.length
+        self._gap_end = self.capacity
+
+    # Позиции среза делятся на части до и после промежутка, каждая
+    # копируется одним срезом хранилища
+    def _get_slice(self, index: slice) -> "DynArray[T]":
+        start, stop, step = index.indices(self.length)
+        positions = range(start, stop, step)
+        gap = self._gap_end - self._gap_start
+        if step > 0:
+            split = len(range(start, min(stop, self._gap_start), step))
+            values = _copy_range(self.array, positions[:split])
+            values += _copy_range(self.array, positions[split:], gap)
+        else:
+            split = len(range(start, max(stop, self._gap_start - 1), step))
+            values = _copy_range(self.array, positions[:split], gap)
+            values += _copy_range(self.array, positions[split:])
+        return DynArray.from_iterable(
+            values, self.MIN_CAPACITY, self._dtype, self._policy
+        )
+
+    def _items(self):
+        return self.array[: self._gap_start] + self.array[self._gap_end :]
+
+    # Переносит промежуток так, чтобы он начинался с позиции index.
+    # Сдвигаются только элементы между старым и новым началом промежутка
+    def _move_gap(self, index: int) -> None:
+        if index == self._gap_start:
+            return
+        gap = self._gap_end - self._gap_start
+        if index < self._gap_start:
+            count = self._gap_start - index
+            self._move(self._gap_end - count, index, count)
+            released = index
+        else:
+            count = index - self._gap_start
+            self._move(self._gap_start, self._gap_end, count)
+            released = max(self._gap_end, index)
+        if self._dtype is None:
+            # Ячейки, оказавшиеся в промежутке, не должны удерживать объекты
+            cleared = min(count, gap)
+            self.array[released : released + cleared] = [None] * cleared
+        self._gap_start = index
+        self._gap_end = index + gap
+        self._generation += 1
 
-    def _resize(self, new_capacity):
+    # Начало берется как length - tail, а не _gap_start: extend() дописывает
+    # элементы в промежуток в конце до того, как сдвинуть его начало
+    def _resize(self, new_capacity: int) -> None:
+        tail = self.capacity - self._gap_end
+        head = self.length - tail
         new_array = self._make_array(new_capacity)
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        new_array[:head] = self.array[:head]
+        new_array[new_capacity - tail : new_capacity] = self.array[
+            self._gap_end : self.capacity
+        ]
         self.array = new_array
         self.capacity = new_capacity
+        self._gap_start = head
+        self._gap_end = new_capacity - tail
+        self._generation += 1
+        self._resize_count += 1
+        self._copied_count += self.length
+
+
+# Динамический массив, упорядоченный по неубыванию.
+# Порядок поддерживают insert_sorted() и merge_sorted(). Унаследованные
+# команды с явной позицией (append, insert, extend, __setitem__)
+# порядок не проверяют, его сохранение - ответственность вызывающего
+class SortedDynArray(DynArray, Generic[T]):
+
+    INDEX_OF_NIL: Final[int] = 0  # index_of() не выполнялся
+    INDEX_OF_OK: Final[int] = 1  # index_of() завершился успешно
+    INDEX_OF_NOT_FOUND: Final[int] = 2  # index_of() элемент не найден
+
+    MERGE_SORTED_NIL: Final[int] = 0  # merge_sorted() не выполнялся
+    MERGE_SORTED_OK: Final[int] = 1  # merge_sorted() завершился успешно
+    MERGE_SORTED_ERR_ORDER: Final[int] = (
+        2  # merge_sorted() элементы пакета не упорядочены
+    )
+
+    # Конструктор
+    def __init__(
+        self,
+        min_capacity: int = 16,
+        dtype: Optional[str] = None,
+        policy: Optional[GrowthPolicy] = None,
+    ):
+        super().__init__(min_capacity, dtype, policy)
+        self._index_of_status: int = self.INDEX_OF_NIL
+        self._merge_sorted_status: int = self.MERGE_SORTED_NIL
+
+    # Конструктор
+    # Постусловие: создан упорядоченный массив из элементов values
+    @classmethod
+    def from_iterable(
+        cls,
+        values: Iterable[T],
+        min_capacity: int = 16,
+        dtype: Optional[str] = None,
+        policy: Optional[GrowthPolicy] = None,
+    ) -> "SortedDynArray[T]":
+        result = cls(min_capacity, dtype, policy)
+        result.extend(sorted(values))
+        return result
+
+    # Конструктор
+    # Предусловие: с текущей позиции file записан массив через dump()
+    # Постусловие: создан упорядоченный массив из элементов, прочитанных
+    # из file. Данные, сохраненные из неупорядоченного массива, сортируются
+    @classmethod
+    def load(
+        cls, file: BinaryIO, policy: Optional[GrowthPolicy] = None
+    ) -> "SortedDynArray[T]":
+        result = super().load(file, policy)
+        if any(map(operator.gt, result, itertools.islice(result, 1, None))):
+            result.array[: result.length] = result._materialize(sorted(result))
+        return result
+
+    # Команды
+    # Постусловие: элемент value добавлен после всех равных ему элементов
+    def insert_sorted(self, value: T) -> None:
+        self.insert(self.upper_bound(value), value)
+
+    # Предусловие: элементы values упорядочены по неубыванию
+    # Постусловие: элементы values добавлены в массив с сохранением порядка,
+    # после равных им элементов массива
+    def merge_sorted(self, values: Iterable[T]) -> None:
+        items = values if isinstance(values, list) else list(values)
+        if any(map(operator.gt, items, itertools.islice(items, 1, None))):
+            self._merge_sorted_status = self.MERGE_SORTED_ERR_ORDER
+            raise ValueError("Values are not sorted")
+        new_length = self.length + len(items)
+        # Timsort находит в конкатенации две упорядоченные серии
+        # и сливает их за один проход O(n + m)
+        merged = sorted(itertools.chain(self, items))
+        if new_length > self.capacity:
+            self._grow(new_length)
+        self.array[:new_length] = self._materialize(merged)
+        self.length = new_length
+        self._merge_sorted_status = self.MERGE_SORTED_OK
+
+    def clear(self) -> None:
+        super().clear()
+        self._index_of_status = self.INDEX_OF_NIL
+        self._merge_sorted_status = self.MERGE_SORTED_NIL
+
+    # Запросы
+    # Предусловие: элемент value есть в массиве
+    # Возвращает позицию первого элемента, равного value
+    def index_of(self, value: T) -> int:
+        index = self.lower_bound(value)
+        if index == self.length or self.array[index] != value:
+            self._index_of_status = self.INDEX_OF_NOT_FOUND
+            raise ValueError("Value is not found")
+        self._index_of_status = self.INDEX_OF_OK
+        return index
+
+    # Возвращает позицию первого элемента, не меньшего value
+    def lower_bound(self, value: T) -> int:
+        return bisect.bisect_left(self.array, value, 0, self.length)
+
+    # Возвращает позицию первого элемента, большего value
+    def upper_bound(self, value: T) -> int:
+        return bisect.bisect_right(self.array, value, 0, self.length)
+
+    # Возвращает новый массив из элементов в полуинтервале [low, high)
+    def between(self, low: T, high: T) -> "SortedDynArray[T]":
+        start = self.lower_bound(low)
+        stop = max(start, self.lower_bound(high))
+        result = SortedDynArray(self.MIN_CAPACITY, self._dtype, self._policy)
+        result.extend(self.array[start:stop])
+        return result
+
+    # Запросы статусов
+    # Возвращает значение INDEX_OF_*
+    def get_index_of_status(self) -> int:
+        return self._index_of_status
+
+    # Возвращает значение MERGE_SORTED_*
+    def get_merge_sorted_status(self) -> int:
+        return self._merge_sorted_status
+
+
+# Типизированный динамический массив в файле, отображенном в память.
+# Файл: заголовок _MMAP_HEADER (сигнатура, код типа, длина массива),
+# затем capacity элементов фиксированного размера. Рост и сжатие -
+# ftruncate() и повторное отображение, без копирования элементов.
+# Длина массива записывается в заголовок командами flush() и close()
+class MmapDynArray(DynArray, Generic[T]):
+
+    _MMAP_MAGIC: Final[bytes] = b"DYNM"
+    _MMAP_HEADER: Final[struct.Struct] = struct.Struct("<4sc3xQ")
+
+    # Конструктор
+    # Постусловие: открыт массив из файла path, если файл не пуст,
+    # иначе создан пустой массив в этом файле
+    def __init__(
+        self,
+        path: str,
+        dtype: str,
+        min_capacity: int = 16,
+        policy: Optional[GrowthPolicy] = None,
+    ):
+        if dtype not in array.typecodes:
+            raise ValueError(f"Unknown dtype: {dtype!r}")
+        self._path: str = path
+        self._itemsize: int = array.array(dtype).itemsize
+        self._mmap: Optional[mmap.mmap] = None
+        self._fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            header = os.pread(self._fd, self._MMAP_HEADER.size, 0)
+            length = 0
+            if header:
+                length = self._check_header(header, dtype)
+            super().__init__(min_capacity, dtype, policy)
+        except BaseException:
+            self._unmap()
+            os.close(self._fd)
+            raise
+        self.length = length
+        self.capacity = len(self.array)
+
+    # Конструктор
+    # Постусловие: в файле path создан массив из элементов values
+    @classmethod
+    def from_iterable(
+        cls,
+        path: str,
+        values: Iterable[T],
+        dtype: str,
+        min_capacity: int = 16,
+        policy: Optional[GrowthPolicy] = None,
+    ) -> "MmapDynArray[T]":
+        result = cls(path, dtype, min_capacity, policy)
+        result.clear()
+        result.extend(values)
+        return result
+
+    # Массив в файле создается только по пути: load() и from_bytes()
+    # не поддерживаются, данные загружаются через DynArray.load()
+    # и переносятся в файл через from_iterable()
+    @classmethod
+    def load(
+        cls, file: BinaryIO, policy: Optional[GrowthPolicy] = None
+    ) -> "MmapDynArray[T]":
+        raise TypeError(
+            "MmapDynArray needs a path, use DynArray.load() and "
+            "MmapDynArray.from_iterable()"
+        )
+
+    # Команды
+    def clear(self) -> None:
+        self._unmap()
+        os.ftruncate(self._fd, 0)
+        super().clear()
+
+    # Постусловие: длина массива и измененные страницы записаны в файл
+    def flush(self) -> None:
+        self._MMAP_HEADER.pack_into(
+            self._mmap, 0, self._MMAP_MAGIC, self._dtype.encode(), self.length
+        )
+        self._mmap.flush()
+
+    # Постусловие: данные записаны в файл, файл закрыт,
+    # дальнейшие операции с массивом недопустимы
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        self.flush()
+        self._unmap()
+        os.close(self._fd)
+
+    def __enter__(self) -> "MmapDynArray[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Запросы
+    # Возвращает путь к файлу массива
+    def get_path(self) -> str:
+        return self._path
+
+    # Вспомогательный код
+    # Отображает файл не меньше чем на new_capacity элементов.
+    # Данные, уже записанные в файл, сохраняются
+    def _make_array(self, new_capacity: int) -> memoryview:
+        self._unmap()
+        size = os.fstat(self._fd).st_size
+        stored = max(size - self._MMAP_HEADER.size, 0) // self._itemsize
+        self._map(max(new_capacity, stored))
+        if size == 0:
+            self._MMAP_HEADER.pack_into(
+                self._mmap, 0, self._MMAP_MAGIC, self._dtype.encode(), 0
+            )
+        return self.array
+
+    # Возвращает длину массива из заголовка файла
+    def _check_header(self, header: bytes, dtype: str) -> int:
+        if len(header) == self._MMAP_HEADER.size:
+            magic, typecode, length = self._MMAP_HEADER.unpack(header)
+            if magic == self._MMAP_MAGIC and typecode == dtype.encode():
+                return length
+        raise ValueError(f"{self._path} is not a DynArray file of {dtype!r}")
+
+    def _resize(self, new_capacity: int) -> None:
+        self._unmap()
+        self._map(new_capacity)
+        self.capacity = new_capacity
+        self._generation += 1
+        self._resize_count += 1
+
+    def _map(self, capacity: int) -> None:
+        size = self._MMAP_HEADER.size + capacity * self._itemsize
+        if os.fstat(self._fd).st_size != size:
+            os.ftruncate(self._fd, size)
+        self._mmap = mmap.mmap(self._fd, size)
+        self.array = memoryview(self._mmap)[self._MMAP_HEADER.size :].cast(
+            self._dtype
+        )
+
+    # Предусловие: буферы, полученные через buffer(), освобождены
+    def _unmap(self) -> None:
+        if self._mmap is None:
+            return
+        self.array.release()
+        self._mmap.close()
+        self._mmap = None
+
+
+# Динамический массив объектов без статусов для горячих циклов.
+# Команды и запросы те же, что у DynArray, но статусы не записываются:
+# ошибки сообщаются только исключениями. __slots__ убирает словарь
+# атрибутов, поэтому обращения к полям дешевле и экземпляр меньше
+class FastDynArray(Generic[T]):
+
+    __slots__ = ("MIN_CAPACITY", "length", "capacity", "array", "_policy")
+
+    # Конструктор
+    # Постусловие: создан пустой динамический массив
+    def __init__(
+        self, min_capacity: int = 16, policy: Optional[GrowthPolicy] = None
+    ) -> None:
+        self.MIN_CAPACITY: int = min_capacity
+        self.length: int = 0
+        self.capacity: int = min_capacity
+        self.array: List[T] = [None] * min_capacity
+        self._policy: GrowthPolicy = (
+            policy if policy is not None else GeometricGrowth()
+        )
+
+    # Конструктор
+    # Постусловие: создан массив из элементов values
+    @classmethod
+    def from_iterable(
+        cls,
+        values: Iterable[T],
+        min_capacity: int = 16,
+        policy: Optional[GrowthPolicy] = None,
+    ) -> "FastDynArray[T]":
+        result = cls(min_capacity, policy)
+        result.extend(values)
+        return result
+
+    # Команды
+    # Предусловие: указанная позиция не превышает длинну массива
+    # Постусловие: элемент в данной позиции заменен на новый
+    def __setitem__(self, index: int, value: T) -> None:
+        if index < 0 or index >= self.length:
+            raise IndexError("Index is out of bounds")
+        self.array[index] = value
+
+    # Постусловие: в конец массива добавлен элемент
+    def append(self, value: T) -> None:
+        if self.length == self.capacity:
+            self._resize(self._policy.grow(self.capacity, self.length + 1))
+        self.array[self.length] = value
+        self.length += 1
+
+    # Постусловие: в конец массива в исходном порядке добавлены все
+    # элементы values
+    def extend(self, values: Iterable[T]) -> None:
+        items = values if isinstance(values, (list, tuple)) else list(values)
+        new_length = self.length + len(items)
+        if new_length > self.capacity:
+            self._resize(self._policy.grow(self.capacity, new_length))
+        self.array[self.length : new_length] = items
+        self.length = new_length
+
+    # Предусловие: указанная позиция не превышает длинну массива
+    # Постусловие: элемент из данной позиции удален и все элементы
+    # после данной позиции смещены влево
+    def remove(self, index: int) -> None:
+        if index < 0 or index >= self.length:
+            raise IndexError("Index is out of bounds")
+        del self.array[index]
+        self.array.append(None)
+        self.length -= 1
+        new_capacity = self._policy.shrink(
+            self.capacity, self.length, self.MIN_CAPACITY
+        )
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+
+    # Постусловие: массив очищен
+    def clear(self) -> None:
+        self.length = 0
+        self.capacity = self.MIN_CAPACITY
+        self.array = [None] * self.capacity
+
+    # Предусловие: указанная позиция не превышает длинну массива
+    # Постусловие: в даную позицию добавлен новый элемент и все элементы
+    # с данной позиции смещены вперед
+    def insert(self, index: int, value: T) -> None:
+        if index < 0 or index > self.length:
+            raise IndexError("Index is out of bounds")
+        if self.length == self.capacity:
+            self._resize(self._policy.grow(self.capacity, self.length + 1))
+        self.array.pop()
+        self.array.insert(index, value)
+        self.length += 1
+
+    # Постусловие: емкость массива не меньше capacity
+    def reserve(self, capacity: int) -> None:
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+    # Постусловие: емкость массива равна max(длина, минимальная емкость)
+    def shrink_to_fit(self) -> None:
+        new_capacity = max(self.length, self.MIN_CAPACITY)
+        if new_capacity != self.capacity:
+            self._resize(new_capacity)
+
+    # Запросы
+    # Предусловие: указанная позиция не превышает длинну массива
+    # Для среза возвращает новый массив из элементов среза
+    def __getitem__(self, index: Union[int, slice]) -> T:
+        if isinstance(index, slice):
+            return FastDynArray.from_iterable(
+                _copy_range(self.array, range(*index.indices(self.length))),
+                self.MIN_CAPACITY,
+                self._policy,
+            )
+        if index < 0 or index >= self.length:
+            raise IndexError("Index is out of bounds")
+        return self.array[index]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __iter__(self) -> Iterator[T]:
+        return itertools.islice(self.array, self.length)
+
+    def __reversed__(self) -> Iterator[T]:
+        return map(self.array.__getitem__, range(self.length - 1, -1, -1))
+
+    def get_min_capacity(self) -> int:
+        return self.MIN_CAPACITY
+
+    # Вспомогательный код
+    def _resize(self, new_capacity: int) -> None:
+        if new_capacity > self.capacity:
+            self.array.extend([None] * (new_capacity - self.capacity))
+        else:
+            del self.array[new_capacity:]
+        self.capacity = new_capacity
@@ -0,0 +1,326 @@
+"""Замеры производительности DynArray.
+
+Запуск: python bench_dynarray.py [имя_замера ...]
+Без аргументов выполняются все замеры.
+"""
+
+import io
+import pickle
+import sys
+import time
+from typing import Callable, Dict
+
+from DynArray import (
+    AdditiveGrowth,
+    DynArray,
+    FastDynArray,
+    GapDynArray,
+    GeometricGrowth,
+    GoldenRatioGrowth,
+    GrowthPolicy,
+    SortedDynArray,
+)
+
+
+# Эталонная реализация со сдвигом элементов по одному на уровне Python,
+# нужна только для сравнения с блочным сдвигом
+class LoopShiftDynArray(DynArray):
+
+    def _shift_right(self, index: int) -> None:
+        for j in range(self.length, index, -1):
+            self.array[j] = self.array[j - 1]
+
+    def _shift_left(self, index: int) -> None:
+        for j in range(index, self.length - 1):
+            self.array[j] = self.array[j + 1]
+        self.array[self.length - 1] = None
+
+
+def _timeit(func: Callable[[], None], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _filled(cls, size: int) -> DynArray:
+    array = cls()
+    for i in range(size):
+        array.append(i)
+    return array
+
+
+def bench_shift() -> None:
+    print("insert(0)/remove(0), мкс на операцию")
+    print(
+        f"{'size':>10} {'loop insert':>12} {'block insert':>13}"
+        f" {'loop remove':>12} {'block remove':>13}"
+    )
+    ops = 20
+    for size in (1_000, 10_000, 100_000, 1_000_000):
+        row = [f"{size:>10}"]
+        results = {}
+        for name, cls in (("loop", LoopShiftDynArray), ("block", DynArray)):
+            array = _filled(cls, size)
+
+            def do_insert() -> None:
+                for _ in range(ops):
+                    array.insert(0, -1)
+
+            def do_remove() -> None:
+                for _ in range(ops):
+                    array.remove(0)
+
+            insert_time = _timeit(do_insert, repeat=1)
+            remove_time = _timeit(do_remove, repeat=1)
+            results[name] = (
+                insert_time / ops * 1e6,
+                remove_time / ops * 1e6,
+            )
+        row.append(f"{results['loop'][0]:>12.1f}")
+        row.append(f"{results['block'][0]:>13.1f}")
+        row.append(f"{results['loop'][1]:>12.1f}")
+        row.append(f"{results['block'][1]:>13.1f}")
+        print(" ".join(row))
+
+
+def bench_extend() -> None:
+    print("Загрузка N элементов, мс")
+    print(f"{'size':>10} {'append':>10} {'extend':>10}")
+    for size in (10_000, 100_000, 1_000_000):
+        source = list(range(size))
+        append_time = _timeit(lambda: _filled(DynArray, size))
+        extend_time = _timeit(lambda: DynArray.from_iterable(source))
+        print(
+            f"{size:>10} {append_time * 1e3:>10.1f}"
+            f" {extend_time * 1e3:>10.1f}"
+        )
+
+
+def bench_policy() -> None:
+    print("Политики емкости: рост до N, колебания у границы, сжатие")
+    print(f"{'policy':>22} {'resizes':>8} {'copied':>10} {'ms':>8}")
+    policies: Dict[str, GrowthPolicy] = {
+        "geometric x2": GeometricGrowth(),
+        "geometric hysteresis": GeometricGrowth(
+            shrink_threshold=0.25, shrink_factor=2
+        ),
+        "golden ratio": GoldenRatioGrowth(),
+        "additive 4096": AdditiveGrowth(step=4096),
+    }
+    size = 100_000
+    for name, policy in policies.items():
+        array = DynArray(policy=policy)
+
+        def workload() -> None:
+            for i in range(size):
+                array.append(i)
+            # Колебания длины вокруг половины емкости
+            while len(array) >= array.capacity // 2:
+                array.remove(len(array) - 1)
+            for _ in range(10_000):
+                array.append(0)
+                array.remove(len(array) - 1)
+                array.remove(len(array) - 1)
+                array.append(0)
+            while len(array) > 0:
+                array.remove(len(array) - 1)
+
+        elapsed = _timeit(workload, repeat=1)
+        print(
+            f"{name:>22} {array.get_resize_count():>8}"
+            f" {array.get_copied_count():>10} {elapsed * 1e3:>8.1f}"
+        )
+
+
+def bench_iterate() -> None:
+    print("Обход массива, мс")
+    print(f"{'size':>10} {'getitem':>10} {'iter':>10} {'reversed':>10}")
+    for size in (10_000, 100_000, 1_000_000):
+        array = DynArray.from_iterable(range(size))
+
+        def by_index() -> None:
+            for i in range(len(array)):
+                array[i]
+
+        def by_iter() -> None:
+            for _ in array:
+                pass
+
+        def by_reversed() -> None:
+            for _ in reversed(array):
+                pass
+
+        print(
+            f"{size:>10} {_timeit(by_index) * 1e3:>10.1f}"
+            f" {_timeit(by_iter) * 1e3:>10.1f}"
+            f" {_timeit(by_reversed) * 1e3:>10.1f}"
+        )
+
+
+def bench_gap() -> None:
+    print("Серии правок у курсора в середине массива, мс")
+    print(f"{'size':>10} {'DynArray':>10} {'GapDynArray':>12}")
+    for size in (10_000, 100_000, 1_000_000):
+        row = [f"{size:>10}"]
+        for cls in (DynArray, GapDynArray):
+            array = cls.from_iterable(range(size))
+
+            def workload() -> None:
+                cursor = size // 2
+                # 100 серий: ввод 20 символов и удаление 10 назад,
+                # затем перемещение курсора
+                for burst in range(100):
+                    for i in range(20):
+                        array.insert(cursor, i)
+                        cursor += 1
+                    for _ in range(10):
+                        cursor -= 1
+                        array.remove(cursor)
+                    cursor += 50 if burst % 2 else -40
+
+            row.append(f"{_timeit(workload, repeat=1) * 1e3:>10.1f}")
+        print(row[0], row[1], f"{row[2]:>12}")
+
+
+def bench_sorted() -> None:
+    print("Слияние упорядоченного пакета из m элементов в массив из n, мс")
+    print(f"{'n':>10} {'m':>8} {'insert_sorted':>14} {'merge_sorted':>13}")
+    for size, batch in (
+        (100_000, 1_000),
+        (100_000, 10_000),
+        (1_000_000, 10_000),
+    ):
+        values = list(range(0, 2 * size, 2))
+        incoming = list(range(1, 2 * batch * 10, 20))[:batch]
+        row = [f"{size:>10}", f"{batch:>8}"]
+        for method in ("insert_sorted", "merge_sorted"):
+            array = SortedDynArray.from_iterable(values)
+            if method == "insert_sorted":
+
+                def workload() -> None:
+                    for value in incoming:
+                        array.insert_sorted(value)
+
+            else:
+
+                def workload() -> None:
+                    array.merge_sorted(incoming)
+
+            row.append(f"{_timeit(workload, repeat=1) * 1e3:>13.1f}")
+        print(" ".join(row))
+
+
+def _heavy(value: float) -> float:
+    result = value
+    for _ in range(200):
+        result = (result * 1.000001 + 1.0) % 1e9
+    return result
+
+
+def bench_parallel() -> None:
+    print("Отображение CPU-емкой функцией, мс")
+    print(f"{'size':>10} {'dtype':>6} {'sequential':>11} {'parallel':>10}")
+    for size in (10_000, 100_000):
+        for dtype in (None, "d"):
+            array = DynArray.from_iterable(
+                map(float, range(size)), dtype=dtype
+            )
+            sequential = _timeit(
+                lambda: DynArray.from_iterable(map(_heavy, array)), repeat=1
+            )
+            parallel = _timeit(
+                lambda: array.parallel_map(_heavy, dtype=dtype), repeat=1
+            )
+            print(
+                f"{size:>10} {str(dtype):>6} {sequential * 1e3:>11.1f}"
+                f" {parallel * 1e3:>10.1f}"
+            )
+
+
+def bench_serialize() -> None:
+    print("Сохранение и загрузка массива, мс / размер, МБ")
+    print(
+        f"{'size':>10} {'dtype':>6} {'pickle':>10} {'dump':>10}"
+        f" {'unpickle':>10} {'load':>10} {'MB pickle':>10} {'MB dump':>8}"
+    )
+    for size in (100_000, 1_000_000):
+        for dtype in (None, "q"):
+            array = DynArray.from_iterable(range(size), dtype=dtype)
+            pickled = pickle.dumps(array)
+            dumped = array.to_bytes()
+            pickle_time = _timeit(lambda: pickle.dumps(array), repeat=1)
+            dump_time = _timeit(lambda: array.dump(io.BytesIO()), repeat=1)
+            unpickle_time = _timeit(lambda: pickle.loads(pickled), repeat=1)
+            load_time = _timeit(lambda: DynArray.from_bytes(dumped), repeat=1)
+            print(
+                f"{size:>10} {str(dtype):>6} {pickle_time * 1e3:>10.1f}"
+                f" {dump_time * 1e3:>10.1f} {unpickle_time * 1e3:>10.1f}"
+                f" {load_time * 1e3:>10.1f} {len(pickled) / 2**20:>10.1f}"
+                f" {len(dumped) / 2**20:>8.1f}"
+            )
+
+
+def bench_fast() -> None:
+    print("Горячие циклы без статусов, нс на операцию")
+    print(
+        f"{'operation':>12} {'DynArray':>10} {'FastDynArray':>13}"
+        f" {'saving':>8}"
+    )
+    size = 100_000
+    results: Dict[str, list] = {}
+    for cls in (DynArray, FastDynArray):
+        array = cls.from_iterable(range(size))
+
+        def read() -> None:
+            for i in range(size):
+                array[i]
+
+        def write() -> None:
+            for i in range(size):
+                array[i] = i
+
+        def append() -> None:
+            fresh = cls()
+            for i in range(size):
+                fresh.append(i)
+
+        def edit() -> None:
+            for _ in range(1_000):
+                array.insert(size - 10, 0)
+                array.remove(size - 10)
+
+        for name, func, ops in (
+            ("__getitem__", read, size),
+            ("__setitem__", write, size),
+            ("append", append, size),
+            ("insert+remove", edit, 1_000),
+        ):
+            results.setdefault(name, []).append(_timeit(func) / ops * 1e9)
+    for name, (slow, fast) in results.items():
+        print(
+            f"{name:>12} {slow:>10.1f} {fast:>13.1f}"
+            f" {(1 - fast / slow) * 100:>7.0f}%"
+        )
+
+
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    "shift": bench_shift,
+    "extend": bench_extend,
+    "policy": bench_policy,
+    "iterate": bench_iterate,
+    "gap": bench_gap,
+    "sorted": bench_sorted,
+    "parallel": bench_parallel,
+    "serialize": bench_serialize,
+    "fast": bench_fast,
+}
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+        print()
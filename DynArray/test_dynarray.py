@@ -1,7 +1,16 @@
+import io
+import pickle
+import struct
 import unittest
+import weakref
 from typing import Any
 
-from DynArray import DynArray
+from DynArray import (
+    AdditiveGrowth,
+    DynArray,
+    GeometricGrowth,
+    GoldenRatioGrowth,
+)
 
 
 class TestDynArray(unittest.TestCase):
@@ -422,6 +431,392 @@ class TestDynArray(unittest.TestCase):
         self.assertEqual(arr.capacity, 5)
         self.assertEqual(len(arr), 0)
 
+    def test_block_shift(self):
+        """Тест блочного сдвига при insert и remove."""
+        arr = DynArray[int](min_capacity=4)
+        for i in range(1000):
+            arr.insert(0, i)
+        self.assertEqual(len(arr), 1000)
+        for i in range(1000):
+            self.assertEqual(arr[i], 999 - i)
+
+        arr.insert(500, -1)
+        self.assertEqual(arr[499], 500)
+        self.assertEqual(arr[500], -1)
+        self.assertEqual(arr[501], 499)
+
+        arr.remove(500)
+        for i in range(1000):
+            self.assertEqual(arr[i], 999 - i)
+
+        for i in range(999):
+            arr.remove(0)
+        self.assertEqual(len(arr), 1)
+        self.assertEqual(arr[0], 0)
+
+    def test_remove_releases_reference(self):
+        """Тест освобождения ссылки на удаленный элемент."""
+
+        class Item:
+            pass
+
+        arr = DynArray[Item](min_capacity=4)
+        item = Item()
+        ref = weakref.ref(item)
+        arr.append(item)
+        arr.append(Item())
+        del item
+
+        arr.remove(0)
+        self.assertIsNone(ref())
+
+    def test_extend(self):
+        """Тест добавления последовательности элементов."""
+        self.array.append(1)
+        self.array.extend([2, 3])
+        self.assertEqual(len(self.array), 3)
+        self.assertEqual(self.array.capacity, 4)
+
+        # Одно расширение на весь пакет по length_hint итератора
+        self.array.extend(iter(range(4, 21)))
+        self.assertEqual(len(self.array), 20)
+        self.assertEqual(self.array.capacity, 20)
+        for i in range(20):
+            self.assertEqual(self.array[i], i + 1)
+
+        # Пустой пакет
+        self.array.extend(())
+        self.assertEqual(len(self.array), 20)
+
+        # После extend массив работает как обычно
+        self.array.append(21)
+        self.assertEqual(self.array.capacity, 40)
+        self.array.remove(0)
+        self.assertEqual(self.array[0], 2)
+
+    def test_extend_iterator(self):
+        """Тест добавления элементов итератора без подсказки длины."""
+        # Генератор длиннее части _EXTEND_CHUNK, хранилище растет по мере
+        # чтения
+        self.array.extend(i for i in range(10_000))
+        self.assertEqual(len(self.array), 10_000)
+        self.assertEqual(self.array.capacity, 16_384)
+        self.assertEqual(list(self.array), list(range(10_000)))
+
+        # Итератор, заполняющий хранилище ровно до конца, не растит его
+        exact = DynArray[int](min_capacity=4)
+        exact.extend(i for i in range(4))
+        self.assertEqual(exact.capacity, 4)
+        self.assertEqual(list(exact), [0, 1, 2, 3])
+
+        typed = DynArray[int](dtype="q")
+        typed.extend(i * 2 for i in range(5_000))
+        self.assertEqual(typed[4_999], 9_998)
+        self.assertEqual(len(typed), 5_000)
+
+    def test_from_iterable(self):
+        """Тест создания массива из последовательности."""
+        arr = DynArray.from_iterable(range(100), min_capacity=8)
+        self.assertEqual(len(arr), 100)
+        self.assertEqual(arr.get_min_capacity(), 8)
+        self.assertEqual(arr.capacity, 100)
+        for i in range(100):
+            self.assertEqual(arr[i], i)
+
+        empty = DynArray.from_iterable([])
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.capacity, 16)
+
+    def test_typed_array(self):
+        """Тест типизированного массива."""
+        arr = DynArray[float](min_capacity=2, dtype="d")
+        self.assertEqual(arr.get_dtype(), "d")
+        self.assertIsNone(self.array.get_dtype())
+
+        for i in range(10):
+            arr.append(i / 2)
+        arr.insert(0, -1.0)
+        arr.remove(5)
+        arr[1] = 0.25
+        self.assertEqual(len(arr), 10)
+        self.assertEqual(
+            [arr[i] for i in range(len(arr))],
+            [-1.0, 0.25, 0.5, 1.0, 1.5, 2.5, 3.0, 3.5, 4.0, 4.5],
+        )
+        self.assertEqual(arr.array.itemsize, 8)
+
+        # Значение неподходящего типа
+        with self.assertRaises(TypeError):
+            arr.append("x")
+
+        arr.extend(range(3))
+        self.assertEqual(arr[12], 2.0)
+
+        arr.clear()
+        self.assertEqual(len(arr), 0)
+        self.assertEqual(arr.get_dtype(), "d")
+
+        # Неизвестный код типа
+        with self.assertRaises(ValueError):
+            DynArray(dtype="z")
+
+    def test_buffer(self):
+        """Тест получения буфера без копирования."""
+        arr = DynArray.from_iterable(range(5), dtype="q")
+        view = arr.buffer()
+        self.assertEqual(view.format, "q")
+        self.assertEqual(view.tolist(), [0, 1, 2, 3, 4])
+
+        # Буфер отражает изменения без копирования,
+        # insert и remove работают при экспортированном буфере
+        arr[0] = 10
+        arr.insert(1, 20)
+        arr.remove(2)
+        self.assertEqual(view.tolist(), [10, 20, 2, 3, 4])
+        view.release()
+
+        # Буфер доступен только типизированному массиву
+        with self.assertRaises(TypeError):
+            self.array.buffer()
+
+    def test_resize_counters(self):
+        """Тест счетчиков перевыделений и копирований."""
+        arr = DynArray[int](min_capacity=4)
+        self.assertEqual(arr.get_resize_count(), 0)
+        self.assertEqual(arr.get_copied_count(), 0)
+
+        for i in range(9):  # 4 -> 8 -> 16
+            arr.append(i)
+        self.assertEqual(arr.get_resize_count(), 2)
+        self.assertEqual(arr.get_copied_count(), 4 + 8)
+
+    def test_reserve_and_shrink_to_fit(self):
+        """Тест резервирования и подгонки емкости."""
+        arr = DynArray[int](min_capacity=4)
+        arr.reserve(100)
+        self.assertEqual(arr.capacity, 100)
+
+        # Емкость не уменьшается
+        arr.reserve(10)
+        self.assertEqual(arr.capacity, 100)
+
+        # Заполнение в пределах резерва не перевыделяет хранилище
+        for i in range(100):
+            arr.append(i)
+        self.assertEqual(arr.get_resize_count(), 1)
+
+        arr.clear()
+        arr.extend(range(10))
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 10)
+        self.assertEqual(arr[9], 9)
+
+        # Не меньше минимальной емкости
+        arr.clear()
+        arr.append(1)
+        arr.shrink_to_fit()
+        self.assertEqual(arr.capacity, 4)
+
+    def test_hysteresis_policy(self):
+        """Тест отсутствия перевыделений при колебаниях у границы."""
+        arr = DynArray[int](
+            min_capacity=4,
+            policy=GeometricGrowth(shrink_threshold=0.25, shrink_factor=2),
+        )
+        for i in range(17):  # 4 -> 8 -> 16 -> 32
+            arr.append(i)
+        self.assertEqual(arr.capacity, 32)
+        resizes = arr.get_resize_count()
+
+        for _ in range(100):
+            arr.remove(len(arr) - 1)
+            arr.append(0)
+        self.assertEqual(arr.get_resize_count(), resizes)
+
+        # Сжатие при заполнении меньше четверти
+        while len(arr) >= 8:
+            arr.remove(0)
+        self.assertEqual(arr.capacity, 16)
+
+    def test_golden_ratio_policy(self):
+        """Тест роста в золотое сечение."""
+        arr = DynArray[int](min_capacity=10, policy=GoldenRatioGrowth())
+        for i in range(11):
+            arr.append(i)
+        self.assertEqual(arr.capacity, 16)
+        self.assertEqual(len(arr), 11)
+
+    def test_additive_policy(self):
+        """Тест роста на фиксированный шаг."""
+        arr = DynArray[int](min_capacity=4, policy=AdditiveGrowth(step=10))
+        for i in range(5):
+            arr.append(i)
+        self.assertEqual(arr.capacity, 14)
+
+        arr.extend(range(25))
+        self.assertEqual(arr.capacity, 34)
+
+        # Сжатие, когда свободно больше двух шагов
+        while len(arr) > 14:
+            arr.remove(0)
+        self.assertEqual(arr.capacity, 34)
+        arr.remove(0)
+        self.assertEqual(arr.capacity, 24)
+
+    def test_policy_validation(self):
+        """Тест проверки параметров политик."""
+        with self.assertRaises(ValueError):
+            GeometricGrowth(factor=1)
+        with self.assertRaises(ValueError):
+            GeometricGrowth(shrink_threshold=1)
+        with self.assertRaises(ValueError):
+            GeometricGrowth(shrink_factor=0.5)
+        with self.assertRaises(ValueError):
+            AdditiveGrowth(step=0)
+
+    def test_iteration(self):
+        """Тест прямого и обратного обхода."""
+        self.assertEqual(list(self.array), [])
+        self.assertEqual(list(reversed(self.array)), [])
+
+        for i in range(10):
+            self.array.append(i)
+        self.assertEqual(list(self.array), list(range(10)))
+        self.assertEqual(list(reversed(self.array)), list(range(9, -1, -1)))
+        self.assertIn(5, self.array)
+
+        # Обход не меняет статусы
+        self.assertEqual(self.array.get_getitem_status(), DynArray.GETITEM_NIL)
+
+        typed = DynArray.from_iterable(range(5), dtype="q")
+        self.assertEqual(list(typed), [0, 1, 2, 3, 4])
+        self.assertEqual(list(reversed(typed)), [4, 3, 2, 1, 0])
+
+        # Обратный обход не зависит от свободных ячеек в конце хранилища
+        sparse = DynArray.from_iterable([1, 2])
+        sparse.reserve(1000)
+        self.assertEqual(list(reversed(sparse)), [2, 1])
+        self.assertEqual(list(reversed(DynArray())), [])
+
+    def test_slice(self):
+        """Тест получения среза."""
+        for i in range(10):
+            self.array.append(i)
+
+        part = self.array[2:5]
+        self.assertIsInstance(part, DynArray)
+        self.assertEqual(list(part), [2, 3, 4])
+        self.assertEqual(part.get_min_capacity(), 4)
+        self.assertEqual(self.array.get_getitem_status(), DynArray.GETITEM_OK)
+
+        self.assertEqual(list(self.array[::3]), [0, 3, 6, 9])
+        self.assertEqual(list(self.array[::-1]), list(range(9, -1, -1)))
+        self.assertEqual(list(self.array[5:1:-2]), [5, 3])
+        self.assertEqual(list(self.array[-2:]), [8, 9])
+        self.assertEqual(list(self.array[8:100]), [8, 9])
+        self.assertEqual(len(self.array[5:5]), 0)
+
+        # Пустые срезы с отрицательным шагом не захватывают свободные ячейки
+        self.assertEqual(list(DynArray()[::-1]), [])
+        self.assertEqual(list(self.array[-20::-1]), [])
+        self.assertEqual(list(self.array[-10:-20:-1]), [0])
+        self.assertEqual(list(self.array[2::-1]), [2, 1, 0])
+        typed_empty = DynArray.from_iterable([1, 2, 3], dtype="q")
+        self.assertEqual(list(typed_empty[-5::-1]), [])
+
+        # Срезы совпадают со срезами list при свободной емкости
+        values = list(range(7))
+        sparse = DynArray.from_iterable(values)
+        sparse.reserve(64)
+        bounds = (None, -9, -3, 0, 2, 6, 9)
+        for start in bounds:
+            for stop in bounds:
+                for step in (None, 1, 2, -1, -3):
+                    index = slice(start, stop, step)
+                    self.assertEqual(list(sparse[index]), values[index])
+
+        # Срез - независимая копия
+        part[0] = 100
+        self.assertEqual(self.array[2], 2)
+
+        typed = DynArray.from_iterable(range(5), dtype="d")
+        typed_part = typed[1:3]
+        self.assertEqual(typed_part.get_dtype(), "d")
+        self.assertEqual(list(typed_part), [1.0, 2.0])
+
+    def test_bytes_roundtrip(self):
+        """Тест сериализации массива объектов."""
+        arr = DynArray.from_iterable(
+            [1, "two", (3, 4), None, bytearray(b"five")], min_capacity=3
+        )
+        restored = DynArray.from_bytes(arr.to_bytes())
+        self.assertEqual(list(restored), list(arr))
+        self.assertEqual(restored.get_min_capacity(), 3)
+        self.assertIsNone(restored.get_dtype())
+
+        empty = DynArray.from_bytes(DynArray().to_bytes())
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.capacity, 16)
+
+        # Загруженное хранилище работает как обычное
+        restored.append(6)
+        restored.insert(0, 0)
+        self.assertEqual(restored[0], 0)
+        self.assertEqual(restored[6], 6)
+        self.assertEqual(len(restored), 7)
+
+    def test_bytes_roundtrip_typed(self):
+        """Тест сериализации типизированного массива."""
+        arr = DynArray.from_iterable(range(1000), dtype="q")
+        data = arr.to_bytes()
+        # Заголовок и хранилище одним блоком
+        self.assertEqual(len(data), 24 + 1000 * 8)
+
+        restored = DynArray.from_bytes(data, policy=GoldenRatioGrowth())
+        self.assertEqual(restored.get_dtype(), "q")
+        self.assertEqual(list(restored), list(range(1000)))
+
+    def test_bytes_byteorder(self):
+        """Тест чтения массива с другим порядком байтов."""
+        data = bytearray(DynArray.from_iterable([1, 2], dtype="i").to_bytes())
+        data[6] = not data[6]
+        data[24:] = data[27:23:-1] + data[31:27:-1]
+        restored = DynArray.from_bytes(bytes(data))
+        self.assertEqual(list(restored), [1, 2])
+
+    def test_load_version_1(self):
+        """Тест чтения формата, где сохранены только элементы."""
+        data = bytearray(DynArray.from_iterable(["a", "b"]).to_bytes())
+        data[4] = 1
+        payload = pickle.dumps(["a", "b"], protocol=5)
+        data[24:] = (
+            struct.pack("<Q", len(payload)) + payload + struct.pack("<Q", 0)
+        )
+        restored = DynArray.from_bytes(bytes(data))
+        self.assertEqual(list(restored), ["a", "b"])
+        self.assertEqual(restored.capacity, 16)
+
+    def test_dump_load(self):
+        """Тест записи нескольких массивов в один поток."""
+        stream = io.BytesIO()
+        DynArray.from_iterable(["a", "b"]).dump(stream)
+        DynArray.from_iterable([0.5], dtype="d").dump(stream)
+
+        stream.seek(0)
+        self.assertEqual(list(DynArray.load(stream)), ["a", "b"])
+        self.assertEqual(list(DynArray.load(stream)), [0.5])
+
+    def test_load_invalid(self):
+        """Тест чтения некорректных данных."""
+        with self.assertRaises(ValueError):
+            DynArray.from_bytes(b"not a dynarray at all, really")
+
+        data = DynArray.from_iterable(range(10), dtype="q").to_bytes()
+        with self.assertRaises(ValueError):
+            DynArray.from_bytes(data[:-1])
+        with self.assertRaises(ValueError):
+            DynArray.from_bytes(data[:10])
+
 
 if __name__ == "__main__":
     # Запуск всех тестов
@@ -0,0 +1,119 @@
+import unittest
+
+from DynArray import DynArray, DynArrayView
+
+
+class TestDynArrayView(unittest.TestCase):
+
+    def setUp(self):
+        """Настройка перед каждым тестом."""
+        self.array = DynArray[int](min_capacity=16)
+        for i in range(10):
+            self.array.append(i)
+
+    def test_constructor(self):
+        """Тест создания представления."""
+        view = self.array.view(2, 8, 2)
+        self.assertIsInstance(view, DynArrayView)
+        self.assertEqual(len(view), 3)
+        self.assertTrue(view.is_valid())
+        self.assertEqual(view.get_getitem_status(), DynArrayView.GETITEM_NIL)
+        self.assertEqual(view.get_setitem_status(), DynArrayView.SETITEM_NIL)
+
+        # Границы нормализуются как у среза
+        self.assertEqual(len(self.array.view()), 10)
+        self.assertEqual(len(self.array.view(5, 100)), 5)
+        self.assertEqual(len(self.array.view(-3)), 3)
+        self.assertEqual(len(self.array.view(7, 3)), 0)
+
+    def test_getitem(self):
+        """Тест чтения через представление."""
+        view = self.array.view(2, 8, 2)
+        self.assertEqual([view[i] for i in range(len(view))], [2, 4, 6])
+        self.assertEqual(view.get_getitem_status(), DynArrayView.GETITEM_OK)
+
+        with self.assertRaises(IndexError):
+            view[3]
+        self.assertEqual(
+            view.get_getitem_status(), DynArrayView.GETITEM_ERR_INDEX
+        )
+
+        with self.assertRaises(IndexError):
+            view[-1]
+        self.assertEqual(
+            view.get_getitem_status(), DynArrayView.GETITEM_ERR_INDEX
+        )
+
+    def test_setitem(self):
+        """Тест записи через представление в исходный массив."""
+        view = self.array.view(5)
+        view[0] = 50
+        self.assertEqual(self.array[5], 50)
+        self.assertEqual(view.get_setitem_status(), DynArrayView.SETITEM_OK)
+
+        # Изменения массива видны в представлении
+        self.array[6] = 60
+        self.assertEqual(view[1], 60)
+
+        with self.assertRaises(IndexError):
+            view[5] = 0
+        self.assertEqual(
+            view.get_setitem_status(), DynArrayView.SETITEM_ERR_INDEX
+        )
+
+    def test_iteration(self):
+        """Тест обхода представления."""
+        self.assertEqual(list(self.array.view(1, 4)), [1, 2, 3])
+        self.assertEqual(list(self.array.view(0, 10, 3)), [0, 3, 6, 9])
+        self.assertEqual(list(self.array.view(8, 2, -2)), [8, 6, 4])
+        self.assertEqual(list(self.array.view(None, None, -1))[:2], [9, 8])
+        self.assertEqual(list(self.array.view(4, 4)), [])
+
+    def test_invalidated_by_resize(self):
+        """Тест недействительности после замены хранилища."""
+        view = self.array.view(0, 5)
+        for i in range(7):  # 16 -> 32
+            self.array.append(i)
+        self.assertFalse(view.is_valid())
+
+        with self.assertRaises(ValueError):
+            view[0]
+        self.assertEqual(
+            view.get_getitem_status(), DynArrayView.GETITEM_ERR_INVALID
+        )
+        with self.assertRaises(ValueError):
+            view[0] = 1
+        self.assertEqual(
+            view.get_setitem_status(), DynArrayView.SETITEM_ERR_INVALID
+        )
+        with self.assertRaises(ValueError):
+            list(view)
+
+    def test_invalidated_by_clear(self):
+        """Тест недействительности после очистки массива."""
+        view = self.array.view(0, 1)
+        self.array.clear()
+        self.assertFalse(view.is_valid())
+
+    def test_invalidated_by_shortening(self):
+        """Тест недействительности, когда массив стал короче представления."""
+        view = self.array.view(5, 10)
+        self.array.remove(0)
+        self.assertFalse(view.is_valid())
+
+        # Представление, не выходящее за длину массива, действительно
+        view = self.array.view(0, 5)
+        self.array.remove(8)
+        self.assertTrue(view.is_valid())
+
+    def test_typed_array(self):
+        """Тест представления типизированного массива."""
+        typed = DynArray.from_iterable(range(6), dtype="d")
+        view = typed.view(3)
+        self.assertEqual(list(view), [3.0, 4.0, 5.0])
+        view[0] = 0.5
+        self.assertEqual(typed[3], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
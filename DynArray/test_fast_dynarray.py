@@ -0,0 +1,109 @@
+import unittest
+
+from DynArray import AdditiveGrowth, FastDynArray
+
+
+class TestFastDynArray(unittest.TestCase):
+
+    def setUp(self):
+        """Настройка перед каждым тестом."""
+        self.array = FastDynArray[int](min_capacity=4)
+
+    def test_constructor(self):
+        """Тест конструктора."""
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(self.array.get_min_capacity(), 4)
+        self.assertEqual(self.array.capacity, 4)
+
+        # Экземпляр без словаря атрибутов
+        self.assertFalse(hasattr(self.array, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.array.extra = 1
+
+    def test_commands(self):
+        """Тест команд."""
+        for i in range(5):
+            self.array.append(i)
+        self.array.insert(0, -1)
+        self.array.insert(6, 5)
+        self.array.remove(3)
+        self.array[0] = 10
+        self.assertEqual(list(self.array), [10, 0, 1, 3, 4, 5])
+        self.assertEqual(list(reversed(self.array)), [5, 4, 3, 1, 0, 10])
+        self.assertEqual(self.array.capacity, 8)
+
+        self.array.extend(range(6, 10))
+        self.assertEqual(len(self.array), 10)
+        self.assertEqual(self.array[9], 9)
+
+        self.array.clear()
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(self.array.capacity, 4)
+
+    def test_index_errors(self):
+        """Тест исключений при выходе индекса за пределы массива."""
+        self.array.append(1)
+        with self.assertRaises(IndexError):
+            self.array[1]
+        with self.assertRaises(IndexError):
+            self.array[-1]
+        with self.assertRaises(IndexError):
+            self.array[1] = 0
+        with self.assertRaises(IndexError):
+            self.array.insert(2, 0)
+        with self.assertRaises(IndexError):
+            self.array.remove(1)
+
+    def test_capacity(self):
+        """Тест изменения емкости."""
+        for i in range(9):
+            self.array.append(i)
+        self.assertEqual(self.array.capacity, 16)
+        while len(self.array) >= 8:
+            self.array.remove(0)
+        self.assertEqual(self.array.capacity, 10)
+
+        self.array.reserve(50)
+        self.assertEqual(self.array.capacity, 50)
+        self.array.shrink_to_fit()
+        self.assertEqual(self.array.capacity, 7)
+        self.assertEqual(list(self.array), [2, 3, 4, 5, 6, 7, 8])
+
+    def test_policy(self):
+        """Тест политики емкости."""
+        arr = FastDynArray[int](min_capacity=2, policy=AdditiveGrowth(3))
+        arr.extend(range(4))
+        self.assertEqual(arr.capacity, 5)
+
+    def test_slice(self):
+        """Тест получения среза."""
+        arr = FastDynArray.from_iterable(range(10))
+        part = arr[7:2:-2]
+        self.assertIsInstance(part, FastDynArray)
+        self.assertEqual(list(part), [7, 5, 3])
+        self.assertEqual(list(arr[::-1]), list(range(9, -1, -1)))
+        self.assertEqual(list(arr[-20::-1]), [])
+        self.assertEqual(list(FastDynArray()[::-1]), [])
+        short = FastDynArray.from_iterable([1, 2, 3])
+        self.assertEqual(list(short[-10:-20:-1]), [])
+
+        # Срезы совпадают со срезами list при свободной емкости
+        values = list(range(7))
+        sparse = FastDynArray.from_iterable(values)
+        sparse.reserve(64)
+        bounds = (None, -9, -3, 0, 2, 6, 9)
+        for start in bounds:
+            for stop in bounds:
+                for step in (None, 1, 2, -1, -3):
+                    index = slice(start, stop, step)
+                    self.assertEqual(list(sparse[index]), values[index])
+
+    def test_reversed(self):
+        """Тест обратного обхода при свободной емкости."""
+        arr = FastDynArray.from_iterable([1, 2])
+        arr.reserve(1000)
+        self.assertEqual(list(reversed(arr)), [2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
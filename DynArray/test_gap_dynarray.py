@@ -0,0 +1,193 @@
+import unittest
+import weakref
+
+from DynArray import DynArray, GapDynArray
+
+
+class TestGapDynArray(unittest.TestCase):
+
+    def setUp(self):
+        """Настройка перед каждым тестом."""
+        self.array = GapDynArray[int](min_capacity=4)
+
+    def test_constructor(self):
+        """Тест конструктора."""
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(self.array.get_min_capacity(), 4)
+        self.assertEqual(self.array.get_insert_status(), DynArray.INSERT_NIL)
+        self.assertEqual(self.array.get_remove_status(), DynArray.REMOVE_NIL)
+
+    def test_clustered_edits(self):
+        """Тест серии правок рядом с одной позицией."""
+        self.array.extend(range(10))
+
+        # Набор текста в середине
+        for i in range(5):
+            self.array.insert(5 + i, 100 + i)
+        self.assertEqual(
+            list(self.array),
+            [0, 1, 2, 3, 4, 100, 101, 102, 103, 104, 5, 6, 7, 8, 9],
+        )
+        self.assertEqual(self.array.get_insert_status(), DynArray.INSERT_OK)
+
+        # Удаление назад от позиции курсора
+        for i in range(3):
+            self.array.remove(9 - i)
+        self.assertEqual(
+            list(self.array), [0, 1, 2, 3, 4, 100, 101, 5, 6, 7, 8, 9]
+        )
+        self.assertEqual(self.array.get_remove_status(), DynArray.REMOVE_OK)
+
+        # Правка в другом месте
+        self.array.insert(0, -1)
+        self.array.append(10)
+        self.assertEqual(self.array[0], -1)
+        self.assertEqual(self.array[6], 100)
+        self.assertEqual(self.array[13], 10)
+        self.assertEqual(len(self.array), 14)
+
+    def test_index_errors(self):
+        """Тест выхода индекса за пределы массива."""
+        self.array.extend([1, 2, 3])
+        self.array.insert(1, 5)
+
+        with self.assertRaises(IndexError):
+            self.array[4]
+        self.assertEqual(
+            self.array.get_getitem_status(), DynArray.GETITEM_ERR_INDEX
+        )
+        with self.assertRaises(IndexError):
+            self.array[4] = 0
+        self.assertEqual(
+            self.array.get_setitem_status(), DynArray.SETITEM_ERR_INDEX
+        )
+        with self.assertRaises(IndexError):
+            self.array.insert(5, 0)
+        self.assertEqual(
+            self.array.get_insert_status(), DynArray.INSERT_ERR_INDEX
+        )
+        with self.assertRaises(IndexError):
+            self.array.remove(4)
+        self.assertEqual(
+            self.array.get_remove_status(), DynArray.REMOVE_ERR_INDEX
+        )
+
+    def test_setitem_getitem(self):
+        """Тест доступа по индексу по обе стороны промежутка."""
+        self.array.extend(range(6))
+        self.array.insert(3, 30)
+        self.array[2] = 20
+        self.array[5] = 50
+        self.assertEqual(self.array[2], 20)
+        self.assertEqual(self.array[3], 30)
+        self.assertEqual(self.array[5], 50)
+        self.assertEqual(list(self.array), [0, 1, 20, 30, 3, 50, 5])
+        self.assertEqual(list(reversed(self.array)), [5, 50, 3, 30, 20, 1, 0])
+        self.assertEqual(list(self.array[1:6:2]), [1, 30, 50])
+
+    def test_extend_iterator(self):
+        """Тест добавления итератора с ростом хранилища по ходу чтения."""
+        self.array.extend([1, 2, 3])
+        self.array.insert(1, 10)
+        self.array.extend(i for i in range(100, 10_100))
+        self.assertEqual(len(self.array), 10_004)
+        self.assertEqual(list(self.array[:6]), [1, 10, 2, 3, 100, 101])
+        self.assertEqual(self.array[10_003], 10_099)
+        self.array.insert(2, 0)
+        self.assertEqual(list(self.array[:4]), [1, 10, 0, 2])
+
+    def test_slice_across_gap(self):
+        """Тест срезов при промежутке в середине хранилища."""
+        for dtype in (None, "q"):
+            array = GapDynArray[int](min_capacity=4, dtype=dtype)
+            array.extend([0, 1, 2, 4, 5, 6])
+            array.insert(3, 3)
+            values = list(range(7))
+            bounds = (None, -9, -3, 0, 2, 3, 4, 6, 9)
+            for start in bounds:
+                for stop in bounds:
+                    for step in (None, 1, 2, -1, -2, -4):
+                        index = slice(start, stop, step)
+                        self.assertEqual(list(array[index]), values[index])
+
+    def test_bytes_roundtrip(self):
+        """Тест загрузки массива с промежутком."""
+        self.array.extend([1, 2, 3])
+        self.array.insert(1, 10)
+        restored = GapDynArray.from_bytes(self.array.to_bytes())
+        self.assertEqual(list(restored), [1, 10, 2, 3])
+        restored.insert(2, 20)
+        self.assertEqual(list(restored), [1, 10, 20, 2, 3])
+
+    def test_reverse_slice(self):
+        """Тест среза с отрицательным шагом при промежутке в конце."""
+        self.assertEqual(list(self.array[::-1]), [])
+        self.array.extend([1, 2, 3])
+        self.assertEqual(list(self.array[-5::-1]), [])
+        self.assertEqual(list(self.array[::-1]), [3, 2, 1])
+
+    def test_reversed_large_gap(self):
+        """Тест обратного обхода при большом промежутке."""
+        self.array.extend([1, 2, 3])
+        self.array.insert(1, 10)
+        self.array.reserve(1000)
+        self.assertEqual(list(reversed(self.array)), [3, 2, 10, 1])
+
+    def test_capacity(self):
+        """Тест роста и сжатия емкости."""
+        for i in range(9):
+            self.array.insert(i // 2, i)
+        self.assertEqual(self.array.capacity, 16)
+        self.assertEqual(len(self.array), 9)
+
+        while len(self.array) >= 8:
+            self.array.remove(3)
+        self.assertEqual(self.array.capacity, 10)
+        self.assertEqual(len(self.array), 7)
+
+        self.array.clear()
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(self.array.capacity, 4)
+        self.array.append(1)
+        self.assertEqual(list(self.array), [1])
+
+    def test_gap_releases_references(self):
+        """Тест освобождения ссылок в промежутке."""
+
+        class Item:
+            pass
+
+        items = [Item() for _ in range(6)]
+        refs = [weakref.ref(item) for item in items]
+        self.array.extend(items)
+        self.array.insert(1, Item())
+        self.array.remove(4)
+        del items
+
+        self.assertIsNone(refs[3]())
+        self.array.insert(5, Item())
+        self.array.insert(0, Item())
+        self.assertEqual(sum(ref() is None for ref in refs), 1)
+
+    def test_view(self):
+        """Тест представления над массивом с промежутком."""
+        self.array.extend(range(6))
+        self.array.insert(2, 10)
+        view = self.array.view(1, 4)
+        self.assertEqual(list(view), [1, 10, 2])
+
+        # Правка переносит промежуток и делает представление устаревшим
+        self.array.insert(0, 5)
+        self.assertFalse(view.is_valid())
+
+    def test_typed_array(self):
+        """Тест типизированного массива с промежутком."""
+        arr = GapDynArray.from_iterable(range(5), dtype="q")
+        arr.insert(2, 9)
+        arr.remove(0)
+        self.assertEqual(list(arr), [1, 9, 2, 3, 4])
+        self.assertEqual(arr.buffer().tolist(), [1, 9, 2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+from DynArray import DynArray, MmapDynArray
+
+
+class TestMmapDynArray(unittest.TestCase):
+
+    def setUp(self):
+        """Настройка перед каждым тестом."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "array.bin")
+        self.array = MmapDynArray[int](self.path, "q", min_capacity=4)
+
+    def tearDown(self):
+        self.array.close()
+        self.tmpdir.cleanup()
+
+    def test_constructor(self):
+        """Тест создания массива в файле."""
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(self.array.capacity, 4)
+        self.assertEqual(self.array.get_dtype(), "q")
+        self.assertEqual(self.array.get_path(), self.path)
+        self.assertEqual(os.path.getsize(self.path), 16 + 4 * 8)
+
+    def test_operations(self):
+        """Тест команд и запросов DynArray."""
+        for i in range(10):
+            self.array.append(i)
+        self.array.insert(0, -1)
+        self.array.remove(5)
+        self.array[1] = 100
+        self.assertEqual(list(self.array), [-1, 100, 1, 2, 3, 5, 6, 7, 8, 9])
+        self.assertEqual(list(reversed(self.array))[:2], [9, 8])
+        self.assertEqual(list(self.array[2:5]), [1, 2, 3])
+        self.assertEqual(self.array.get_insert_status(), DynArray.INSERT_OK)
+
+        with self.assertRaises(IndexError):
+            self.array[10]
+        with self.assertRaises(TypeError):
+            self.array.append("x")
+
+    def test_resize_changes_file(self):
+        """Тест роста и сжатия файла без копирования элементов."""
+        self.array.extend(range(9))
+        self.assertEqual(self.array.capacity, 9)
+        self.assertEqual(os.path.getsize(self.path), 16 + 9 * 8)
+        self.assertEqual(self.array.get_copied_count(), 0)
+
+        while len(self.array) > 1:
+            self.array.remove(0)
+        self.assertEqual(self.array[0], 8)
+        self.assertEqual(
+            os.path.getsize(self.path), 16 + self.array.capacity * 8
+        )
+
+        self.array.clear()
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(os.path.getsize(self.path), 16 + 4 * 8)
+
+    def test_reopen(self):
+        """Тест повторного открытия файла."""
+        self.array.extend(range(100))
+        self.array.flush()
+
+        with MmapDynArray[int](self.path, "q") as reopened:
+            self.assertEqual(len(reopened), 100)
+            self.assertEqual(reopened.capacity, self.array.capacity)
+            self.assertEqual(list(reopened), list(range(100)))
+
+        self.array.close()
+        with MmapDynArray[int](self.path, "q") as reopened:
+            reopened.append(100)
+        with MmapDynArray[int](self.path, "q") as reopened:
+            self.assertEqual(len(reopened), 101)
+            self.assertEqual(reopened[100], 100)
+
+    def test_wrong_file(self):
+        """Тест открытия файла другого типа."""
+        self.array.close()
+        with self.assertRaises(ValueError):
+            MmapDynArray(self.path, "d")
+
+        other = os.path.join(self.tmpdir.name, "other.bin")
+        with open(other, "wb") as file:
+            file.write(b"not an array file")
+        with self.assertRaises(ValueError):
+            MmapDynArray(other, "q")
+        # Чужой файл не изменяется
+        with open(other, "rb") as file:
+            self.assertEqual(file.read(), b"not an array file")
+
+        with self.assertRaises(ValueError):
+            MmapDynArray(other, "z")
+
+    def test_from_iterable(self):
+        """Тест создания массива в файле из последовательности."""
+        path = os.path.join(self.tmpdir.name, "values.bin")
+        with MmapDynArray.from_iterable(path, range(5), "d") as arr:
+            self.assertEqual(list(arr), [0.0, 1.0, 2.0, 3.0, 4.0])
+            self.assertEqual(arr.buffer().tolist(), list(arr))
+
+    def test_load_unsupported(self):
+        """Тест отказа загрузки без пути к файлу."""
+        data = self.array.to_bytes()
+        with self.assertRaises(TypeError):
+            MmapDynArray.from_bytes(data)
+        self.assertEqual(list(DynArray.from_bytes(data)), [])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+import operator
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from DynArray import DynArray
+
+
+def square(value):
+    return value * value
+
+
+def label(value):
+    return f"item-{value}"
+
+
+class TestParallelDynArray(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_parallel_map(self):
+        """Тест параллельного отображения массива объектов."""
+        arr = DynArray.from_iterable(range(1000))
+        result = arr.parallel_map(square, executor=self.executor)
+        self.assertIsInstance(result, DynArray)
+        self.assertEqual(list(result), [i * i for i in range(1000)])
+        self.assertIsNone(result.get_dtype())
+
+        labels = arr[:3].parallel_map(label, executor=self.executor)
+        self.assertEqual(list(labels), ["item-0", "item-1", "item-2"])
+
+    def test_parallel_map_typed(self):
+        """Тест отображения типизированного массива через общую память."""
+        arr = DynArray.from_iterable(range(1000), dtype="q")
+        result = arr.parallel_map(square, dtype="q", executor=self.executor)
+        self.assertEqual(result.get_dtype(), "q")
+        self.assertEqual(list(result), [i * i for i in range(1000)])
+
+    def test_parallel_map_own_pool(self):
+        """Тест отображения с собственным пулом процессов."""
+        arr = DynArray.from_iterable([1.5, 2.5], dtype="d")
+        result = arr.parallel_map(square, workers=2, dtype="d")
+        self.assertEqual(list(result), [2.25, 6.25])
+
+    def test_parallel_map_empty(self):
+        """Тест отображения пустого массива."""
+        self.assertEqual(
+            len(DynArray().parallel_map(square, executor=self.executor)), 0
+        )
+        typed = DynArray(dtype="q")
+        self.assertEqual(
+            len(typed.parallel_map(square, executor=self.executor)), 0
+        )
+
+    def test_parallel_reduce(self):
+        """Тест параллельной свертки."""
+        arr = DynArray.from_iterable(range(1, 1001))
+        self.assertEqual(
+            arr.parallel_reduce(operator.add, executor=self.executor), 500500
+        )
+
+        typed = DynArray.from_iterable(range(1, 1001), dtype="q")
+        self.assertEqual(
+            typed.parallel_reduce(max, executor=self.executor), 1000
+        )
+
+        # Порядок частей сохраняется
+        words = DynArray.from_iterable(list("parallel"))
+        self.assertEqual(
+            words.parallel_reduce(operator.add, executor=self.executor),
+            "parallel",
+        )
+
+    def test_parallel_reduce_empty(self):
+        """Тест свертки пустого массива."""
+        with self.assertRaises(ValueError):
+            DynArray().parallel_reduce(operator.add, executor=self.executor)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,142 @@
+import unittest
+
+from DynArray import DynArray, SortedDynArray
+
+
+class TestSortedDynArray(unittest.TestCase):
+
+    def setUp(self):
+        """Настройка перед каждым тестом."""
+        self.array = SortedDynArray[int](min_capacity=4)
+
+    def test_constructor(self):
+        """Тест конструктора."""
+        self.assertEqual(len(self.array), 0)
+        self.assertEqual(
+            self.array.get_index_of_status(), SortedDynArray.INDEX_OF_NIL
+        )
+        self.assertEqual(
+            self.array.get_merge_sorted_status(),
+            SortedDynArray.MERGE_SORTED_NIL,
+        )
+
+        arr = SortedDynArray.from_iterable([5, 1, 4, 1, 3])
+        self.assertEqual(list(arr), [1, 1, 3, 4, 5])
+
+    def test_insert_sorted(self):
+        """Тест вставки с сохранением порядка."""
+        for value in [5, 1, 4, 1, 5, 9, 2, 6]:
+            self.array.insert_sorted(value)
+        self.assertEqual(list(self.array), [1, 1, 2, 4, 5, 5, 6, 9])
+
+    def test_insert_sorted_stable(self):
+        """Тест вставки после равных элементов."""
+        arr = SortedDynArray[tuple]()
+        arr.insert_sorted((1, "a"))
+        arr.insert_sorted((0, "b"))
+        arr.insert_sorted((1,))
+        self.assertEqual(list(arr), [(0, "b"), (1,), (1, "a")])
+
+    def test_index_of(self):
+        """Тест поиска позиции элемента."""
+        self.array.merge_sorted([1, 3, 3, 3, 7])
+        self.assertEqual(self.array.index_of(3), 1)
+        self.assertEqual(
+            self.array.get_index_of_status(), SortedDynArray.INDEX_OF_OK
+        )
+        self.assertEqual(self.array.index_of(7), 4)
+
+        for missing in (0, 2, 8):
+            with self.assertRaises(ValueError):
+                self.array.index_of(missing)
+            self.assertEqual(
+                self.array.get_index_of_status(),
+                SortedDynArray.INDEX_OF_NOT_FOUND,
+            )
+
+    def test_bounds(self):
+        """Тест поиска границ диапазона."""
+        self.array.merge_sorted([1, 3, 3, 3, 7])
+        self.assertEqual(self.array.lower_bound(3), 1)
+        self.assertEqual(self.array.upper_bound(3), 4)
+        self.assertEqual(self.array.lower_bound(0), 0)
+        self.assertEqual(self.array.upper_bound(10), 5)
+        self.assertEqual(self.array.lower_bound(5), 4)
+        self.assertEqual(self.array.upper_bound(5), 4)
+
+    def test_between(self):
+        """Тест выборки диапазона."""
+        self.array.merge_sorted(range(0, 20, 2))
+        part = self.array.between(5, 11)
+        self.assertIsInstance(part, SortedDynArray)
+        self.assertEqual(list(part), [6, 8, 10])
+        self.assertEqual(list(self.array.between(11, 5)), [])
+        self.assertEqual(list(self.array.between(-5, 3)), [0, 2])
+
+    def test_merge_sorted(self):
+        """Тест слияния упорядоченного пакета."""
+        self.array.merge_sorted([2, 4, 6])
+        self.array.merge_sorted([1, 4, 5, 10, 11, 12])
+        self.assertEqual(list(self.array), [1, 2, 4, 4, 5, 6, 10, 11, 12])
+        self.assertEqual(len(self.array), 9)
+        self.assertEqual(
+            self.array.get_merge_sorted_status(),
+            SortedDynArray.MERGE_SORTED_OK,
+        )
+
+        self.array.merge_sorted([])
+        self.assertEqual(len(self.array), 9)
+
+    def test_merge_sorted_unordered(self):
+        """Тест отказа слияния неупорядоченного пакета."""
+        self.array.merge_sorted([1, 2])
+        with self.assertRaises(ValueError):
+            self.array.merge_sorted([5, 3])
+        self.assertEqual(
+            self.array.get_merge_sorted_status(),
+            SortedDynArray.MERGE_SORTED_ERR_ORDER,
+        )
+        self.assertEqual(list(self.array), [1, 2])
+
+    def test_bytes_roundtrip(self):
+        """Тест загрузки упорядоченного массива."""
+        self.array.merge_sorted([1, 2, 3])
+        restored = SortedDynArray.from_bytes(self.array.to_bytes())
+        self.assertIsInstance(restored, SortedDynArray)
+        self.assertEqual(list(restored), [1, 2, 3])
+
+        # Данные неупорядоченного массива сортируются при загрузке
+        data = DynArray.from_iterable([3, 1, 2], dtype="q").to_bytes()
+        restored = SortedDynArray.from_bytes(data)
+        self.assertEqual(list(restored), [1, 2, 3])
+        self.assertEqual(restored.index_of(2), 1)
+
+    def test_slice(self):
+        """Тест среза - обычного массива без упорядоченности."""
+        self.array.merge_sorted([1, 2, 3])
+        part = self.array[::-1]
+        self.assertIs(type(part), DynArray)
+        self.assertEqual(list(part), [3, 2, 1])
+
+    def test_typed_array(self):
+        """Тест упорядоченного типизированного массива."""
+        arr = SortedDynArray[float](dtype="d")
+        arr.merge_sorted([0.5, 1.5])
+        arr.insert_sorted(1.0)
+        arr.merge_sorted([0.0, 2.0])
+        self.assertEqual(list(arr), [0.0, 0.5, 1.0, 1.5, 2.0])
+        self.assertEqual(arr.index_of(1.5), 3)
+
+    def test_clear(self):
+        """Тест сброса статусов при очистке."""
+        with self.assertRaises(ValueError):
+            self.array.merge_sorted([3, 1])
+        self.array.clear()
+        self.assertEqual(
+            self.array.get_merge_sorted_status(),
+            SortedDynArray.MERGE_SORTED_NIL,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,5 +1,29 @@
+import asyncio
+import collections
+import mmap
+import multiprocessing
+import os
+import pickle
+import struct
+import sys
+import time
+import zlib
 from abc import ABC, abstractmethod
-from typing import Final, Generic, List, TypeVar
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.context import BaseContext
+from multiprocessing.synchronize import Lock
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 T = TypeVar("T")
 
@@ -16,6 +40,12 @@ class QueueATD(ABC, Generic[T]):
     FIRST_OK: Final[int] = 1  # first() завершилась успешно
     FIRST_EMPTY: Final[int] = 2  # first() ошибка выполнения над пустым списком
 
+    DEQUEUE_MANY_NIL: Final[int] = 0  # dequeue_many() не выполнялась
+    DEQUEUE_MANY_OK: Final[int] = 1  # dequeue_many() завершилась успешно
+    DEQUEUE_MANY_ERR_COUNT: Final[int] = (
+        2  # dequeue_many() в очереди меньше n элементов или n < 0
+    )
+
     # Постусловие: создана пустая очередь
     def __init__(self):
         pass
@@ -32,6 +62,19 @@ class QueueATD(ABC, Generic[T]):
     def dequeue(self) -> None:
         pass
 
+    @abstractmethod
+    # Постусловие: в конец очереди в исходном порядке добавлены
+    # все элементы values
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        pass
+
+    @abstractmethod
+    # Предусловие: в очереди не меньше n элементов
+    # Постусловие: из очереди удалены n первых элементов
+    # Возвращает удаленные элементы в порядке очереди
+    def dequeue_many(self, n: int) -> List[T]:
+        pass
+
     # Запросы
     # Предусловие: очередь не пуста
     @abstractmethod
@@ -53,14 +96,39 @@ class QueueATD(ABC, Generic[T]):
     def get_first_status(self) -> int:
         pass
 
+    # Возвращает значение DEQUEUE_MANY_*
+    @abstractmethod
+    def get_dequeue_many_status(self) -> int:
+        pass
+
+
+# Сведения о памяти очереди
+class QueueMemoryStats(NamedTuple):
+    size: int  # элементов в очереди
+    dead: int  # ячеек удаленного префикса, еще не отданных списком
+    slots: int  # ячеек в списке, живых и удаленных
+    list_bytes: int  # размер списка без самих элементов
+    compactions: int  # сколько раз префикс отрезался
+
 
+# Элементы лежат в списке в ячейках _begin + 1 .. _end. dequeue() только
+# сдвигает _begin и обнуляет ячейку, чтобы не держать ссылку на элемент.
+# Когда удаленный префикс длиннее COMPACT_MIN и занимает больше половины
+# списка, он отрезается: сдвиг оставшихся оплачивается удаленными
+# элементами, поэтому dequeue() остается O(1) амортизированно, а память
+# списка не растет при сбалансированном потоке
 class Queue(QueueATD, Generic[T]):
+
+    COMPACT_MIN: Final[int] = 32
+
     def __init__(self) -> None:
         self._queue: List[T] = []
         self._begin: int = -1
         self._end: int = -1
+        self._compactions: int = 0
         self._dequeue_status: int = self.DEQUEUE_NIL
         self._first_status: int = self.FIRST_NIL
+        self._dequeue_many_status: int = self.DEQUEUE_MANY_NIL
 
     def enqueue(self, value: T) -> None:
         self._queue.append(value)
@@ -71,7 +139,33 @@ class Queue(QueueATD, Generic[T]):
             self._dequeue_status = self.DEQUEUE_EMPTY
             raise IndexError("Queue is empty")
         self._begin += 1
+        self._queue[self._begin] = None
         self._dequeue_status = self.DEQUEUE_OK
+        dead = self._begin + 1
+        if dead > self.COMPACT_MIN and 2 * dead > len(self._queue):
+            self._compact()
+
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        length = len(self._queue)
+        self._queue.extend(values)
+        self._end += len(self._queue) - length
+
+    # Одна проверка и один срез на пакет; ячейки пакета либо отрезаются
+    # вместе с удаленным префиксом, либо обнуляются одним присваиванием
+    def dequeue_many(self, n: int) -> List[T]:
+        if n < 0 or n > self._end - self._begin:
+            self._dequeue_many_status = self.DEQUEUE_MANY_ERR_COUNT
+            raise IndexError("Not enough elements in queue")
+        start = self._begin + 1
+        values = self._queue[start : start + n]
+        self._begin += n
+        dead = self._begin + 1
+        if dead > self.COMPACT_MIN and 2 * dead > len(self._queue):
+            self._compact()
+        else:
+            self._queue[start : start + n] = [None] * n
+        self._dequeue_many_status = self.DEQUEUE_MANY_OK
+        return values
 
     def first(self) -> T:
         if self._begin == self._end:
@@ -83,8 +177,1003 @@ class Queue(QueueATD, Generic[T]):
     def size(self) -> int:
         return self._end - self._begin
 
+    # Возвращает сведения о памяти очереди
+    def memory_stats(self) -> QueueMemoryStats:
+        return QueueMemoryStats(
+            size=self.size(),
+            dead=self._begin + 1,
+            slots=len(self._queue),
+            list_bytes=sys.getsizeof(self._queue),
+            compactions=self._compactions,
+        )
+
+    def get_dequeue_status(self) -> int:
+        return self._dequeue_status
+
+    def get_first_status(self) -> int:
+        return self._first_status
+
+    def get_dequeue_many_status(self) -> int:
+        return self._dequeue_many_status
+
+    # Отрезает удаленный префикс, список сам уменьшает выделенную память
+    def _compact(self) -> None:
+        dead = self._begin + 1
+        del self._queue[:dead]
+        self._begin -= dead
+        self._end -= dead
+        self._compactions += 1
+
+
+# Очередь между процессами одного хоста в блоке разделяемой памяти.
+# Блок: заголовок с емкостью, размером ячейки и счетчиками head и tail,
+# затем кольцо из capacity ячеек фиксированного размера. Счетчики только
+# растут, элемент с номером k лежит в ячейке k % capacity, длина
+# очереди - tail - head. Счетчики и ячейки меняются под общей
+# multiprocessing.Lock: без конкуренции ее захват - атомарная операция
+# без системного вызова. bytes хранятся как есть, остальные значения -
+# через pickle. Статусы у каждого процесса свои.
+# Экземпляр передается в дочерний процесс как аргумент Process и там
+# подключается к тому же блоку по имени.
+class SharedMemoryQueue(QueueATD, Generic[T]):
+
+    ENQUEUE_NIL: Final[int] = 0  # enqueue() не выполнялась
+    ENQUEUE_OK: Final[int] = 1  # enqueue() завершилась успешно
+    ENQUEUE_ERR_FULL: Final[int] = 2  # enqueue() очередь заполнена
+    ENQUEUE_ERR_TOO_LARGE: Final[int] = 3  # enqueue() элемент больше ячейки
+
+    _MAGIC: Final[bytes] = b"SMQ1"
+    # magic, емкость, размер ячейки, head, tail
+    _HEADER: Final[struct.Struct] = struct.Struct("<4s4xQQQQ")
+    _COUNTERS: Final[struct.Struct] = struct.Struct("<QQ")
+    _COUNTERS_OFFSET: Final[int] = 24
+    # Длина данных и признак pickle в начале ячейки
+    _SLOT_HEADER: Final[struct.Struct] = struct.Struct("<I?3x")
+    _SLOTS_OFFSET: Final[int] = 64
+
+    # Предусловие: capacity > 0, slot_size > размера заголовка ячейки
+    # Постусловие: создан блок разделяемой памяти name (без имени -
+    # со случайным) с пустой очередью на capacity элементов, каждый
+    # сериализованный элемент не длиннее slot_size - 8 байт. Блокировка
+    # создается в context - том же, что и процессы, получающие очередь
+    def __init__(
+        self,
+        capacity: int = 1024,
+        slot_size: int = 256,
+        name: Optional[str] = None,
+        context: Optional[BaseContext] = None,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if slot_size <= self._SLOT_HEADER.size:
+            raise ValueError("slot_size is too small")
+        # Дочерние процессы, созданные после запуска resource_tracker,
+        # используют общий с родителем трекер и не считают подключенный
+        # блок своей утечкой
+        resource_tracker.ensure_running()
+        size = self._SLOTS_OFFSET + capacity * slot_size
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=size
+        )
+        self._HEADER.pack_into(
+            self._shm.buf, 0, self._MAGIC, capacity, slot_size, 0, 0
+        )
+        self._lock: Lock = (context or multiprocessing).Lock()
+        self._init_state(capacity, slot_size)
+
+    # Возвращает очередь, подключенную к существующему блоку name,
+    # с блокировкой lock из создавшего блок процесса
+    @classmethod
+    def attach(cls, name: str, lock: Lock) -> "SharedMemoryQueue[T]":
+        queue = cls.__new__(cls)
+        queue._shm = shared_memory.SharedMemory(name=name)
+        magic, capacity, slot_size, _, _ = cls._HEADER.unpack_from(
+            queue._shm.buf
+        )
+        if magic != cls._MAGIC:
+            queue._shm.close()
+            raise ValueError(f"{name} is not a SharedMemoryQueue block")
+        queue._lock = lock
+        queue._init_state(capacity, slot_size)
+        return queue
+
+    # Команды
+    # Постусловие: если в очереди есть место и элемент помещается в
+    # ячейку, он добавлен в конец очереди
+    def enqueue(self, value: T) -> None:
+        slot = self._encode(value)
+        if slot is None:
+            return
+        with self._lock:
+            head, tail = self._counters()
+            if tail - head == self._capacity:
+                self._enqueue_status = self.ENQUEUE_ERR_FULL
+                return
+            self._write_slot(tail, slot)
+            self._set_counters(head, tail + 1)
+        self._enqueue_status = self.ENQUEUE_OK
+
+    def dequeue(self) -> None:
+        with self._lock:
+            head, tail = self._counters()
+            if head == tail:
+                self._dequeue_status = self.DEQUEUE_EMPTY
+                raise IndexError("Queue is empty")
+            self._set_counters(head + 1, tail)
+        self._dequeue_status = self.DEQUEUE_OK
+
+    # Постусловие: если места хватает на все values и каждый помещается
+    # в ячейку, все они добавлены в конец очереди, иначе ни один;
+    # статус ENQUEUE_*
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        slots = []
+        for value in values:
+            slot = self._encode(value)
+            if slot is None:
+                return
+            slots.append(slot)
+        with self._lock:
+            head, tail = self._counters()
+            if tail - head + len(slots) > self._capacity:
+                self._enqueue_status = self.ENQUEUE_ERR_FULL
+                return
+            for index, slot in enumerate(slots):
+                self._write_slot(tail + index, slot)
+            self._set_counters(head, tail + len(slots))
+        self._enqueue_status = self.ENQUEUE_OK
+
+    def dequeue_many(self, n: int) -> List[T]:
+        with self._lock:
+            head, tail = self._counters()
+            if n < 0 or n > tail - head:
+                self._dequeue_many_status = self.DEQUEUE_MANY_ERR_COUNT
+                raise IndexError("Not enough elements in queue")
+            slots = [self._read_slot(head + index) for index in range(n)]
+            self._set_counters(head + n, tail)
+        self._dequeue_many_status = self.DEQUEUE_MANY_OK
+        return [self._decode(slot) for slot in slots]
+
+    # Постусловие: отображение блока закрыто, очередь в этом процессе
+    # больше недоступна; блок и очередь в других процессах не меняются
+    def close(self) -> None:
+        self._shm.close()
+
+    # Постусловие: блок удален из системы, когда его закроют все процессы.
+    # Вызывается один раз, обычно создавшим очередь процессом
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedMemoryQueue[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Запросы
+    def first(self) -> T:
+        with self._lock:
+            head, tail = self._counters()
+            if head == tail:
+                self._first_status = self.FIRST_EMPTY
+                raise IndexError("Queue is empty")
+            slot = self._read_slot(head)
+        self._first_status = self.FIRST_OK
+        return self._decode(slot)
+
+    def size(self) -> int:
+        with self._lock:
+            head, tail = self._counters()
+        return tail - head
+
+    # Возвращает имя блока разделяемой памяти для attach()
+    def get_name(self) -> str:
+        return self._shm.name
+
+    # Возвращает блокировку очереди для attach()
+    def get_lock(self) -> Lock:
+        return self._lock
+
+    # Возвращает максимальное число элементов в очереди
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    # Возвращает наибольшую длину сериализованного элемента
+    def get_item_size(self) -> int:
+        return self._slot_size - self._SLOT_HEADER.size
+
+    # Запросы статусов
     def get_dequeue_status(self) -> int:
         return self._dequeue_status
 
     def get_first_status(self) -> int:
         return self._first_status
+
+    def get_dequeue_many_status(self) -> int:
+        return self._dequeue_many_status
+
+    # Возвращает значение ENQUEUE_*
+    def get_enqueue_status(self) -> int:
+        return self._enqueue_status
+
+    # Вспомогательный код
+    # Передача в другой процесс: там очередь подключается к блоку по имени
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self).attach, (self._shm.name, self._lock))
+
+    def _init_state(self, capacity: int, slot_size: int) -> None:
+        self._capacity: int = capacity
+        self._slot_size: int = slot_size
+        self._enqueue_status: int = self.ENQUEUE_NIL
+        self._dequeue_status: int = self.DEQUEUE_NIL
+        self._first_status: int = self.FIRST_NIL
+        self._dequeue_many_status: int = self.DEQUEUE_MANY_NIL
+
+    # Вызываются под блокировкой
+    def _counters(self) -> Tuple[int, int]:
+        return self._COUNTERS.unpack_from(self._shm.buf, self._COUNTERS_OFFSET)
+
+    def _set_counters(self, head: int, tail: int) -> None:
+        self._COUNTERS.pack_into(
+            self._shm.buf, self._COUNTERS_OFFSET, head, tail
+        )
+
+    def _write_slot(self, number: int, slot: Tuple[bytes, bool]) -> None:
+        data, pickled = slot
+        offset = self._SLOTS_OFFSET + number % self._capacity * self._slot_size
+        self._SLOT_HEADER.pack_into(self._shm.buf, offset, len(data), pickled)
+        start = offset + self._SLOT_HEADER.size
+        self._shm.buf[start : start + len(data)] = data
+
+    def _read_slot(self, number: int) -> Tuple[bytes, bool]:
+        offset = self._SLOTS_OFFSET + number % self._capacity * self._slot_size
+        length, pickled = self._SLOT_HEADER.unpack_from(self._shm.buf, offset)
+        start = offset + self._SLOT_HEADER.size
+        return bytes(self._shm.buf[start : start + length]), pickled
+
+    # Возвращает содержимое ячейки для value или None, если оно
+    # не помещается в ячейку
+    def _encode(self, value: T) -> Optional[Tuple[bytes, bool]]:
+        if type(value) is bytes:
+            slot = (value, False)
+        else:
+            slot = (pickle.dumps(value, pickle.HIGHEST_PROTOCOL), True)
+        if len(slot[0]) > self._slot_size - self._SLOT_HEADER.size:
+            self._enqueue_status = self.ENQUEUE_ERR_TOO_LARGE
+            return None
+        return slot
+
+    def _decode(self, slot: Tuple[bytes, bool]) -> T:
+        data, pickled = slot
+        return pickle.loads(data) if pickled else data
+
+
+# Очередь с приоритетами на двоичной куче в массиве. Меньшее значение
+# приоритета - более срочный элемент; при равных приоритетах соблюдается
+# порядок добавления. Элемент кучи - список [приоритет, номер, значение],
+# _index хранит позицию каждого значения в куче, поэтому значения должны
+# быть хешируемыми и различными. enqueue_many() принимает пары
+# (значение, приоритет), dequeue_many() возвращает значения по срочности.
+class PriorityQueue(QueueATD, Generic[T]):
+
+    ENQUEUE_NIL: Final[int] = 0  # enqueue() не выполнялась
+    ENQUEUE_OK: Final[int] = 1  # enqueue() завершилась успешно
+    ENQUEUE_ERR_DUPLICATE: Final[int] = 2  # enqueue() значение уже в очереди
+
+    DECREASE_KEY_NIL: Final[int] = 0  # decrease_key() не выполнялась
+    DECREASE_KEY_OK: Final[int] = 1  # decrease_key() завершилась успешно
+    DECREASE_KEY_NOT_FOUND: Final[int] = 2  # decrease_key() значения нет
+    DECREASE_KEY_ERR_PRIORITY: Final[int] = (
+        3  # decrease_key() новый приоритет менее срочный, чем текущий
+    )
+
+    def __init__(self) -> None:
+        self._heap: List[list] = []
+        self._index: Dict[T, int] = {}
+        self._counter: int = 0
+        self._enqueue_status: int = self.ENQUEUE_NIL
+        self._decrease_key_status: int = self.DECREASE_KEY_NIL
+        self._dequeue_status: int = self.DEQUEUE_NIL
+        self._first_status: int = self.FIRST_NIL
+        self._dequeue_many_status: int = self.DEQUEUE_MANY_NIL
+
+    # Конструктор
+    # Предусловие: значения в pairs различны
+    # Постусловие: создана очередь из пар (значение, приоритет) за O(n)
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[T, Any]]) -> "PriorityQueue[T]":
+        queue = cls()
+        queue._load(pairs)
+        if len(queue._index) != len(queue._heap):
+            raise ValueError("Values of priority queue must be distinct")
+        queue._heapify()
+        return queue
+
+    # Команды
+    # Предусловие: значения value нет в очереди
+    # Постусловие: value добавлено в очередь с приоритетом priority
+    def enqueue(self, value: T, priority: Any = 0) -> None:
+        if value in self._index:
+            self._enqueue_status = self.ENQUEUE_ERR_DUPLICATE
+            return
+        self._heap.append([priority, self._counter, value])
+        self._counter += 1
+        self._index[value] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+        self._enqueue_status = self.ENQUEUE_OK
+
+    # Предусловие: очередь не пуста
+    # Постусловие: из очереди удален самый срочный элемент
+    def dequeue(self) -> None:
+        if not self._heap:
+            self._dequeue_status = self.DEQUEUE_EMPTY
+            raise IndexError("Queue is empty")
+        self._pop()
+        self._dequeue_status = self.DEQUEUE_OK
+
+    # Предусловие: значений из pairs нет в очереди, они различны
+    # Постусловие: пары (значение, приоритет) добавлены в очередь, иначе
+    # не добавлена ни одна; статус ENQUEUE_*. Большой пакет добавляется
+    # перестройкой кучи за O(n + k), малый - просеиванием каждого
+    def enqueue_many(self, pairs: Iterable[Tuple[T, Any]]) -> None:
+        pairs = list(pairs)
+        values = {value for value, _ in pairs}
+        if len(values) != len(pairs) or not values.isdisjoint(self._index):
+            self._enqueue_status = self.ENQUEUE_ERR_DUPLICATE
+            return
+        start = len(self._heap)
+        self._load(pairs)
+        if len(pairs) > start:
+            self._heapify()
+        else:
+            for position in range(start, len(self._heap)):
+                self._sift_up(position)
+        self._enqueue_status = self.ENQUEUE_OK
+
+    def dequeue_many(self, n: int) -> List[T]:
+        if n < 0 or n > len(self._heap):
+            self._dequeue_many_status = self.DEQUEUE_MANY_ERR_COUNT
+            raise IndexError("Not enough elements in queue")
+        values = [self._pop() for _ in range(n)]
+        self._dequeue_many_status = self.DEQUEUE_MANY_OK
+        return values
+
+    # Предусловие: value в очереди, priority не менее срочный, чем текущий
+    # Постусловие: приоритет value стал равен priority
+    def decrease_key(self, value: T, priority: Any) -> None:
+        position = self._index.get(value)
+        if position is None:
+            self._decrease_key_status = self.DECREASE_KEY_NOT_FOUND
+            return
+        if self._heap[position][0] < priority:
+            self._decrease_key_status = self.DECREASE_KEY_ERR_PRIORITY
+            return
+        self._heap[position][0] = priority
+        self._sift_up(position)
+        self._decrease_key_status = self.DECREASE_KEY_OK
+
+    # Запросы
+    # Предусловие: очередь не пуста
+    def first(self) -> T:  # Возвращает самый срочный элемент
+        if not self._heap:
+            self._first_status = self.FIRST_EMPTY
+            raise IndexError("Queue is empty")
+        self._first_status = self.FIRST_OK
+        return self._heap[0][2]
+
+    def size(self) -> int:
+        return len(self._heap)
+
+    def contains(self, value: T) -> bool:  # Есть ли value в очереди
+        return value in self._index
+
+    # Предусловие: value в очереди
+    def get_priority(self, value: T) -> Any:  # Возвращает приоритет value
+        return self._heap[self._index[value]][0]
+
+    # Запросы статусов
+    def get_dequeue_status(self) -> int:
+        return self._dequeue_status
+
+    def get_first_status(self) -> int:
+        return self._first_status
+
+    def get_dequeue_many_status(self) -> int:
+        return self._dequeue_many_status
+
+    # Возвращает значение ENQUEUE_*
+    def get_enqueue_status(self) -> int:
+        return self._enqueue_status
+
+    # Возвращает значение DECREASE_KEY_*
+    def get_decrease_key_status(self) -> int:
+        return self._decrease_key_status
+
+    # Вспомогательный код
+    # Дописывает пары в конец массива без восстановления кучи
+    def _load(self, pairs: Iterable[Tuple[T, Any]]) -> None:
+        for value, priority in pairs:
+            self._index[value] = len(self._heap)
+            self._heap.append([priority, self._counter, value])
+            self._counter += 1
+
+    # Восстанавливает кучу просеиванием вниз от последнего родителя: O(n)
+    def _heapify(self) -> None:
+        for position in range(len(self._heap) // 2 - 1, -1, -1):
+            self._sift_down(position)
+
+    # Предусловие: куча не пуста
+    # Удаляет корень кучи и возвращает его значение
+    def _pop(self) -> T:
+        last = self._heap.pop()
+        if not self._heap:
+            del self._index[last[2]]
+            return last[2]
+        root = self._heap[0]
+        del self._index[root[2]]
+        self._heap[0] = last
+        self._index[last[2]] = 0
+        self._sift_down(0)
+        return root[2]
+
+    # Элементы кучи сравниваются как списки: номера различны, поэтому
+    # до сравнения значений дело не доходит
+    def _sift_up(self, position: int) -> None:
+        heap = self._heap
+        entry = heap[position]
+        while position > 0:
+            parent = (position - 1) >> 1
+            if heap[parent] <= entry:
+                break
+            heap[position] = heap[parent]
+            self._index[heap[position][2]] = position
+            position = parent
+        heap[position] = entry
+        self._index[entry[2]] = position
+
+    def _sift_down(self, position: int) -> None:
+        heap = self._heap
+        size = len(heap)
+        entry = heap[position]
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[position] = heap[child]
+            self._index[heap[position][2]] = position
+            position = child
+        heap[position] = entry
+        self._index[entry[2]] = position
+
+
+# Очередь на диске, переживающая перезапуск процесса. Записи дописываются
+# в файлы-сегменты каталога directory (<номер>.seg); когда сегмент
+# достигает segment_size, начинается следующий. Запись: длина, crc32 и
+# признак pickle, затем данные; bytes хранятся как есть. Голова читается
+# через mmap сегмента, ее позиция (сегмент, смещение) сохраняется в файле
+# head после каждого удаления; полностью прочитанные сегменты удаляются.
+# При открытии очередь продолжается с сохраненной головы, а оборванная
+# при сбое последняя запись отрезается.
+# Политика fsync для данных:
+#   FSYNC_ALWAYS - после каждой команды добавления, файл head тоже;
+#   FSYNC_BATCH - после каждого enqueue_many(), sync() и close();
+#   FSYNC_INTERVAL - при добавлении, если с прошлого fsync прошло не
+#   меньше fsync_interval секунд, и при sync() и close()
+class DiskQueue(QueueATD, Generic[T]):
+
+    FSYNC_ALWAYS: Final[int] = 0  # fsync после каждого добавления
+    FSYNC_BATCH: Final[int] = 1  # fsync после пакета
+    FSYNC_INTERVAL: Final[int] = 2  # fsync не чаще раза в интервал
+
+    _RECORD: Final[struct.Struct] = struct.Struct("<II?")
+    _CHECKPOINT: Final[struct.Struct] = struct.Struct("<QQ")
+    _SEGMENT_SUFFIX: Final[str] = ".seg"
+    _CHECKPOINT_NAME: Final[str] = "head"
+
+    # Предусловие: segment_size > 0
+    # Постусловие: открыта очередь из каталога directory, если он
+    # содержит очередь, иначе в нем создана пустая очередь
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 64 * 2**20,
+        fsync: int = FSYNC_BATCH,
+        fsync_interval: float = 1.0,
+    ) -> None:
+        if segment_size <= 0:
+            raise ValueError("segment_size must be positive")
+        policies = (self.FSYNC_ALWAYS, self.FSYNC_BATCH, self.FSYNC_INTERVAL)
+        if fsync not in policies:
+            raise ValueError("unknown fsync policy")
+        os.makedirs(directory, exist_ok=True)
+        self._directory: str = directory
+        self._segment_size: int = segment_size
+        self._fsync: int = fsync
+        self._fsync_interval: float = fsync_interval
+        self._last_sync: float = time.monotonic()
+        self._map: Optional[mmap.mmap] = None
+        self._map_segment: int = -1
+        self._dequeue_status: int = self.DEQUEUE_NIL
+        self._first_status: int = self.FIRST_NIL
+        self._dequeue_many_status: int = self.DEQUEUE_MANY_NIL
+        self._checkpoint_fd: int = os.open(
+            os.path.join(directory, self._CHECKPOINT_NAME),
+            os.O_RDWR | os.O_CREAT,
+        )
+        self._recover()
+
+    # Команды
+    def enqueue(self, value: T) -> None:
+        self._append([self._encode(value)])
+        if self._fsync == self.FSYNC_ALWAYS:
+            self._sync_data()
+        elif self._fsync == self.FSYNC_INTERVAL:
+            self._sync_if_due()
+
+    def dequeue(self) -> None:
+        if self._size == 0:
+            self._dequeue_status = self.DEQUEUE_EMPTY
+            raise IndexError("Queue is empty")
+        length, _, _ = self._RECORD.unpack(
+            self._read(self._head_offset, self._RECORD.size)
+        )
+        self._advance(self._RECORD.size + length, 1)
+        self._dequeue_status = self.DEQUEUE_OK
+
+    # Постусловие: values дописаны одной записью в файл на сегмент
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        records = [self._encode(value) for value in values]
+        self._append(records)
+        if self._fsync == self.FSYNC_INTERVAL:
+            self._sync_if_due()
+        else:
+            self._sync_data()
+
+    def dequeue_many(self, n: int) -> List[T]:
+        if n < 0 or n > self._size:
+            self._dequeue_many_status = self.DEQUEUE_MANY_ERR_COUNT
+            raise IndexError("Not enough elements in queue")
+        values: List[T] = []
+        while len(values) < n:
+            # Записи одного сегмента читаются без смены отображения
+            offset = self._head_offset
+            taken = 0
+            end = self._segment_end(self._head_segment)
+            while len(values) < n and offset < end:
+                value, size = self._decode_at(offset)
+                values.append(value)
+                offset += size
+                taken += 1
+            self._advance(offset - self._head_offset, taken)
+        self._dequeue_many_status = self.DEQUEUE_MANY_OK
+        return values
+
+    # Постусловие: добавленные записи и позиция головы записаны на диск
+    def sync(self) -> None:
+        self._sync_data()
+        os.fsync(self._checkpoint_fd)
+
+    # Постусловие: очередь записана на диск и закрыта, дальнейшие
+    # операции с ней недопустимы
+    def close(self) -> None:
+        if self._write_fd < 0:
+            return
+        self.sync()
+        self._unmap()
+        os.close(self._write_fd)
+        os.close(self._checkpoint_fd)
+        self._write_fd = -1
+
+    def __enter__(self) -> "DiskQueue[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Запросы
+    def first(self) -> T:
+        if self._size == 0:
+            self._first_status = self.FIRST_EMPTY
+            raise IndexError("Queue is empty")
+        self._first_status = self.FIRST_OK
+        return self._decode_at(self._head_offset)[0]
+
+    def size(self) -> int:
+        return self._size
+
+    # Возвращает число файлов-сегментов очереди
+    def get_segment_count(self) -> int:
+        return self._tail_segment - self._head_segment + 1
+
+    # Запросы статусов
+    def get_dequeue_status(self) -> int:
+        return self._dequeue_status
+
+    def get_first_status(self) -> int:
+        return self._first_status
+
+    def get_dequeue_many_status(self) -> int:
+        return self._dequeue_many_status
+
+    # Вспомогательный код
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(
+            self._directory, f"{number:020d}{self._SEGMENT_SUFFIX}"
+        )
+
+    # Восстанавливает голову из файла head, удаляет прочитанные сегменты,
+    # считает записи и отрезает оборванную запись в конце
+    def _recover(self) -> None:
+        segments = sorted(
+            int(name[: -len(self._SEGMENT_SUFFIX)])
+            for name in os.listdir(self._directory)
+            if name.endswith(self._SEGMENT_SUFFIX)
+        )
+        checkpoint = os.pread(self._checkpoint_fd, self._CHECKPOINT.size, 0)
+        head_segment, head_offset = 0, 0
+        if len(checkpoint) == self._CHECKPOINT.size:
+            head_segment, head_offset = self._CHECKPOINT.unpack(checkpoint)
+        for number in segments:
+            if number < head_segment:
+                os.unlink(self._segment_path(number))
+        segments = [number for number in segments if number >= head_segment]
+        if not segments:
+            segments = [head_segment]
+        elif segments[0] != head_segment:
+            # Сегмент головы прочитан и удален, но файл head не обновлен
+            head_segment, head_offset = segments[0], 0
+        self._tail_segment: int = segments[-1]
+        self._sealed: Tuple[int, int] = (-1, 0)
+        self._size: int = 0
+        for number in segments:
+            start = head_offset if number == head_segment else 0
+            count, end = self._scan(number, start, number == segments[-1])
+            if number == head_segment and head_offset > end:
+                # Голова сохраняется при каждом удалении, а добавления
+                # без fsync могли не дойти до диска: голова переносится
+                # на конец уцелевших записей и сразу записывается, чтобы
+                # новые записи не оказались перед ней
+                head_offset = end
+                os.pwrite(
+                    self._checkpoint_fd,
+                    self._CHECKPOINT.pack(head_segment, head_offset),
+                    0,
+                )
+                os.fsync(self._checkpoint_fd)
+            self._size += count
+        self._head_segment: int = head_segment
+        self._head_offset: int = head_offset
+        self._write_fd: int = os.open(
+            self._segment_path(self._tail_segment),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+        )
+        self._write_offset: int = os.fstat(self._write_fd).st_size
+        self._skip_finished()
+
+    # Возвращает число целых записей сегмента number начиная со start
+    # и конец последней целой записи. Оборванная запись в конце последнего
+    # сегмента отрезается, в другом месте - ошибка. Если start за концом
+    # сегмента, сегмент проверяется с начала, а записей после start нет
+    def _scan(self, number: int, start: int, last: bool) -> Tuple[int, int]:
+        path = self._segment_path(number)
+        if not os.path.exists(path):
+            return 0, 0
+        with open(path, "rb") as segment:
+            data = segment.read()
+        count = 0
+        offset = start if start <= len(data) else 0
+        while offset < len(data):
+            header = data[offset : offset + self._RECORD.size]
+            if len(header) == self._RECORD.size:
+                length, checksum, _ = self._RECORD.unpack(header)
+                payload_start = offset + self._RECORD.size
+                payload = data[payload_start : payload_start + length]
+                if len(payload) == length and zlib.crc32(payload) == checksum:
+                    count += 1
+                    offset = payload_start + length
+                    continue
+            if not last:
+                raise ValueError(f"{path} is corrupted at offset {offset}")
+            os.truncate(path, offset)
+            break
+        if start > len(data):
+            return 0, offset
+        return count, offset
+
+    def _encode(self, value: T) -> bytes:
+        if type(value) is bytes:
+            data, pickled = value, False
+        else:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            pickled = True
+        return self._RECORD.pack(len(data), zlib.crc32(data), pickled) + data
+
+    # Возвращает значение записи головного сегмента по смещению offset
+    # и полный размер записи
+    def _decode_at(self, offset: int) -> Tuple[T, int]:
+        length, _, pickled = self._RECORD.unpack(
+            self._read(offset, self._RECORD.size)
+        )
+        data = self._read(offset + self._RECORD.size, length)
+        value = pickle.loads(data) if pickled else data
+        return value, self._RECORD.size + length
+
+    # Дописывает записи, переходя к новому сегменту при переполнении.
+    # Непустой сегмент не превышает segment_size, кроме сегмента
+    # из одной большой записи
+    def _append(self, records: List[bytes]) -> None:
+        chunk: List[bytes] = []
+        chunk_size = 0
+        for record in records:
+            offset = self._write_offset + chunk_size
+            if offset > 0 and offset + len(record) > self._segment_size:
+                self._write(chunk, chunk_size)
+                chunk, chunk_size = [], 0
+                self._rotate()
+            chunk.append(record)
+            chunk_size += len(record)
+        self._write(chunk, chunk_size)
+        self._size += len(records)
+
+    def _write(self, chunk: List[bytes], size: int) -> None:
+        if chunk:
+            os.write(self._write_fd, b"".join(chunk))
+            self._write_offset += size
+
+    def _rotate(self) -> None:
+        os.fsync(self._write_fd)
+        os.close(self._write_fd)
+        self._tail_segment += 1
+        self._write_fd = os.open(
+            self._segment_path(self._tail_segment),
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+        )
+        self._write_offset = 0
+        self._skip_finished()
+
+    def _sync_data(self) -> None:
+        os.fsync(self._write_fd)
+        self._last_sync = time.monotonic()
+
+    def _sync_if_due(self) -> None:
+        if time.monotonic() - self._last_sync >= self._fsync_interval:
+            self._sync_data()
+
+    # Сдвигает голову на size байт и count записей и сохраняет ее
+    def _advance(self, size: int, count: int) -> None:
+        self._head_offset += size
+        self._size -= count
+        self._skip_finished()
+        os.pwrite(
+            self._checkpoint_fd,
+            self._CHECKPOINT.pack(self._head_segment, self._head_offset),
+            0,
+        )
+        if self._fsync == self.FSYNC_ALWAYS:
+            os.fsync(self._checkpoint_fd)
+
+    # Переводит голову из прочитанных до конца сегментов в следующие,
+    # прочитанные сегменты удаляются
+    def _skip_finished(self) -> None:
+        while (
+            self._head_segment < self._tail_segment
+            and self._head_offset >= self._segment_end(self._head_segment)
+        ):
+            if self._map_segment == self._head_segment:
+                self._unmap()
+            os.unlink(self._segment_path(self._head_segment))
+            self._head_segment += 1
+            self._head_offset = 0
+
+    # Возвращает длину сегмента; закрытые сегменты больше не меняются,
+    # поэтому длина последнего запрошенного запоминается
+    def _segment_end(self, number: int) -> int:
+        if number == self._tail_segment:
+            return self._write_offset
+        if self._sealed[0] != number:
+            path = self._segment_path(number)
+            self._sealed = (number, os.path.getsize(path))
+        return self._sealed[1]
+
+    # Возвращает size байт головного сегмента по смещению offset.
+    # Отображение обновляется, если сегмент дописан после отображения
+    def _read(self, offset: int, size: int) -> bytes:
+        if (
+            self._map is None
+            or self._map_segment != self._head_segment
+            or offset + size > len(self._map)
+        ):
+            self._unmap()
+            with open(self._segment_path(self._head_segment), "rb") as file:
+                self._map = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            self._map_segment = self._head_segment
+        return self._map[offset : offset + size]
+
+    def _unmap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            self._map_segment = -1
+
+
+# Очередь для многих потребителей asyncio. Синхронные команды и запросы
+# те же, что у Queue; ждущие потребители вызывают wait_dequeue(),
+# wait_first() или dequeue_batch(). Новый элемент передается напрямую
+# первому из ждущих wait_dequeue() (по порядку ожидания) и будит только
+# его; в очередь элемент попадает, лишь когда ждущих потребителей нет,
+# и тогда будятся ждущие wait_first(). Поэтому непустая очередь не имеет
+# ждущих потребителей. Отмена ожидания не теряет элементов: уже
+# переданный отмененному потребителю элемент возвращается в голову.
+class AsyncQueue(QueueATD, Generic[T]):
+
+    def __init__(self) -> None:
+        self._items: collections.deque = collections.deque()
+        self._consumers: collections.deque = collections.deque()
+        self._peekers: List[asyncio.Future] = []
+        self._dequeue_status: int = self.DEQUEUE_NIL
+        self._first_status: int = self.FIRST_NIL
+        self._dequeue_many_status: int = self.DEQUEUE_MANY_NIL
+
+    # Команды
+    def enqueue(self, value: T) -> None:
+        if not self._hand_off(value):
+            self._items.append(value)
+            self._wake_peekers()
+
+    def dequeue(self) -> None:
+        if not self._items:
+            self._dequeue_status = self.DEQUEUE_EMPTY
+            raise IndexError("Queue is empty")
+        self._items.popleft()
+        self._dequeue_status = self.DEQUEUE_OK
+
+    def enqueue_many(self, values: Iterable[T]) -> None:
+        iterator = iter(values)
+        for value in iterator:
+            if not self._hand_off(value):
+                self._items.append(value)
+                self._items.extend(iterator)
+                self._wake_peekers()
+
+    def dequeue_many(self, n: int) -> List[T]:
+        if n < 0 or n > len(self._items):
+            self._dequeue_many_status = self.DEQUEUE_MANY_ERR_COUNT
+            raise IndexError("Not enough elements in queue")
+        self._dequeue_many_status = self.DEQUEUE_MANY_OK
+        return [self._items.popleft() for _ in range(n)]
+
+    # Постусловие: из очереди удален первый элемент, если очередь пуста -
+    # первый элемент, переданный этому потребителю
+    # Возвращает удаленный элемент
+    async def wait_dequeue(self) -> T:
+        if self._items:
+            self._dequeue_status = self.DEQUEUE_OK
+            return self._items.popleft()
+        waiter = asyncio.get_running_loop().create_future()
+        self._consumers.append(waiter)
+        try:
+            value = await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._return_front([waiter.result()])
+            elif waiter in self._consumers:
+                self._consumers.remove(waiter)
+            raise
+        self._dequeue_status = self.DEQUEUE_OK
+        return value
+
+    # Предусловие: max_n > 0, max_wait >= 0
+    # Постусловие: из очереди удалено от 1 до max_n первых элементов.
+    # Пакет набирается из имеющихся элементов; если их меньше max_n,
+    # после первого элемента еще не дольше max_wait секунд ждутся
+    # следующие
+    # Возвращает удаленные элементы в порядке очереди
+    async def dequeue_batch(self, max_n: int, max_wait: float = 0) -> List[T]:
+        if max_n <= 0:
+            raise ValueError("max_n must be positive")
+        batch: List[T] = []
+        try:
+            if not self._items:
+                batch.append(await self.wait_dequeue())
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + max_wait
+            while True:
+                while self._items and len(batch) < max_n:
+                    batch.append(self._items.popleft())
+                remaining = deadline - loop.time()
+                if len(batch) == max_n or remaining <= 0:
+                    break
+                # asyncio.wait_for() в 3.11 может поглотить отмену, если
+                # элемент пришел одновременно с ней, поэтому ожидание
+                # с тайм-аутом построено на asyncio.wait()
+                waiter = loop.create_future()
+                self._consumers.append(waiter)
+                try:
+                    await asyncio.wait((waiter,), timeout=remaining)
+                except asyncio.CancelledError:
+                    if waiter.done():
+                        batch.append(waiter.result())
+                    else:
+                        self._consumers.remove(waiter)
+                    raise
+                if not waiter.done():
+                    self._consumers.remove(waiter)
+                    break
+                batch.append(waiter.result())
+        except asyncio.CancelledError:
+            self._return_front(batch)
+            raise
+        self._dequeue_many_status = self.DEQUEUE_MANY_OK
+        return batch
+
+    # Запросы
+    def first(self) -> T:
+        if not self._items:
+            self._first_status = self.FIRST_EMPTY
+            raise IndexError("Queue is empty")
+        self._first_status = self.FIRST_OK
+        return self._items[0]
+
+    # Возвращает первый элемент, если очередь пуста - дождавшись его.
+    # Элемент, переданный ждущему wait_dequeue(), в очередь не попадает
+    # и не будит wait_first()
+    async def wait_first(self) -> T:
+        while not self._items:
+            waiter = asyncio.get_running_loop().create_future()
+            self._peekers.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if not waiter.done():
+                    self._peekers.remove(waiter)
+                raise
+        self._first_status = self.FIRST_OK
+        return self._items[0]
+
+    def size(self) -> int:
+        return len(self._items)
+
+    # Возвращает число потребителей, ждущих в wait_dequeue()
+    def get_waiting_count(self) -> int:
+        return sum(not waiter.done() for waiter in self._consumers)
+
+    # Запросы статусов
+    def get_dequeue_status(self) -> int:
+        return self._dequeue_status
+
+    def get_first_status(self) -> int:
+        return self._first_status
+
+    def get_dequeue_many_status(self) -> int:
+        return self._dequeue_many_status
+
+    # Вспомогательный код
+    # Передает value первому еще ждущему потребителю, False - ждущих нет
+    def _hand_off(self, value: T) -> bool:
+        while self._consumers:
+            waiter = self._consumers.popleft()
+            if not waiter.done():
+                waiter.set_result(value)
+                return True
+        return False
+
+    # Возвращает values отмененного потребителя: сначала ждущим, затем
+    # в голову очереди в прежнем порядке
+    def _return_front(self, values: List[T]) -> None:
+        index = 0
+        while index < len(values) and self._hand_off(values[index]):
+            index += 1
+        if index < len(values):
+            self._items.extendleft(reversed(values[index:]))
+            self._wake_peekers()
+
+    def _wake_peekers(self) -> None:
+        peekers, self._peekers = self._peekers, []
+        for waiter in peekers:
+            if not waiter.done():
+                waiter.set_result(None)
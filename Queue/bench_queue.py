@@ -0,0 +1,385 @@
+"""Замеры производительности Queue.
+
+Запуск: python bench_queue.py [имя_замера [число] ...]
+Без аргументов выполняются все замеры. Число после имени передается
+замеру как параметр, например: python bench_queue.py soak 100000000
+"""
+
+import asyncio
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Callable, Dict
+
+from Queue import (
+    AsyncQueue,
+    DiskQueue,
+    PriorityQueue,
+    Queue,
+    SharedMemoryQueue,
+)
+
+
+def _timeit(func: Callable[[], None], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Текущий RSS процесса в МБ; без /proc - пиковый RSS
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def bench_soak(pairs: int = 2_000_000) -> None:
+    print(f"Длительная работа: {pairs} пар enqueue/dequeue при глубине 1000")
+    print(
+        f"{'pairs':>12} {'RSS MB':>8} {'slots':>8} {'compactions':>12}"
+        f" {'ns/pair':>8}"
+    )
+    queue = Queue()
+    for i in range(1_000):
+        queue.enqueue(i)
+    checkpoints = 10
+    step = max(1, pairs // checkpoints)
+    done = 0
+    while done < pairs:
+        count = min(step, pairs - done)
+        start = time.perf_counter()
+        for i in range(count):
+            queue.enqueue(i)
+            queue.dequeue()
+        elapsed = time.perf_counter() - start
+        done += count
+        stats = queue.memory_stats()
+        print(
+            f"{done:>12} {_rss_mb():>8.1f} {stats.slots:>8}"
+            f" {stats.compactions:>12} {elapsed / count * 1e9:>8.0f}"
+        )
+
+
+def bench_batch() -> None:
+    print(
+        "Пакеты: поэлементный цикл против enqueue_many/dequeue_many,"
+        " нс на элемент"
+    )
+    print(
+        f"{'batch':>8} {'enqueue x n':>12} {'enqueue_many':>13}"
+        f" {'dequeue x n':>12} {'dequeue_many':>13}"
+    )
+    total = 500_000
+    for batch in (500, 1_000, 5_000):
+        rounds = total // batch
+        values = list(range(batch))
+        queue = Queue()
+
+        def enqueue_single() -> None:
+            for _ in range(rounds):
+                for value in values:
+                    queue.enqueue(value)
+
+        def dequeue_single() -> None:
+            for _ in range(rounds):
+                for _ in range(batch):
+                    queue.first()
+                    queue.dequeue()
+
+        def enqueue_many() -> None:
+            for _ in range(rounds):
+                queue.enqueue_many(values)
+
+        def dequeue_many() -> None:
+            for _ in range(rounds):
+                queue.dequeue_many(batch)
+
+        row = [f"{batch:>8}"]
+        # Два прохода добавления наполняют очередь для двух проходов удаления
+        enqueue_time = _timeit(enqueue_single, repeat=1)
+        enqueue_many_time = _timeit(enqueue_many, repeat=1)
+        dequeue_time = _timeit(dequeue_single, repeat=1)
+        dequeue_many_time = _timeit(dequeue_many, repeat=1)
+        for elapsed, width in (
+            (enqueue_time, 12),
+            (enqueue_many_time, 13),
+            (dequeue_time, 12),
+            (dequeue_many_time, 13),
+        ):
+            row.append(f"{elapsed / total * 1e9:>{width}.1f}")
+        print(" ".join(row))
+
+
+def _mp_produce(queue, items: int, payload) -> None:
+    for _ in range(items):
+        queue.put(payload)
+
+
+def _shm_produce(queue, items: int, payload) -> None:
+    sent = 0
+    while sent < items:
+        queue.enqueue(payload)
+        if queue.get_enqueue_status() == SharedMemoryQueue.ENQUEUE_OK:
+            sent += 1
+        else:
+            os.sched_yield()
+    queue.close()
+
+
+def bench_processes() -> None:
+    print(
+        "Передача между процессами: производитель -> потребитель,"
+        " тыс. элементов/с"
+    )
+    print(f"{'payload':>14} {'mp.Queue':>10} {'SharedMemoryQueue':>18}")
+    items = 100_000
+    context = multiprocessing.get_context("fork")
+    for name, payload in (
+        ("bytes 64", b"x" * 64),
+        ("tuple", (1, "task", 2.5)),
+    ):
+        queue = context.Queue()
+        producer = context.Process(
+            target=_mp_produce, args=(queue, items, payload)
+        )
+        start = time.perf_counter()
+        producer.start()
+        for _ in range(items):
+            queue.get()
+        mp_time = time.perf_counter() - start
+        producer.join()
+
+        shared = SharedMemoryQueue(capacity=4096, slot_size=128)
+        producer = context.Process(
+            target=_shm_produce, args=(shared, items, payload)
+        )
+        start = time.perf_counter()
+        producer.start()
+        received = 0
+        while received < items:
+            # Потребитель забирает все накопленное одним пакетом
+            count = shared.size()
+            if count:
+                shared.dequeue_many(count)
+                received += count
+            else:
+                os.sched_yield()
+        shm_time = time.perf_counter() - start
+        producer.join()
+        shared.close()
+        shared.unlink()
+        print(
+            f"{name:>14} {items / mp_time / 1e3:>10.0f}"
+            f" {items / shm_time / 1e3:>18.0f}"
+        )
+
+
+def bench_priority() -> None:
+    print("Планировщик: поток задач со срочностью, мс")
+    print(
+        f"{'tasks':>8} {'list+sort':>10} {'PriorityQueue':>14}"
+        f" {'enqueue x n':>12} {'from_pairs':>11}"
+    )
+    for tasks in (1_000, 10_000, 100_000):
+        priorities = [i * 7919 % 1000 for i in range(tasks)]
+        pairs = list(zip(range(tasks), priorities))
+
+        # Прежняя схема: список пересортировывается при каждой новой
+        # задаче, самая срочная снимается с начала
+        def resort() -> None:
+            pending = []
+            for i in range(tasks):
+                pending.append((priorities[i], i))
+                pending.sort()
+                if i % 2:
+                    pending.pop(0)
+
+        def heap() -> None:
+            queue = PriorityQueue()
+            for i in range(tasks):
+                queue.enqueue(i, priorities[i])
+                if i % 2:
+                    queue.dequeue()
+
+        def one_by_one() -> None:
+            queue = PriorityQueue()
+            for value, priority in pairs:
+                queue.enqueue(value, priority)
+
+        def bulk() -> None:
+            PriorityQueue.from_pairs(pairs)
+
+        # На 100000 задачах пересортировка идет минуты
+        resort_time = (
+            f"{_timeit(resort, repeat=1) * 1e3:>10.1f}"
+            if tasks <= 10_000
+            else f"{'-':>10}"
+        )
+        print(
+            f"{tasks:>8} {resort_time}"
+            f" {_timeit(heap) * 1e3:>14.1f}"
+            f" {_timeit(one_by_one) * 1e3:>12.1f}"
+            f" {_timeit(bulk) * 1e3:>11.1f}"
+        )
+
+
+def bench_disk(items: int = 20_000) -> None:
+    print(f"DiskQueue: {items} записей по 100 байт, тыс. записей/с")
+    print(
+        f"{'fsync':>10} {'enqueue':>10} {'enqueue_many':>13}"
+        f" {'dequeue':>10} {'dequeue_many':>13}"
+    )
+    payload = b"x" * 100
+    batch = 1_000
+    policies = (
+        ("always", DiskQueue.FSYNC_ALWAYS),
+        ("batch", DiskQueue.FSYNC_BATCH),
+        ("interval", DiskQueue.FSYNC_INTERVAL),
+    )
+    for name, policy in policies:
+        with tempfile.TemporaryDirectory() as directory, DiskQueue(
+            directory, segment_size=4 * 2**20, fsync=policy
+        ) as queue:
+            # fsync на каждую запись медленный, его хватает меньшего числа
+            single = items // 20 if policy == DiskQueue.FSYNC_ALWAYS else items
+
+            def enqueue() -> None:
+                for _ in range(single):
+                    queue.enqueue(payload)
+
+            def enqueue_many() -> None:
+                for _ in range(items // batch):
+                    queue.enqueue_many([payload] * batch)
+
+            def dequeue() -> None:
+                for _ in range(items):
+                    queue.first()
+                    queue.dequeue()
+
+            def dequeue_many() -> None:
+                for _ in range(items // batch):
+                    queue.dequeue_many(batch)
+
+            enqueue_rate = single / _timeit(enqueue, repeat=1)
+            queue.dequeue_many(single)
+            enqueue_many_rate = items / _timeit(enqueue_many, repeat=1)
+            dequeue_rate = items / _timeit(dequeue, repeat=1)
+            enqueue_many()
+            dequeue_many_rate = items / _timeit(dequeue_many, repeat=1)
+            print(
+                f"{name:>10} {enqueue_rate / 1e3:>10.1f}"
+                f" {enqueue_many_rate / 1e3:>13.1f}"
+                f" {dequeue_rate / 1e3:>10.1f}"
+                f" {dequeue_many_rate / 1e3:>13.1f}"
+            )
+
+
+# Прежняя схема: потребители опрашивают Queue и засыпают на интервал
+async def _poll_consumers(consumers: int, items: int) -> int:
+    queue = Queue()
+    wakeups = 0
+
+    async def consume() -> None:
+        nonlocal wakeups
+        while True:
+            wakeups += 1
+            if queue.size() == 0:
+                await asyncio.sleep(0.001)
+                continue
+            value = queue.first()
+            queue.dequeue()
+            if value is None:
+                return
+
+    tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    for i in range(items):
+        queue.enqueue(i)
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    for _ in range(consumers):
+        queue.enqueue(None)
+    await asyncio.gather(*tasks)
+    return wakeups
+
+
+async def _wait_consumers(queue_cls, consumers: int, items: int) -> int:
+    queue = queue_cls()
+    wakeups = 0
+
+    async def consume() -> None:
+        nonlocal wakeups
+        while True:
+            if isinstance(queue, AsyncQueue):
+                value = await queue.wait_dequeue()
+            else:
+                value = await queue.get()
+            wakeups += 1
+            if value is None:
+                return
+
+    tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    put = queue.enqueue if isinstance(queue, AsyncQueue) else queue.put_nowait
+    for i in range(items):
+        put(i)
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    for _ in range(consumers):
+        put(None)
+    await asyncio.gather(*tasks)
+    return wakeups
+
+
+def bench_async(items: int = 100_000) -> None:
+    print(
+        f"Потребители asyncio: {items} элементов,"
+        " тыс. элементов/с / пробуждений на элемент"
+    )
+    print(
+        f"{'consumers':>10} {'polling':>16} {'asyncio.Queue':>16}"
+        f" {'AsyncQueue':>16}"
+    )
+    for consumers in (1, 10, 100, 1_000):
+        row = [f"{consumers:>10}"]
+        for make in (
+            lambda: _poll_consumers(consumers, items),
+            lambda: _wait_consumers(asyncio.Queue, consumers, items),
+            lambda: _wait_consumers(AsyncQueue, consumers, items),
+        ):
+            start = time.perf_counter()
+            wakeups = asyncio.run(make())
+            elapsed = time.perf_counter() - start
+            row.append(
+                f"{items / elapsed / 1e3:>9.0f}" f" / {wakeups / items:<4.2f}"
+            )
+        print(" ".join(row))
+
+
+BENCHMARKS: Dict[str, Callable[..., None]] = {
+    "soak": bench_soak,
+    "batch": bench_batch,
+    "processes": bench_processes,
+    "priority": bench_priority,
+    "disk": bench_disk,
+    "async": bench_async,
+}
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:] or list(BENCHMARKS)
+    for index, name in enumerate(args):
+        if name.isdigit():
+            continue
+        params = []
+        if index + 1 < len(args) and args[index + 1].isdigit():
+            params.append(int(args[index + 1]))
+        BENCHMARKS[name](*params)
+        print()
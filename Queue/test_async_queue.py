@@ -0,0 +1,142 @@
+import asyncio
+import unittest
+
+from Queue import AsyncQueue
+
+
+class TestAsyncQueue(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.q = AsyncQueue()
+
+    async def test_sync_interface(self):
+        self.assertEqual(self.q.get_dequeue_status(), AsyncQueue.DEQUEUE_NIL)
+        with self.assertRaises(IndexError):
+            self.q.first()
+        with self.assertRaises(IndexError):
+            self.q.dequeue()
+        self.assertEqual(self.q.get_first_status(), AsyncQueue.FIRST_EMPTY)
+        self.assertEqual(self.q.get_dequeue_status(), AsyncQueue.DEQUEUE_EMPTY)
+        self.q.enqueue(1)
+        self.q.enqueue_many([2, 3])
+        self.assertEqual(self.q.first(), 1)
+        self.q.dequeue()
+        self.assertEqual(self.q.dequeue_many(2), [2, 3])
+        with self.assertRaises(IndexError):
+            self.q.dequeue_many(1)
+        self.assertEqual(
+            self.q.get_dequeue_many_status(),
+            AsyncQueue.DEQUEUE_MANY_ERR_COUNT,
+        )
+
+    async def test_one_consumer_woken_per_item(self):
+        consumers = [
+            asyncio.create_task(self.q.wait_dequeue()) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        self.assertEqual(self.q.get_waiting_count(), 5)
+
+        self.q.enqueue("a")
+        await asyncio.sleep(0)
+        done = [task for task in consumers if task.done()]
+        # Элемент достается первому ждущему, остальные не просыпаются
+        self.assertEqual(done, consumers[:1])
+        self.assertEqual(done[0].result(), "a")
+        self.assertEqual(self.q.size(), 0)
+
+        self.q.enqueue_many(["b", "c", "d", "e", "f"])
+        results = await asyncio.gather(*consumers[1:])
+        self.assertEqual(results, ["b", "c", "d", "e"])
+        self.assertEqual(self.q.first(), "f")
+        self.assertEqual(self.q.get_dequeue_status(), AsyncQueue.DEQUEUE_OK)
+
+    async def test_cancelled_consumer_returns_item(self):
+        first = asyncio.create_task(self.q.wait_dequeue())
+        second = asyncio.create_task(self.q.wait_dequeue())
+        await asyncio.sleep(0)
+        self.q.enqueue(1)
+        # Элемент передан первому, но тот отменен до пробуждения
+        first.cancel()
+        self.assertEqual(await second, 1)
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+
+        waiter = asyncio.create_task(self.q.wait_dequeue())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(self.q.get_waiting_count(), 0)
+        self.q.enqueue(2)
+        self.assertEqual(self.q.first(), 2)
+
+    async def test_wait_first(self):
+        peekers = [asyncio.create_task(self.q.wait_first()) for _ in range(2)]
+        consumer = asyncio.create_task(self.q.wait_dequeue())
+        await asyncio.sleep(0)
+        self.q.enqueue("taken")
+        self.assertEqual(await consumer, "taken")
+        self.assertFalse(any(peeker.done() for peeker in peekers))
+        self.q.enqueue("kept")
+        self.assertEqual(await asyncio.gather(*peekers), ["kept", "kept"])
+        self.assertEqual(self.q.size(), 1)
+
+    async def test_dequeue_batch(self):
+        self.q.enqueue_many(range(5))
+        self.assertEqual(await self.q.dequeue_batch(3), [0, 1, 2])
+        self.assertEqual(await self.q.dequeue_batch(10), [3, 4])
+        self.assertEqual(
+            self.q.get_dequeue_many_status(), AsyncQueue.DEQUEUE_MANY_OK
+        )
+
+        batch = asyncio.create_task(self.q.dequeue_batch(3, max_wait=1))
+        await asyncio.sleep(0)
+        self.q.enqueue(5)
+        await asyncio.sleep(0.01)
+        self.assertFalse(batch.done())
+        self.q.enqueue_many([6, 7, 8])
+        self.assertEqual(await asyncio.wait_for(batch, 1), [5, 6, 7])
+        self.assertEqual(self.q.first(), 8)
+
+        # По истечении max_wait возвращается неполный пакет
+        self.q.dequeue()
+        batch = asyncio.create_task(self.q.dequeue_batch(3, max_wait=0.02))
+        await asyncio.sleep(0)
+        self.q.enqueue(9)
+        self.assertEqual(await asyncio.wait_for(batch, 1), [9])
+        with self.assertRaises(ValueError):
+            await self.q.dequeue_batch(0)
+
+    async def test_cancelled_batch_returns_items(self):
+        batch = asyncio.create_task(self.q.dequeue_batch(5, max_wait=10))
+        await asyncio.sleep(0)
+        self.q.enqueue_many([1, 2])
+        await asyncio.sleep(0)
+        self.q.enqueue(0)
+        batch.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await batch
+        self.assertEqual(self.q.dequeue_many(self.q.size()), [1, 2, 0])
+
+    async def test_many_consumers(self):
+        received = []
+
+        async def consume():
+            while True:
+                value = await self.q.wait_dequeue()
+                if value is None:
+                    return
+                received.append(value)
+
+        consumers = [asyncio.create_task(consume()) for _ in range(10)]
+        for i in range(1000):
+            self.q.enqueue(i)
+            if i % 7 == 0:
+                await asyncio.sleep(0)
+        self.q.enqueue_many([None] * 10)
+        await asyncio.wait_for(asyncio.gather(*consumers), 5)
+        self.assertEqual(sorted(received), list(range(1000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
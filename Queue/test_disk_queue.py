@@ -0,0 +1,153 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import deque
+
+from Queue import DiskQueue
+
+
+class TestDiskQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "queue")
+        self.q = DiskQueue(self.path, segment_size=256)
+
+    def reopen(self, **kwargs):
+        self.q.close()
+        self.q = DiskQueue(self.path, segment_size=256, **kwargs)
+
+    def test_statuses(self):
+        self.assertEqual(self.q.size(), 0)
+        self.assertEqual(self.q.get_dequeue_status(), DiskQueue.DEQUEUE_NIL)
+        with self.assertRaises(IndexError):
+            self.q.first()
+        with self.assertRaises(IndexError):
+            self.q.dequeue()
+        self.assertEqual(self.q.get_first_status(), DiskQueue.FIRST_EMPTY)
+        self.assertEqual(self.q.get_dequeue_status(), DiskQueue.DEQUEUE_EMPTY)
+
+        self.q.enqueue(b"raw")
+        self.q.enqueue({"task": 2})
+        self.assertEqual(self.q.first(), b"raw")
+        self.assertEqual(self.q.get_first_status(), DiskQueue.FIRST_OK)
+        self.q.dequeue()
+        self.assertEqual(self.q.get_dequeue_status(), DiskQueue.DEQUEUE_OK)
+        self.assertEqual(self.q.first(), {"task": 2})
+        with self.assertRaises(IndexError):
+            self.q.dequeue_many(2)
+        self.assertEqual(
+            self.q.get_dequeue_many_status(), DiskQueue.DEQUEUE_MANY_ERR_COUNT
+        )
+        self.assertEqual(self.q.dequeue_many(1), [{"task": 2}])
+        self.assertEqual(
+            self.q.get_dequeue_many_status(), DiskQueue.DEQUEUE_MANY_OK
+        )
+
+    def test_recovers_after_reopen(self):
+        self.q.enqueue_many(range(100))
+        self.assertEqual(self.q.dequeue_many(30), list(range(30)))
+        self.q.dequeue()
+        self.reopen()
+        self.assertEqual(self.q.size(), 69)
+        self.assertEqual(self.q.first(), 31)
+        self.q.enqueue("after")
+        self.assertEqual(self.q.dequeue_many(70)[-2:], [99, "after"])
+
+    def test_consumed_segments_deleted(self):
+        self.q.enqueue_many(bytes(40) for _ in range(50))
+        segments = self.q.get_segment_count()
+        self.assertGreater(segments, 5)
+        self.q.dequeue_many(25)
+        self.assertLess(self.q.get_segment_count(), segments)
+        self.q.dequeue_many(25)
+        self.assertEqual(self.q.get_segment_count(), 1)
+        files = os.listdir(self.path)
+        self.assertEqual(sum(name.endswith(".seg") for name in files), 1)
+
+    def test_torn_tail_record_dropped(self):
+        self.q.enqueue_many(["a", "b", "c"])
+        self.q.close()
+        segment = max(
+            name for name in os.listdir(self.path) if name.endswith(".seg")
+        )
+        with open(os.path.join(self.path, segment), "ab") as file:
+            file.write(b"\x10\x00\x00\x00garbage")
+        self.q = DiskQueue(self.path, segment_size=256)
+        self.assertEqual(self.q.size(), 3)
+        self.q.enqueue("d")
+        self.reopen()
+        self.assertEqual(self.q.dequeue_many(4), ["a", "b", "c", "d"])
+
+    def test_checkpoint_past_lost_records(self):
+        # Голова сохранена после удаления, а дописанные без fsync записи
+        # потеряны при сбое: сегмент короче сохраненной головы
+        self.q.enqueue_many(["a", "b", "c"])
+        self.q.dequeue_many(3)
+        self.q.close()
+        segment = os.path.join(
+            self.path,
+            max(
+                name for name in os.listdir(self.path) if name.endswith(".seg")
+            ),
+        )
+        with open(segment, "rb") as file:
+            data = file.read()
+        record = len(data) // 3
+        for length in (record, record + 5):
+            with open(segment, "wb") as file:
+                file.write(data[:length])
+            self.q = DiskQueue(self.path, segment_size=256)
+            self.assertEqual(self.q.size(), 0)
+            self.q.enqueue("d")
+            self.assertEqual(self.q.first(), "d")
+            self.reopen()
+            self.assertEqual(self.q.size(), 1)
+            self.assertEqual(self.q.dequeue_many(1), ["d"])
+            self.q.close()
+
+    def test_fsync_policies(self):
+        for policy in (
+            DiskQueue.FSYNC_ALWAYS,
+            DiskQueue.FSYNC_INTERVAL,
+            DiskQueue.FSYNC_BATCH,
+        ):
+            self.reopen(fsync=policy, fsync_interval=0.0)
+            self.q.enqueue(policy)
+            self.q.enqueue_many([policy, policy])
+            self.assertEqual(self.q.dequeue_many(3), [policy] * 3)
+        with self.assertRaises(ValueError):
+            DiskQueue(self.path, fsync=7)
+
+    def test_random_against_deque(self):
+        random.seed(24)
+        expected = deque()
+        for step in range(2000):
+            operation = random.random()
+            if operation < 0.4:
+                value = "x" * random.randrange(300)
+                self.q.enqueue(value)
+                expected.append(value)
+            elif operation < 0.5:
+                values = list(range(step, step + random.randrange(10)))
+                self.q.enqueue_many(values)
+                expected.extend(values)
+            elif operation < 0.8 and expected:
+                self.assertEqual(self.q.first(), expected.popleft())
+                self.q.dequeue()
+            elif operation < 0.95:
+                count = min(len(expected), random.randrange(5))
+                removed = [expected.popleft() for _ in range(count)]
+                self.assertEqual(self.q.dequeue_many(count), removed)
+            else:
+                self.reopen()
+            self.assertEqual(self.q.size(), len(expected))
+
+    def tearDown(self):
+        self.q.close()
+        self.tmp.cleanup()
+
+
+if __name__ == "__main__":
+    unittest.main()
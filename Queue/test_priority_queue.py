@@ -0,0 +1,128 @@
+import heapq
+import random
+import unittest
+
+from Queue import PriorityQueue
+
+
+class TestPriorityQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.q = PriorityQueue()
+
+    def test_statuses(self):
+        self.assertEqual(
+            self.q.get_dequeue_status(), PriorityQueue.DEQUEUE_NIL
+        )
+        self.assertEqual(self.q.get_first_status(), PriorityQueue.FIRST_NIL)
+        with self.assertRaises(IndexError):
+            self.q.first()
+        with self.assertRaises(IndexError):
+            self.q.dequeue()
+        self.assertEqual(
+            self.q.get_dequeue_status(), PriorityQueue.DEQUEUE_EMPTY
+        )
+        self.assertEqual(self.q.get_first_status(), PriorityQueue.FIRST_EMPTY)
+
+        self.q.enqueue("low", 5)
+        self.q.enqueue("urgent", 1)
+        self.assertEqual(self.q.get_enqueue_status(), PriorityQueue.ENQUEUE_OK)
+        self.q.enqueue("urgent", 0)
+        self.assertEqual(
+            self.q.get_enqueue_status(), PriorityQueue.ENQUEUE_ERR_DUPLICATE
+        )
+        self.assertEqual(self.q.size(), 2)
+        self.assertEqual(self.q.first(), "urgent")
+        self.assertEqual(self.q.get_first_status(), PriorityQueue.FIRST_OK)
+        self.q.dequeue()
+        self.assertEqual(self.q.get_dequeue_status(), PriorityQueue.DEQUEUE_OK)
+        self.assertEqual(self.q.first(), "low")
+        self.assertFalse(self.q.contains("urgent"))
+
+    def test_fifo_for_equal_priorities(self):
+        for value in "abcde":
+            self.q.enqueue(value, 1)
+        self.q.enqueue("z", 0)
+        self.assertEqual(self.q.dequeue_many(6), list("zabcde"))
+
+    def test_decrease_key(self):
+        for i in range(10):
+            self.q.enqueue(f"task{i}", 10 + i)
+        self.q.decrease_key("task7", 1)
+        self.assertEqual(
+            self.q.get_decrease_key_status(), PriorityQueue.DECREASE_KEY_OK
+        )
+        self.assertEqual(self.q.first(), "task7")
+        self.assertEqual(self.q.get_priority("task7"), 1)
+
+        self.q.decrease_key("task3", 50)
+        self.assertEqual(
+            self.q.get_decrease_key_status(),
+            PriorityQueue.DECREASE_KEY_ERR_PRIORITY,
+        )
+        self.assertEqual(self.q.get_priority("task3"), 13)
+        self.q.decrease_key("missing", 0)
+        self.assertEqual(
+            self.q.get_decrease_key_status(),
+            PriorityQueue.DECREASE_KEY_NOT_FOUND,
+        )
+
+    def test_from_pairs_and_enqueue_many(self):
+        random.seed(23)
+        pairs = [(i, random.randrange(100)) for i in range(500)]
+        queue = PriorityQueue.from_pairs(pairs)
+        more = [(i, random.randrange(100)) for i in range(500, 520)]
+        queue.enqueue_many(more)
+        self.assertEqual(queue.get_enqueue_status(), PriorityQueue.ENQUEUE_OK)
+        queue.enqueue_many([(600, 0), (0, 0)])
+        self.assertEqual(
+            queue.get_enqueue_status(), PriorityQueue.ENQUEUE_ERR_DUPLICATE
+        )
+        self.assertFalse(queue.contains(600))
+
+        expected = sorted(pairs + more, key=lambda pair: pair[1])
+        self.assertEqual(
+            queue.dequeue_many(520), [value for value, _ in expected]
+        )
+        with self.assertRaises(IndexError):
+            queue.dequeue_many(1)
+        self.assertEqual(
+            queue.get_dequeue_many_status(),
+            PriorityQueue.DEQUEUE_MANY_ERR_COUNT,
+        )
+        with self.assertRaises(ValueError):
+            PriorityQueue.from_pairs([("a", 1), ("a", 2)])
+
+    def test_random_against_heapq(self):
+        random.seed(230)
+        reference = []
+        priorities = {}
+        for step in range(5000):
+            operation = random.random()
+            if operation < 0.5 or not priorities:
+                priority = random.randrange(1000)
+                self.q.enqueue(step, priority)
+                priorities[step] = priority
+                heapq.heappush(reference, (priority, step))
+            elif operation < 0.7:
+                value = random.choice(list(priorities))
+                priority = priorities[value] - random.randrange(50)
+                self.q.decrease_key(value, priority)
+                priorities[value] = priority
+                heapq.heappush(reference, (priority, value))
+            else:
+                # Устаревшие записи эталона пропускаются
+                while priorities.get(reference[0][1]) != reference[0][0]:
+                    heapq.heappop(reference)
+                priority, value = heapq.heappop(reference)
+                self.assertEqual(self.q.first(), value)
+                self.q.dequeue()
+                del priorities[value]
+            self.assertEqual(self.q.size(), len(priorities))
+
+    def tearDown(self):
+        self.q = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,6 @@
+import gc
 import unittest
+import weakref
 
 from Queue import Queue
 
@@ -38,6 +40,71 @@ class QueueTests(unittest.TestCase):
         self.assertEqual(self.q.first(), 7)
         self.assertEqual(self.q.get_first_status(), Queue.FIRST_OK)
 
+    def test_compaction_keeps_memory_flat(self):
+        self.assertEqual(self.q.memory_stats().compactions, 0)
+        for i in range(100):
+            self.q.enqueue(i)
+        peak = 0
+        for i in range(100, 100_000):
+            self.q.enqueue(i)
+            self.q.dequeue()
+            peak = max(peak, self.q.memory_stats().slots)
+        stats = self.q.memory_stats()
+        self.assertEqual(stats.size, 100)
+        self.assertEqual(stats.slots, stats.size + stats.dead)
+        self.assertLessEqual(peak, 2 * (100 + Queue.COMPACT_MIN) + 2)
+        self.assertGreater(stats.compactions, 0)
+        self.assertEqual(self.q.first(), 99_900)
+
+        while self.q.size() > 0:
+            self.q.dequeue()
+        self.assertLessEqual(self.q.memory_stats().slots, Queue.COMPACT_MIN)
+
+    def test_enqueue_many_dequeue_many(self):
+        self.assertEqual(
+            self.q.get_dequeue_many_status(), Queue.DEQUEUE_MANY_NIL
+        )
+        self.q.enqueue(-1)
+        self.q.enqueue_many(range(1000))
+        self.q.enqueue_many(iter([]))
+        self.assertEqual(self.q.size(), 1001)
+        self.assertEqual(self.q.first(), -1)
+
+        self.assertEqual(self.q.dequeue_many(0), [])
+        self.assertEqual(self.q.dequeue_many(11), [-1] + list(range(10)))
+        self.assertEqual(
+            self.q.get_dequeue_many_status(), Queue.DEQUEUE_MANY_OK
+        )
+        self.assertEqual(self.q.first(), 10)
+        # Пакет, после которого префикс отрезается
+        self.assertEqual(self.q.dequeue_many(600), list(range(10, 610)))
+        self.assertEqual(self.q.memory_stats().dead, 0)
+        self.assertEqual(self.q.size(), 390)
+        self.assertEqual(self.q.first(), 610)
+
+        with self.assertRaises(IndexError):
+            self.q.dequeue_many(391)
+        with self.assertRaises(IndexError):
+            self.q.dequeue_many(-1)
+        self.assertEqual(
+            self.q.get_dequeue_many_status(), Queue.DEQUEUE_MANY_ERR_COUNT
+        )
+        self.assertEqual(self.q.dequeue_many(390), list(range(610, 1000)))
+        self.assertEqual(self.q.size(), 0)
+
+    def test_dequeue_releases_reference(self):
+        class Item:
+            pass
+
+        item = Item()
+        ref = weakref.ref(item)
+        self.q.enqueue(item)
+        self.q.enqueue(Item())
+        del item
+        self.q.dequeue()
+        gc.collect()
+        self.assertIsNone(ref())
+
     def tearDown(self):
         self.q = None
 
@@ -0,0 +1,131 @@
+import multiprocessing
+import pickle
+import unittest
+
+from Queue import SharedMemoryQueue
+
+
+def _produce(queue, start, count):
+    for value in range(start, start + count):
+        while True:
+            queue.enqueue(value)
+            if queue.get_enqueue_status() == SharedMemoryQueue.ENQUEUE_OK:
+                break
+    queue.close()
+
+
+class TestSharedMemoryQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.q = SharedMemoryQueue(capacity=4, slot_size=64)
+
+    def test_statuses(self):
+        self.assertEqual(self.q.size(), 0)
+        self.assertEqual(
+            self.q.get_enqueue_status(), SharedMemoryQueue.ENQUEUE_NIL
+        )
+        with self.assertRaises(IndexError):
+            self.q.first()
+        with self.assertRaises(IndexError):
+            self.q.dequeue()
+        self.assertEqual(
+            self.q.get_first_status(), SharedMemoryQueue.FIRST_EMPTY
+        )
+        self.assertEqual(
+            self.q.get_dequeue_status(), SharedMemoryQueue.DEQUEUE_EMPTY
+        )
+
+        self.q.enqueue(b"raw")
+        self.q.enqueue({"task": 1})
+        self.assertEqual(
+            self.q.get_enqueue_status(), SharedMemoryQueue.ENQUEUE_OK
+        )
+        self.assertEqual(self.q.first(), b"raw")
+        self.assertEqual(self.q.get_first_status(), SharedMemoryQueue.FIRST_OK)
+        self.q.dequeue()
+        self.assertEqual(self.q.first(), {"task": 1})
+        self.assertEqual(self.q.size(), 1)
+
+        self.q.enqueue(b"x" * (self.q.get_item_size() + 1))
+        self.assertEqual(
+            self.q.get_enqueue_status(),
+            SharedMemoryQueue.ENQUEUE_ERR_TOO_LARGE,
+        )
+        self.assertEqual(self.q.size(), 1)
+
+    def test_ring_wraparound_and_full(self):
+        for i in range(20):
+            self.q.enqueue(i)
+            self.assertEqual(self.q.first(), i)
+            self.q.dequeue()
+        self.q.enqueue_many(range(4))
+        self.q.enqueue(4)
+        self.assertEqual(
+            self.q.get_enqueue_status(), SharedMemoryQueue.ENQUEUE_ERR_FULL
+        )
+        self.assertEqual(self.q.dequeue_many(2), [0, 1])
+        # Пакет не помещается целиком - не добавляется ничего
+        self.q.enqueue_many([4, 5, 6])
+        self.assertEqual(
+            self.q.get_enqueue_status(), SharedMemoryQueue.ENQUEUE_ERR_FULL
+        )
+        self.q.enqueue_many([4, 5])
+        self.assertEqual(self.q.dequeue_many(4), [2, 3, 4, 5])
+        self.assertEqual(
+            self.q.get_dequeue_many_status(),
+            SharedMemoryQueue.DEQUEUE_MANY_OK,
+        )
+        with self.assertRaises(IndexError):
+            self.q.dequeue_many(1)
+        self.assertEqual(
+            self.q.get_dequeue_many_status(),
+            SharedMemoryQueue.DEQUEUE_MANY_ERR_COUNT,
+        )
+
+    def test_attach(self):
+        other = SharedMemoryQueue.attach(self.q.get_name(), self.q.get_lock())
+        self.q.enqueue("shared")
+        self.assertEqual(other.size(), 1)
+        self.assertEqual(other.first(), "shared")
+        other.dequeue()
+        self.assertEqual(self.q.size(), 0)
+        self.assertEqual(other.get_capacity(), 4)
+        other.close()
+
+    def _run_producers(self, queue, context):
+        producers = [
+            context.Process(target=_produce, args=(queue, i * 100, 100))
+            for i in range(2)
+        ]
+        for process in producers:
+            process.start()
+        received = []
+        while len(received) < 200:
+            if queue.size() > 0:
+                received.append(queue.first())
+                queue.dequeue()
+        for process in producers:
+            process.join(10)
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(sorted(received), list(range(200)))
+
+    def test_forked_processes(self):
+        self._run_producers(self.q, multiprocessing.get_context("fork"))
+
+    def test_spawned_processes(self):
+        context = multiprocessing.get_context("spawn")
+        with SharedMemoryQueue(capacity=8, context=context) as queue:
+            self._run_producers(queue, context)
+            queue.unlink()
+
+    def test_pickle_outside_spawning_fails(self):
+        with self.assertRaises(RuntimeError):
+            pickle.dumps(self.q)
+
+    def tearDown(self):
+        self.q.close()
+        self.q.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()